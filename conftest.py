@@ -5,7 +5,7 @@ import os
 import secrets
 import shutil
 from collections import namedtuple
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from importlib import import_module
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING
@@ -29,7 +29,9 @@ if TYPE_CHECKING:
 # disable failing plugin import
 os.environ["ONETL_PLUGINS_BLACKLIST"] = "failing-plugin"
 
+from onetl.hwm import FileModifiedSinceHWM
 from onetl.hwm.store import MemoryHWMStore
+from onetl.impl import RemoteFile, RemotePathStat
 from tests.lib.common import upload_files
 
 log = logging.getLogger(__name__)
@@ -197,6 +199,24 @@ def sftp_connection(sftp_data):
     return sftp_data[0]
 
 
+@pytest.fixture(
+    scope="function",
+    params=[
+        pytest.param("real", marks=[pytest.mark.local_fs]),
+    ],
+)
+def local_fs_data(tmp_path_factory):
+    from onetl.connection import LocalFS
+
+    local_fs = LocalFS()
+    return local_fs, PurePosixPath(tmp_path_factory.mktemp("local_fs")) / "export/news_parse"
+
+
+@pytest.fixture()
+def local_fs_connection(local_fs_data):
+    return local_fs_data[0]
+
+
 @pytest.fixture(scope="session")
 def webdav_server():
     WebDAVServer = namedtuple("WebDAVServer", ["host", "port", "user", "password", "ssl_verify", "protocol"])
@@ -521,6 +541,7 @@ def use_memory_hwm_store(request):  # noqa: WPS325
         lazy_fixture("ftp_data"),
         lazy_fixture("ftps_data"),
         lazy_fixture("hdfs_data"),
+        lazy_fixture("local_fs_data"),
         lazy_fixture("s3_data"),
         lazy_fixture("sftp_data"),
         lazy_fixture("webdav_data"),
@@ -582,6 +603,14 @@ def upload_test_files(file_all_connections, resource_path, source_path):
             ),
             "third.file",
         ),
+        (
+            FileModifiedSinceHWM(
+                source=RemoteFolder(name=f"/absolute/{secrets.token_hex(5)}", instance="ftp://ftp.server:21"),
+                value=datetime(year=2023, month=8, day=15, hour=11, minute=22, second=33, tzinfo=timezone.utc),
+                boundary_files=["some/path", "another.file"],
+            ),
+            RemoteFile(path="third.file", stats=RemotePathStat(st_mtime=1692098613)),
+        ),
     ],
 )
 def hwm_delta(request):
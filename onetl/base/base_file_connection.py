@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import os
 from abc import abstractmethod
-from typing import Iterable
+from typing import TYPE_CHECKING, BinaryIO, Iterable
 
 from onetl.base.base_connection import BaseConnection
 from onetl.base.base_file_filter import BaseFileFilter
@@ -24,6 +24,9 @@ from onetl.base.base_file_limit import BaseFileLimit
 from onetl.base.path_protocol import PathWithStatsProtocol
 from onetl.base.path_stat_protocol import PathStatProtocol
 
+if TYPE_CHECKING:
+    from onetl.impl import FileChecksum
+
 
 class BaseFileConnection(BaseConnection):
     """
@@ -455,6 +458,7 @@ class BaseFileConnection(BaseConnection):
         remote_file_path: os.PathLike | str,
         local_file_path: os.PathLike | str,
         replace: bool = True,
+        checksum: FileChecksum | None = None,
     ) -> PathWithStatsProtocol:
         """
         Downloads file from the remote filesystem to a local path.
@@ -474,6 +478,10 @@ class BaseFileConnection(BaseConnection):
         replace : bool, default ``False``
             If ``True``, existing file will be replaced
 
+        checksum : :obj:`onetl.impl.FileChecksum`, optional
+            If passed, checksum of file content is calculated while file is being downloaded,
+            and then compared with checksum provided by the remote filesystem (if any).
+
         Returns
         -------
         Local file with stats.
@@ -492,6 +500,9 @@ class BaseFileConnection(BaseConnection):
         :obj:`onetl.exception.FileSizeMismatchError`
             Target file size after download is different from source file size.
 
+        :obj:`onetl.exception.FileChecksumMismatchError`
+            Checksum of downloaded file is different from checksum of source file.
+
         Examples
         --------
 
@@ -511,6 +522,7 @@ class BaseFileConnection(BaseConnection):
         local_file_path: os.PathLike | str,
         remote_file_path: os.PathLike | str,
         replace: bool = False,
+        checksum: FileChecksum | None = None,
     ) -> PathWithStatsProtocol:
         """
         Uploads local file to a remote filesystem.
@@ -530,6 +542,10 @@ class BaseFileConnection(BaseConnection):
         replace : bool, default ``False``
             If ``True``, existing file will be replaced
 
+        checksum : :obj:`onetl.impl.FileChecksum`, optional
+            If passed, checksum of file content is calculated while file is being uploaded,
+            and then compared with checksum provided by the remote filesystem (if any).
+
         Returns
         -------
         Remote file with stats.
@@ -548,6 +564,9 @@ class BaseFileConnection(BaseConnection):
         :obj:`onetl.exception.FileSizeMismatchError`
             Target file size after upload is different from source file size.
 
+        :obj:`onetl.exception.FileChecksumMismatchError`
+            Checksum of uploaded file is different from checksum provided by the remote filesystem.
+
         Examples
         --------
 
@@ -710,6 +729,62 @@ class BaseFileConnection(BaseConnection):
             assert file_path.stat.st_size > 0
         """
 
+    @abstractmethod
+    def open(self, path: os.PathLike | str, mode: str = "rb") -> BinaryIO:
+        """
+        Opens a file at specific path as a binary stream, without loading its content to memory.
+
+        .. warning::
+
+            If file is opened for writing and already exists, its content will be replaced.
+
+        Parameters
+        ----------
+        path : str or :obj:`os.PathLike`
+            File path to open
+
+        mode : str, default ``rb``
+            ``rb`` to read file, ``wb`` to write file
+
+        Returns
+        -------
+        Buffered binary stream.
+
+        Stream opened for reading supports ``read``, ``readinto``, ``seek``, ``tell``
+        and chunked iteration using ``iter_chunks(chunk_size)``.
+
+        Content written to a stream is committed to the file when stream is closed.
+
+        Raises
+        ------
+        ValueError
+            Unsupported mode
+
+        FileNotFoundError
+            Path does not exist (only for reading)
+
+        :obj:`onetl.exception.NotAFileError`
+            Path is not a file
+
+        Examples
+        --------
+
+        .. code:: python
+
+            with connection.open("/path/to/dir/file.csv", mode="rb") as file:
+                for chunk in file.iter_chunks(1024 * 1024):
+                    process(chunk)
+
+            buffer = bytearray(1024)
+            with connection.open("/path/to/dir/file.csv", mode="rb") as file:
+                file.seek(100)
+                read_bytes = file.readinto(buffer)
+
+            with connection.open("/path/to/dir/file.csv", mode="wb") as file:
+                file.write(b"some;header\n")
+                file.write(b"1;2\n")
+        """
+
     @property
     @abstractmethod
     def instance_url(self):
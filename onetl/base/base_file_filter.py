@@ -45,3 +45,23 @@ class BaseFileFilter(ABC):
             assert not filter.match(LocalPath("/path/to/excluded.csv"))
             assert filter.match(LocalPath("/path/to/file.csv"))
         """
+
+    def match_dir_prefix(self, path: PathProtocol) -> bool:
+        """
+        Returns ``False`` if no path nested into the directory can match the filter, ``True`` otherwise.
+
+        Used to skip walking through directory without listing its content.
+        By default, returns ``True``, so all directories are walked through.
+
+        Examples
+        --------
+
+        .. code:: python
+
+            from onetl.impl import RemoteDirectory
+
+            assert filter.match_dir_prefix(RemoteDirectory("/path/to"))
+            assert not filter.match_dir_prefix(RemoteDirectory("/path/to/excluded"))
+        """
+
+        return True
@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from onetl.connection.file_connection.ftp import FTP
     from onetl.connection.file_connection.ftps import FTPS
     from onetl.connection.file_connection.hdfs import HDFS
+    from onetl.connection.file_connection.local_fs import LocalFS
     from onetl.connection.file_connection.s3 import S3
     from onetl.connection.file_connection.sftp import SFTP
     from onetl.connection.file_connection.webdav import WebDAV
@@ -51,6 +52,7 @@ file_connections_modules = {
     "FTP": "ftp",
     "FTPS": "ftps",
     "HDFS": "hdfs",
+    "LocalFS": "local_fs",
     "S3": "s3",
     "SFTP": "sftp",
     "WebDAV": "webdav",
@@ -0,0 +1,241 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
+
+from onetl.base import BaseFileFilter, BaseFileLimit, PathStatProtocol
+from onetl.impl import FileChecksum, LocalPath, RemoteDirectory, RemoteFile
+
+if TYPE_CHECKING:
+    from onetl.connection.file_connection.file_connection import FileConnection
+
+
+class AsyncFileConnection:
+    """
+    Asyncio interface of :obj:`FileConnection <onetl.connection.file_connection.file_connection.FileConnection>`.
+
+    Has the same methods as file connection, but they return awaitables.
+    Each call is executed in a thread pool, so event loop is not blocked, and up to ``workers``
+    calls can be executed concurrently.
+
+    Clients are not always thread-safe, so each worker thread is using its own copy of connection.
+    Stats cache (see ``cache_ttl``) is shared between all the copies.
+
+    .. note::
+
+        Use :obj:`FileConnection.to_async <onetl.connection.file_connection.file_connection.FileConnection.to_async>`
+        to create an instance of this class.
+
+    Examples
+    --------
+
+    .. code:: python
+
+        import asyncio
+
+        from onetl.connection import SFTP
+
+        sftp = SFTP(...)
+
+
+        async def main():
+            async with sftp.to_async(workers=4) as connection:
+                files = await connection.list_dir("/remote/path")
+                await asyncio.gather(
+                    *(connection.download_file(file, f"/local/path/{file.name}") for file in files),
+                )
+
+
+        asyncio.run(main())
+    """
+
+    def __init__(self, connection: FileConnection, workers: int = 4):
+        if workers < 1:
+            raise ValueError(f"Number of workers should be positive, got {workers}")
+
+        self.connection = connection
+        self.workers = workers
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onetl-async")
+        self._thread_local = threading.local()
+        self._connections: list[FileConnection] = []
+        self._lock = threading.Lock()
+
+        connection._get_stat_cache()  # noqa: WPS437  # create cache before copying connection, to share it
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.connection!r}, workers={self.workers})"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Stop worker threads and close all connection copies created by them.
+
+        Original connection is left intact.
+        """
+
+        await self._run_in_executor(None, self._executor.shutdown, wait=True)
+
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+
+        for connection in connections:
+            connection.close()
+
+    async def check(self) -> AsyncFileConnection:
+        await self._call("check")
+        return self
+
+    async def path_exists(self, path: os.PathLike | str) -> bool:
+        return await self._call("path_exists", path)
+
+    async def is_file(self, path: os.PathLike | str) -> bool:
+        return await self._call("is_file", path)
+
+    async def is_dir(self, path: os.PathLike | str) -> bool:
+        return await self._call("is_dir", path)
+
+    async def get_stat(self, path: os.PathLike | str) -> PathStatProtocol:
+        return await self._call("get_stat", path)
+
+    async def resolve_dir(self, path: os.PathLike | str) -> RemoteDirectory:
+        return await self._call("resolve_dir", path)
+
+    async def resolve_file(self, path: os.PathLike | str) -> RemoteFile:
+        return await self._call("resolve_file", path)
+
+    async def create_dir(self, path: os.PathLike | str) -> RemoteDirectory:
+        return await self._call("create_dir", path)
+
+    async def remove_file(self, path: os.PathLike | str) -> bool:
+        return await self._call("remove_file", path)
+
+    async def remove_dir(self, path: os.PathLike | str, recursive: bool = False) -> bool:
+        return await self._call("remove_dir", path, recursive=recursive)
+
+    async def rename_file(
+        self,
+        source_file_path: os.PathLike | str,
+        target_file_path: os.PathLike | str,
+        replace: bool = False,
+    ) -> RemoteFile:
+        return await self._call("rename_file", source_file_path, target_file_path, replace=replace)
+
+    async def list_dir(
+        self,
+        path: os.PathLike | str,
+        filters: Iterable[BaseFileFilter] | None = None,
+        limits: Iterable[BaseFileLimit] | None = None,
+    ) -> list[RemoteDirectory | RemoteFile]:
+        return await self._call("list_dir", path, filters=filters, limits=limits)
+
+    async def walk(
+        self,
+        root: os.PathLike | str,
+        topdown: bool = True,
+        filters: Iterable[BaseFileFilter] | None = None,
+        limits: Iterable[BaseFileLimit] | None = None,
+    ) -> AsyncIterator[tuple[RemoteDirectory, list[RemoteDirectory], list[RemoteFile]]]:
+        """
+        Same as ``FileConnection.walk``, but returns async iterator.
+
+        Walking is performed by a dedicated copy of connection, so it does not interfere with other calls.
+        """
+
+        connection = self.connection._copy_for_thread()  # noqa: WPS437
+        iterator = connection.walk(root, topdown=topdown, filters=filters, limits=limits)
+        pending: asyncio.Future | None = None
+        try:
+            while True:
+                pending = asyncio.ensure_future(self._run_in_executor(self._executor, next, iterator, None))
+                # if task is cancelled, iterator is still running in executor, and cannot be closed until it is done
+                item = await asyncio.shield(pending)
+                if item is None:
+                    return
+
+                yield item
+        finally:
+            if pending and not pending.done():
+                await asyncio.wait([pending])
+
+            # closing could send requests, so it should not block event loop
+            await self._run_in_executor(self._executor, self._close_walk, iterator, connection)
+
+    async def download_file(
+        self,
+        remote_file_path: os.PathLike | str,
+        local_file_path: os.PathLike | str,
+        replace: bool = True,
+        checksum: FileChecksum | None = None,
+    ) -> LocalPath:
+        return await self._call("download_file", remote_file_path, local_file_path, replace=replace, checksum=checksum)
+
+    async def upload_file(
+        self,
+        local_file_path: os.PathLike | str,
+        remote_file_path: os.PathLike | str,
+        replace: bool = False,
+        checksum: FileChecksum | None = None,
+    ) -> RemoteFile:
+        return await self._call("upload_file", local_file_path, remote_file_path, replace=replace, checksum=checksum)
+
+    async def read_text(self, path: os.PathLike | str, encoding: str = "utf-8", **kwargs) -> str:
+        return await self._call("read_text", path, encoding=encoding, **kwargs)
+
+    async def read_bytes(self, path: os.PathLike | str, **kwargs) -> bytes:
+        return await self._call("read_bytes", path, **kwargs)
+
+    async def write_text(self, path: os.PathLike | str, content: str, encoding: str = "utf-8", **kwargs) -> RemoteFile:
+        return await self._call("write_text", path, content, encoding=encoding, **kwargs)
+
+    async def write_bytes(self, path: os.PathLike | str, content: bytes, **kwargs) -> RemoteFile:
+        return await self._call("write_bytes", path, content, **kwargs)
+
+    @staticmethod
+    def _close_walk(iterator: Iterator, connection: FileConnection) -> None:
+        try:
+            iterator.close()
+        finally:
+            connection.close()
+
+    async def _call(self, method: str, *args, **kwargs) -> Any:
+        return await self._run_in_executor(self._executor, self._call_in_thread, method, *args, **kwargs)
+
+    def _call_in_thread(self, method: str, *args, **kwargs) -> Any:
+        connection = getattr(self._thread_local, "connection", None)
+        if connection is None:
+            connection = self._thread_local.connection = self.connection._copy_for_thread()  # noqa: WPS437
+            with self._lock:
+                self._connections.append(connection)
+
+        return getattr(connection, method)(*args, **kwargs)
+
+    @staticmethod
+    async def _run_in_executor(executor: ThreadPoolExecutor | None, func: Callable, *args, **kwargs) -> Any:
+        # asyncio.to_thread is available only since Python 3.9
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
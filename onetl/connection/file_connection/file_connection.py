@@ -15,11 +15,14 @@
 from __future__ import annotations
 
 import os
+import threading
 from abc import abstractmethod
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Any, Iterable, Iterator
+from typing import Any, BinaryIO, ContextManager, Iterable, Iterator, Optional
 
 from humanize import naturalsize
+from pydantic import Field
 
 from onetl.base import (
     BaseFileConnection,
@@ -27,29 +30,63 @@ from onetl.base import (
     BaseFileLimit,
     PathStatProtocol,
 )
+from onetl.connection.file_connection.async_file_connection import AsyncFileConnection
 from onetl.exception import (
     DirectoryNotEmptyError,
     DirectoryNotFoundError,
+    FileChecksumMismatchError,
     FileSizeMismatchError,
     NotAFileError,
 )
 from onetl.file.filter import match_all_filters
 from onetl.file.limit import limits_reached, limits_stop_at, reset_limits
 from onetl.impl import (
+    FileChecksum,
     FrozenModel,
     LocalPath,
+    RawRemoteFileReader,
+    RawRemoteFileWriter,
     RemoteDirectory,
     RemoteFile,
+    RemoteFileReader,
+    RemoteFileWriter,
     RemotePath,
     path_repr,
 )
+from onetl.impl.directory_scanner import ConcurrentDirectoryScanner
+from onetl.impl.path_stat_cache import CacheInfo, PathStatCache
+from onetl.impl.remote_file_stream import DEFAULT_CHUNK_SIZE
 from onetl.log import log_with_indent
 
 log = getLogger(__name__)
 
+_stat_cache_lock = threading.Lock()
+
 
 class FileConnection(BaseFileConnection, FrozenModel):
+    cache_ttl: Optional[float] = Field(default=None, gt=0)
+    """
+    If set, metadata of paths (type and stats) is cached for specified number of seconds.
+
+    Cache is filled by ``walk`` and ``list_dir`` methods, and by methods checking a specific path,
+    and invalidated by methods changing files using this connection, like ``write_bytes``,
+    ``rename_file`` or ``remove_dir``. Changes made by other clients are not tracked,
+    so use it only if files are not changed by others during TTL period.
+
+    Cache statistics is returned by ``cache_info()`` method.
+    """
+
+    walk_workers: int = Field(default=1, ge=1)
+    """
+    Number of threads used by ``walk`` method to list nested directories.
+
+    If more than 1, nested directories are listed in background, each thread is using its own copy of connection.
+    Result and order of entries is the same as with ``walk_workers=1``,
+    and listing is stopped as soon as limits are reached.
+    """
+
     _client: Any = None
+    _stat_cache: Optional[PathStatCache] = None
 
     @property
     def client(self):
@@ -88,6 +125,63 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         self._client = None
 
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns statistics of metadata cache, enabled by ``cache_ttl`` option.
+
+        Returns
+        -------
+        Named tuple with fields:
+            * ``hits`` - number of requests served from cache
+            * ``misses`` - number of requests sent to the filesystem
+            * ``size`` - number of paths currently stored in cache
+
+        Examples
+        --------
+
+        .. code:: python
+
+            connection = SFTP(..., cache_ttl=60)
+            connection.list_dir("/mydir")
+            connection.resolve_file("/mydir/file.csv")  # no requests to filesystem
+
+            assert connection.cache_info().hits == 2
+        """
+
+        cache = self._get_stat_cache()
+        if not cache:
+            return CacheInfo(hits=0, misses=0, size=0)
+
+        return cache.info()
+
+    def cache_clear(self) -> None:
+        """
+        Clear metadata cache and reset its statistics.
+        """
+
+        cache = self._get_stat_cache()
+        if cache:
+            cache.clear()
+
+    def to_async(self, workers: int = 4) -> AsyncFileConnection:
+        """
+        Returns asyncio interface of this connection.
+
+        Methods of returned object are executed in a thread pool with ``workers`` threads,
+        each one using its own copy of connection. See
+        :obj:`AsyncFileConnection <onetl.connection.file_connection.async_file_connection.AsyncFileConnection>`.
+
+        Examples
+        --------
+
+        .. code:: python
+
+            async with connection.to_async(workers=4) as async_connection:
+                content = await async_connection.list_dir("/mydir")
+        """
+
+        return AsyncFileConnection(self, workers=workers)
+
     def __enter__(self):
         return self
 
@@ -111,25 +205,58 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         return self
 
+    def path_exists(self, path: os.PathLike | str) -> bool:
+        remote_path = RemotePath(path)
+
+        cache = self._get_stat_cache()
+        return self._cached_path_exists(remote_path, cache)
+
     def is_file(self, path: os.PathLike | str) -> bool:
         remote_path = RemotePath(path)
 
-        if not self.path_exists(remote_path):
+        cache = self._get_stat_cache()
+        is_dir = cache.get_is_dir(remote_path) if cache else None
+        if is_dir is not None:
+            return not is_dir
+
+        # miss is already recorded by get_is_dir, so existence check is not counted
+        if not self._cached_path_exists(remote_path, cache, count=False):
             raise FileNotFoundError(f"File '{remote_path}' does not exist")
 
-        return self._is_file(remote_path)
+        is_file = self._is_file(remote_path)
+        if cache:
+            cache.update(remote_path, is_dir=not is_file)
+        return is_file
 
     def is_dir(self, path: os.PathLike | str) -> bool:
         remote_path = RemotePath(path)
 
-        if not self.path_exists(remote_path):
+        cache = self._get_stat_cache()
+        is_dir = cache.get_is_dir(remote_path) if cache else None
+        if is_dir is not None:
+            return is_dir
+
+        # miss is already recorded by get_is_dir, so existence check is not counted
+        if not self._cached_path_exists(remote_path, cache, count=False):
             raise DirectoryNotFoundError(f"Directory '{remote_path}' does not exist")
 
-        return self._is_dir(remote_path)
+        is_dir = self._is_dir(remote_path)
+        if cache:
+            cache.update(remote_path, is_dir=is_dir)
+        return is_dir
 
     def get_stat(self, path: os.PathLike | str) -> PathStatProtocol:
         remote_path = RemotePath(path)
-        return self._get_stat(remote_path)
+
+        cache = self._get_stat_cache()
+        stat = cache.get_stat(remote_path) if cache else None
+        if stat is not None:
+            return stat
+
+        stat = self._get_stat(remote_path)
+        if cache:
+            cache.update(remote_path, stat=stat)
+        return stat
 
     def resolve_dir(self, path: os.PathLike | str) -> RemoteDirectory:
         is_dir = self.is_dir(path)
@@ -195,6 +322,7 @@ class FileConnection(BaseFileConnection, FrozenModel):
             )
 
         self._write_text(remote_path, content=content, encoding=encoding, **kwargs)
+        self._invalidate_cache(remote_path)
 
         return self.resolve_file(remote_path)
 
@@ -222,14 +350,49 @@ class FileConnection(BaseFileConnection, FrozenModel):
             )
 
         self._write_bytes(remote_path, content=content, **kwargs)
+        self._invalidate_cache(remote_path)
 
         return self.resolve_file(remote_path)
 
+    def open(
+        self,
+        path: os.PathLike | str,
+        mode: str = "rb",
+        buffer_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> RemoteFileReader | RemoteFileWriter:
+        if mode not in {"rb", "wb"}:
+            raise ValueError(f"Unsupported mode {mode!r}, should be 'rb' or 'wb'")
+
+        log.debug("|%s| Opening file '%s' with mode %r", self.__class__.__name__, path, mode)
+
+        if mode == "rb":
+            remote_file = self.resolve_file(path)
+            raw_reader = RawRemoteFileReader(
+                lambda offset: self._open_read(remote_file, offset=offset),
+                size=remote_file.stat().st_size,
+            )
+            return RemoteFileReader(raw_reader, buffer_size=buffer_size)
+
+        remote_path = RemotePath(path)
+        self.create_dir(remote_path.parent)
+
+        if self.path_exists(remote_path):
+            file = self.resolve_file(remote_path)
+            log.warning(
+                "|%s| File %s already exists and will be overwritten",
+                self.__class__.__name__,
+                path_repr(file),
+            )
+
+        raw_writer = RawRemoteFileWriter(self._invalidate_cache_on_exit(self._open_write(remote_path), remote_path))
+        return RemoteFileWriter(raw_writer, buffer_size=buffer_size)
+
     def download_file(
         self,
         remote_file_path: os.PathLike | str,
         local_file_path: os.PathLike | str,
         replace: bool = True,
+        checksum: FileChecksum | None = None,
     ) -> LocalPath:
         log.debug(
             "|%s| Downloading file '%s' to local '%s'",
@@ -253,7 +416,12 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         log.debug("|Local FS| Creating target directory '%s'", local_file.parent)
         local_file.parent.mkdir(parents=True, exist_ok=True)
-        self._download_file(remote_file, local_file)
+        if checksum is None:
+            self._download_file(remote_file, local_file)
+        else:
+            # checksum is calculated while content is streamed to local file, without reading it again
+            with self._open_read_all(remote_file) as source, open(local_file, "wb") as target:
+                checksum.copy(source, target)
 
         if local_file.stat().st_size != remote_file.stat().st_size:
             raise FileSizeMismatchError(
@@ -261,7 +429,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
                 f"the size of the file on the source ({naturalsize(remote_file.stat().st_size)})",
             )
 
-        log.info("|Local FS| Successfully downloaded file '%s'", local_file)
+        if checksum is not None:
+            self._verify_checksum(remote_file, checksum, action="downloaded")
+
+        log.debug("|Local FS| Successfully downloaded file '%s'", local_file)
         return local_file
 
     def remove_file(self, path: os.PathLike | str) -> bool:
@@ -275,7 +446,8 @@ class FileConnection(BaseFileConnection, FrozenModel):
         log.debug("|%s| File to remove: %s", self.__class__.__name__, path_repr(file))
 
         self._remove_file(file)
-        log.info("|%s| Successfully removed file '%s'", self.__class__.__name__, file)
+        self._invalidate_cache(file)
+        log.debug("|%s| Successfully removed file '%s'", self.__class__.__name__, file)
         return True
 
     def create_dir(self, path: os.PathLike | str) -> RemoteDirectory:
@@ -286,6 +458,7 @@ class FileConnection(BaseFileConnection, FrozenModel):
             return self.resolve_dir(remote_dir)
 
         self._create_dir(remote_dir)
+        self._invalidate_cache(remote_dir)
         log.info("|%s| Successfully created directory '%s'", self.__class__.__name__, remote_dir)
         return self.resolve_dir(remote_dir)
 
@@ -294,6 +467,7 @@ class FileConnection(BaseFileConnection, FrozenModel):
         local_file_path: os.PathLike | str,
         remote_file_path: os.PathLike | str,
         replace: bool = False,
+        checksum: FileChecksum | None = None,
     ) -> RemoteFile:
         log.debug("|%s| Uploading local file '%s' to '%s'", self.__class__.__name__, local_file_path, remote_file_path)
 
@@ -312,10 +486,18 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
             log.warning("|%s| File %s already exists, overwriting", self.__class__.__name__, path_repr(file))
             self._remove_file(remote_file)
+            self._invalidate_cache(remote_file)
 
         self.create_dir(remote_file.parent)
 
-        self._upload_file(local_file, remote_file)
+        if checksum is None:
+            self._upload_file(local_file, remote_file)
+        else:
+            # checksum is calculated while content is streamed to remote file, without reading it again
+            with open(local_file, "rb") as source, self._open_write(remote_file) as target:
+                checksum.copy(source, target)
+
+        self._invalidate_cache(remote_file)
         result = self.resolve_file(remote_file)
 
         if result.stat().st_size != local_file.stat().st_size:
@@ -324,7 +506,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
                 f"the size of the file on the source ({naturalsize(local_file.stat().st_size)})",
             )
 
-        log.info("|%s| Successfully uploaded file '%s'", self.__class__.__name__, remote_file)
+        if checksum is not None:
+            self._verify_checksum(result, checksum, action="uploaded")
+
+        log.debug("|%s| Successfully uploaded file '%s'", self.__class__.__name__, remote_file)
         return result
 
     def rename_file(
@@ -345,10 +530,13 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
             log.warning("|%s| File %s already exists, overwriting", self.__class__.__name__, path_repr(file))
             self._remove_file(target_file)
+            self._invalidate_cache(target_file)
 
         self.create_dir(target_file.parent)
         self._rename_file(source_file, target_file)
-        log.info("|%s| Successfully renamed file '%s' to '%s'", self.__class__.__name__, source_file, target_file)
+        self._invalidate_cache(source_file)
+        self._invalidate_cache(target_file)
+        log.debug("|%s| Successfully renamed file '%s' to '%s'", self.__class__.__name__, source_file, target_file)
 
         return self.resolve_file(target_file)
 
@@ -368,8 +556,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
         for entry in self._scan_entries(remote_dir):
             name = self._extract_name_from_entry(entry)
             stat = self._extract_stat_from_entry(remote_dir, entry)
+            is_dir = self._is_dir_entry(remote_dir, entry)
+            self._cache_entry(remote_dir / name, is_dir=is_dir, stat=stat)
 
-            if self._is_dir_entry(remote_dir, entry):
+            if is_dir:
                 path = RemoteDirectory(path=name, stats=stat)
             else:
                 path = RemoteFile(path=name, stats=stat)
@@ -393,7 +583,32 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         filters = filters or []
         limits = reset_limits(limits or [])
-        yield from self._walk(root_dir, topdown=topdown, filters=filters, limits=limits)
+
+        if self.walk_workers == 1:
+            yield from self._walk(root_dir, topdown=topdown, filters=filters, limits=limits)
+            return
+
+        # clients are not always thread-safe, so each worker thread is using its own copy of connection
+        thread_local = threading.local()
+        connections: list[FileConnection] = []
+
+        def scan(path: RemotePath) -> list[tuple[str, bool, PathStatProtocol]]:
+            connection = getattr(thread_local, "connection", None)
+            if connection is None:
+                connection = thread_local.connection = self._copy_for_thread()
+                connections.append(connection)
+
+            return list(connection._iter_entries(path))  # noqa: WPS437
+
+        log.debug("|%s| Walking using %d threads", self.__class__.__name__, self.walk_workers)
+        self._get_stat_cache()  # create cache before copying connection, to share it between threads
+        scanner = ConcurrentDirectoryScanner(scan, workers=self.walk_workers)
+        try:
+            yield from self._walk(root_dir, topdown=topdown, filters=filters, limits=limits, scanner=scanner)
+        finally:
+            scanner.close()
+            for connection in connections:
+                connection.close()
 
     def remove_dir(self, path: os.PathLike | str, recursive: bool = False) -> bool:
         description = "RECURSIVELY" if recursive else "NON-recursively"
@@ -422,6 +637,8 @@ class FileConnection(BaseFileConnection, FrozenModel):
         else:
             self._remove_dir(remote_dir)
 
+        self._invalidate_cache(remote_dir, recursive=True)
+
         log.info("|%s| Successfully removed directory '%s'", self.__class__.__name__, remote_dir)
         return True
 
@@ -431,6 +648,7 @@ class FileConnection(BaseFileConnection, FrozenModel):
         topdown: bool,
         filters: Iterable[BaseFileFilter],
         limits: Iterable[BaseFileLimit],
+        scanner: ConcurrentDirectoryScanner | None = None,
     ) -> Iterator[tuple[RemoteDirectory, list[RemoteDirectory], list[RemoteFile]]]:
         # no need to check nested directories if limit is already reached
         if limits_reached(limits):
@@ -439,22 +657,53 @@ class FileConnection(BaseFileConnection, FrozenModel):
         log.debug("|%s| Walking through directory '%s'", self.__class__.__name__, root)
         dirs, files = [], []
 
-        for entry in self._scan_entries(root):
-            name = self._extract_name_from_entry(entry)
-            stat = self._extract_stat_from_entry(root, entry)
-
-            if self._is_dir_entry(root, entry):
-                if not topdown:
-                    yield from self._walk(root=root / name, topdown=topdown, filters=filters, limits=limits)
-
-                path = RemoteDirectory(path=root / name, stats=stat)
-                if match_all_filters(path, filters):
-                    dirs.append(RemoteDirectory(path=name, stats=stat))
-
-                    if limits_stop_at(path, limits):
-                        break
+        # directories which are matching filters, and can contain matching files
+        nested_dirs = []
+
+        if scanner:
+            entries = scanner.scan(RemotePath(root))
+            if not topdown:
+                # nested directories are walked through before the current one is handled
+                scanner.schedule(
+                    root / name
+                    for name, is_dir, stat in entries
+                    if is_dir and self._should_walk_into(RemoteDirectory(path=root / name, stats=stat), filters)
+                )
+        else:
+            entries = self._iter_entries(root)
+
+        for name, is_dir, stat in entries:
+            full_path = root / name
+            self._cache_entry(full_path, is_dir=is_dir, stat=stat)
+
+            if is_dir:
+                path = RemoteDirectory(path=full_path, stats=stat)
+                if not match_all_filters(path, filters):
+                    continue
+
+                if all(file_filter.match_dir_prefix(path) for file_filter in filters):
+                    nested_dirs.append(name)
+                    if not topdown:
+                        yield from self._walk(
+                            root=full_path,
+                            topdown=topdown,
+                            filters=filters,
+                            limits=limits,
+                            scanner=scanner,
+                        )
+                else:
+                    log.debug(
+                        "|%s| Directory '%s' cannot contain paths matching filters, skipping",
+                        self.__class__.__name__,
+                        path,
+                    )
+
+                dirs.append(RemoteDirectory(path=name, stats=stat))
+
+                if limits_stop_at(path, limits):
+                    break
             else:
-                path = RemoteFile(path=root / name, stats=stat)
+                path = RemoteFile(path=full_path, stats=stat)
 
                 if match_all_filters(path, filters):
                     files.append(RemoteFile(path=name, stats=stat))
@@ -463,8 +712,17 @@ class FileConnection(BaseFileConnection, FrozenModel):
                         break
 
         if topdown:
-            for name in dirs:
-                yield from self._walk(root=root / name, topdown=topdown, filters=filters, limits=limits)
+            if scanner:
+                scanner.schedule(root / name for name in nested_dirs)
+
+            for name in nested_dirs:
+                yield from self._walk(
+                    root=root / name,
+                    topdown=topdown,
+                    filters=filters,
+                    limits=limits,
+                    scanner=scanner,
+                )
 
         log.debug(
             "|%s| Directory '%s' contains %d nested directories and %d files",
@@ -475,6 +733,20 @@ class FileConnection(BaseFileConnection, FrozenModel):
         )
         yield root, dirs, files
 
+    def _iter_entries(self, root: RemotePath) -> Iterator[tuple[str, bool, PathStatProtocol]]:
+        for entry in self._scan_entries(root):
+            name = self._extract_name_from_entry(entry)
+            stat = self._extract_stat_from_entry(root, entry)
+            yield name, self._is_dir_entry(root, entry), stat
+
+    def _should_walk_into(self, path: RemoteDirectory, filters: Iterable[BaseFileFilter]) -> bool:
+        return all(file_filter.match(path) and file_filter.match_dir_prefix(path) for file_filter in filters)
+
+    def _copy_for_thread(self) -> FileConnection:
+        connection = self.copy()
+        connection._client = None  # noqa: WPS437
+        return connection
+
     def _remove_dir_recursive(self, root: RemotePath) -> None:
         for entry in self._scan_entries(root):
             name = self._extract_name_from_entry(entry)
@@ -672,6 +944,102 @@ class FileConnection(BaseFileConnection, FrozenModel):
 
         """
 
+    def _open_read_all(self, path: RemotePath) -> ContextManager[BinaryIO]:
+        """
+        Same as :obj:`~_open_read`, but file is read completely by the caller, as fast as possible.
+
+        Could be overridden to request file content ahead of the caller without limiting memory usage,
+        which is not acceptable for streams returned by :obj:`~open`.
+        """
+
+        return self._open_read(path, offset=0)
+
+    def _get_checksum(self, path: RemotePath, algorithm: str) -> str | None:
+        """
+        Returns hex digest of file content, calculated by the remote filesystem itself.
+
+        Used to verify checksum calculated while downloading or uploading the file.
+        Returns ``None`` if filesystem does not provide checksum with specified algorithm for this file,
+        so verification is skipped.
+
+        Parameters
+        ----------
+        path : RemotePath
+            Path to the file.
+
+        algorithm : str
+            Name of algorithm, one of supported by :obj:`onetl.impl.FileChecksum`.
+
+        Returns
+        -------
+        Lowercase hex digest, or ``None``
+
+        Examples
+        --------
+
+        .. code:: python
+
+            assert connection._get_checksum("/a/path/to/the/file", "md5") == "d41d8cd98f00b204e9800998ecf8427e"
+        """
+
+        return None
+
+    def _verify_checksum(self, remote_file: RemotePath, checksum: FileChecksum, action: str) -> None:
+        expected = self._get_checksum(remote_file, checksum.algorithm)
+        if expected is None:
+            log.debug(
+                "|%s| Remote filesystem does not provide %s checksum of file '%s', skipping verification",
+                self.__class__.__name__,
+                checksum.algorithm,
+                remote_file,
+            )
+            return
+
+        actual = checksum.hexdigest()
+        if actual != expected.lower():
+            raise FileChecksumMismatchError(
+                f"The {checksum.algorithm} checksum of the {action} file ({actual}) does not match "
+                f"the checksum provided by the remote filesystem ({expected.lower()})",
+            )
+
+        log.debug("|%s| File '%s' has %s checksum %s", self.__class__.__name__, remote_file, checksum.algorithm, actual)
+
+    def _get_stat_cache(self) -> PathStatCache | None:
+        if not self.cache_ttl:
+            return None
+
+        with _stat_cache_lock:
+            if not self._stat_cache:
+                self._stat_cache = PathStatCache(ttl=self.cache_ttl)
+            return self._stat_cache
+
+    def _cached_path_exists(self, path: RemotePath, cache: PathStatCache | None, count: bool = True) -> bool:
+        if cache and cache.exists(path, count=count):
+            return True
+
+        exists = self._path_exists(path)
+        if cache and exists:
+            cache.update(path)
+        return exists
+
+    def _cache_entry(self, path: RemotePath, is_dir: bool, stat: PathStatProtocol) -> None:
+        cache = self._get_stat_cache()
+        if cache:
+            cache.update(path, is_dir=is_dir, stat=stat)
+
+    def _invalidate_cache(self, path: os.PathLike | str, recursive: bool = False) -> None:
+        cache = self._get_stat_cache()
+        if cache:
+            cache.invalidate(RemotePath(path), recursive=recursive)
+
+    @contextmanager
+    def _invalidate_cache_on_exit(self, target: ContextManager[BinaryIO], path: RemotePath) -> Iterator[BinaryIO]:
+        try:
+            with target as stream:
+                yield stream
+        finally:
+            self._invalidate_cache(path)
+
     def _log_parameters(self):
         log.info("|onETL| Using connection parameters:")
         log_with_indent("type = %s", self.__class__.__name__)
@@ -682,6 +1050,10 @@ class FileConnection(BaseFileConnection, FrozenModel):
             else:
                 log_with_indent("%s = %r", attr, value)
 
+    @abstractmethod
+    def _path_exists(self, path: RemotePath) -> bool:
+        """"""
+
     @abstractmethod
     def _get_client(self) -> Any:
         """"""
@@ -738,6 +1110,14 @@ class FileConnection(BaseFileConnection, FrozenModel):
     def _write_bytes(self, path: RemotePath, content: bytes) -> None:
         """"""
 
+    @abstractmethod
+    def _open_read(self, path: RemotePath, offset: int) -> ContextManager[BinaryIO]:
+        """"""
+
+    @abstractmethod
+    def _open_write(self, path: RemotePath) -> ContextManager[BinaryIO]:
+        """"""
+
     @abstractmethod
     def _is_dir(self, path: RemotePath) -> bool:
         """"""
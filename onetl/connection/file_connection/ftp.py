@@ -17,11 +17,16 @@ from __future__ import annotations
 import ftplib  # noqa: S402
 import os
 import textwrap
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, suppress
+from io import BytesIO
 from logging import getLogger
-from typing import Optional
+from typing import Any, BinaryIO, Callable, Iterator, Optional
 
 from etl_entities.instance import Host
-from pydantic import SecretStr
+from pydantic import Field, SecretStr
 
 from onetl.base import PathStatProtocol
 from onetl.connection.file_connection.file_connection import FileConnection
@@ -49,6 +54,112 @@ except (ImportError, NameError) as e:
 
 log = getLogger(__name__)
 
+_session_pool_lock = threading.Lock()
+
+
+class FTPSessionPool:
+    """Bounded pool of authenticated FTP sessions.
+
+    Sessions are created lazily using ``factory``, and returned to the pool after use,
+    so the login (and TLS handshake for FTPS) is performed only once per session.
+
+    If all ``max_size`` sessions are in use, :obj:`~borrow` blocks until some session is returned.
+    Idle sessions are checked with ``NOOP`` command before reuse, broken ones are silently replaced.
+    """
+
+    def __init__(self, factory: Callable[[], ftplib.FTP], max_size: int, check_after: float = 30):
+        self._factory = factory
+        self._max_size = max_size
+        self._check_after = check_after
+        self._idle: deque[tuple[ftplib.FTP, float]] = deque()
+        self._created = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of currently opened sessions, both idle and borrowed"""
+
+        return self._created
+
+    @contextmanager
+    def borrow(self) -> Iterator[ftplib.FTP]:
+        session = self._acquire()
+        broken = False
+        try:
+            yield session
+        except ftplib.error_perm:
+            # command was rejected by server, but session is still consistent
+            raise
+        except BaseException:
+            # session state is unknown after network or protocol error, or interrupted transfer.
+            # do not return it back
+            broken = True
+            raise
+        finally:
+            self._release(session, broken=broken)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                session, _ = self._idle.popleft()
+                self._close_session(session)
+            self._condition.notify_all()
+
+    def _acquire(self) -> ftplib.FTP:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Session pool is closed")
+
+                if self._idle:
+                    session, released_at = self._idle.pop()
+                    if time.monotonic() - released_at < self._check_after or self._is_alive(session):
+                        return session
+
+                    self._close_session(session)
+                    continue
+
+                if self._created < self._max_size:
+                    # reserve a slot before releasing the lock, login can take a while
+                    self._created += 1
+                    break
+
+                self._condition.wait()
+
+        try:
+            return self._factory()
+        except BaseException:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, session: ftplib.FTP, broken: bool = False) -> None:
+        with self._condition:
+            if broken or self._closed:
+                self._close_session(session)
+            else:
+                self._idle.append((session, time.monotonic()))
+            self._condition.notify()
+
+    def _is_alive(self, session: ftplib.FTP) -> bool:
+        try:
+            session.voidcmd("NOOP")
+        except Exception:
+            return False
+
+        return True
+
+    def _close_session(self, session: ftplib.FTP) -> None:
+        # should be called with lock acquired
+        self._created -= 1
+        try:
+            session.quit()
+        except Exception:
+            session.close()
+
 
 class FTP(FileConnection, RenameDirMixin):
     """FTP file connection.
@@ -86,6 +197,20 @@ class FTP(FileConnection, RenameDirMixin):
 
         ``None`` means that the user is anonymous.
 
+    max_sessions : int, default: ``4``
+        Maximum number of authenticated sessions used for file transfers.
+
+        Sessions are opened on demand, and reused by subsequent transfers,
+        so login is performed only once per session instead of every transferred file.
+
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -106,31 +231,89 @@ class FTP(FileConnection, RenameDirMixin):
     port: int = 21
     user: Optional[str] = None
     password: Optional[SecretStr] = None
+    max_sessions: int = Field(default=4, ge=1)
+
+    _session_factory: Any = None
+    _session_pool: Optional[FTPSessionPool] = None
 
     @property
     def instance_url(self) -> str:
         return f"ftp://{self.host}:{self.port}"
 
-    def path_exists(self, path: os.PathLike | str) -> bool:
+    def _path_exists(self, path: RemotePath) -> bool:
         return self.client.path.exists(os.fspath(path))
 
-    def _get_client(self) -> FTPHost:
+    @contextmanager
+    def borrow_session(self) -> Iterator[ftplib.FTP]:
         """
-        Returns a FTP connection object
+        Borrow authenticated session from the connection pool, and return it back after use.
+
+        Could be used by multiple threads at the same time, but no more than
+        ``max_sessions`` sessions are opened simultaneously.
+
+        Examples
+        --------
+
+        .. code:: python
+
+            with ftp.borrow_session() as session:
+                session.retrbinary("RETR /some/file.csv", callback)
         """
 
-        session_factory = ftp_session.session_factory(
+        with _session_pool_lock:
+            if not self._session_pool:
+                self._session_pool = FTPSessionPool(self._create_session, max_size=self.max_sessions)
+            pool = self._session_pool
+
+        with pool.borrow() as session:
+            yield session
+
+    def close(self):
+        if self._session_pool:
+            self._session_pool.close()
+
+        self._session_pool = None
+        return super().close()
+
+    def _copy_for_thread(self) -> FTP:
+        connection = super()._copy_for_thread()
+        # each copy is closed separately, so it cannot share pool with other ones
+        connection._session_pool = None  # noqa: WPS437
+        return connection
+
+    def _get_session_factory(self) -> type[ftplib.FTP]:
+        return ftp_session.session_factory(
             base_class=ftplib.FTP,
             port=self.port,
             encrypt_data_channel=True,
             debug_level=0,
         )
 
+    def _get_or_create_session_factory(self) -> type[ftplib.FTP]:
+        if not self._session_factory:
+            # the same factory is used by all sessions of connection, e.g. to share TLS session
+            self._session_factory = self._get_session_factory()
+
+        return self._session_factory
+
+    def _create_session(self) -> ftplib.FTP:
+        session_factory = self._get_or_create_session_factory()
+        return session_factory(
+            self.host,
+            self.user,
+            self.password.get_secret_value() if self.password else None,
+        )
+
+    def _get_client(self) -> FTPHost:
+        """
+        Returns a FTP connection object
+        """
+
         return FTPHost(
             self.host,
             self.user,
             self.password.get_secret_value() if self.password else None,
-            session_factory=session_factory,
+            session_factory=self._get_or_create_session_factory(),
         )
 
     def _is_client_closed(self) -> bool:
@@ -139,11 +322,18 @@ class FTP(FileConnection, RenameDirMixin):
     def _close_client(self) -> None:
         self._client.close()
 
+    def _invalidate_stat_cache(self, path: RemotePath) -> None:
+        if self._client and not self._is_client_closed():
+            self._client.stat_cache.invalidate(os.fspath(path))
+
     def _remove_dir(self, path: RemotePath) -> None:
         self.client.rmdir(os.fspath(path))
 
     def _upload_file(self, local_file_path: LocalPath, remote_file_path: RemotePath) -> None:
-        self.client.upload(os.fspath(local_file_path), os.fspath(remote_file_path))
+        with self.borrow_session() as session, open(local_file_path, "rb") as file:
+            session.storbinary(f"STOR {remote_file_path}", file)
+
+        self._invalidate_stat_cache(remote_file_path)
 
     def _rename_file(self, source: RemotePath, target: RemotePath) -> None:
         self.client.rename(os.fspath(source), os.fspath(target))
@@ -151,7 +341,8 @@ class FTP(FileConnection, RenameDirMixin):
     _rename_dir = _rename_file
 
     def _download_file(self, remote_file_path: RemotePath, local_file_path: LocalPath) -> None:
-        self.client.download(os.fspath(remote_file_path), os.fspath(local_file_path))
+        with self.borrow_session() as session, open(local_file_path, "wb") as file:
+            session.retrbinary(f"RETR {remote_file_path}", file.write)
 
     def _remove_file(self, remote_file_path: RemotePath) -> None:
         self.client.remove(os.fspath(remote_file_path))
@@ -181,16 +372,74 @@ class FTP(FileConnection, RenameDirMixin):
             return file.read()
 
     def _read_bytes(self, path: RemotePath, **kwargs) -> bytes:
-        with self.client.open(os.fspath(path), mode="rb", **kwargs) as file:
-            return file.read()
+        chunks: list[bytes] = []
+        with self.borrow_session() as session:
+            session.retrbinary(f"RETR {path}", chunks.append, **kwargs)
+
+        return b"".join(chunks)
 
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
         with self.client.open(os.fspath(path), mode="w", encoding=encoding, **kwargs) as file:
             file.write(content)
 
     def _write_bytes(self, path: RemotePath, content: bytes, **kwargs) -> None:
-        with self.client.open(os.fspath(path), mode="wb", **kwargs) as file:
-            file.write(content)
+        with self.borrow_session() as session:
+            session.storbinary(f"STOR {path}", BytesIO(content), **kwargs)
+
+        self._invalidate_stat_cache(path)
+
+    @contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        aborted = False
+        try:
+            with self.borrow_session() as session:
+                session.voidcmd("TYPE I")
+                connection = session.transfercmd(f"RETR {path}", rest=offset or None)
+                try:
+                    with connection.makefile("rb") as file:
+                        yield file
+
+                        # stream was closed before reaching end of file, e.g. after seek or reading only a header.
+                        # if data connection was dropped by server, there is nothing to read, and reply is checked below
+                        aborted = bool(file.peek(1))
+
+                    if aborted:
+                        with suppress(ftplib.Error, OSError):
+                            session.abort()
+                finally:
+                    connection.close()
+
+                session.voidresp()
+        except ftplib.Error:
+            if not aborted:
+                raise
+
+            # server responded that transfer is aborted. Session is already dropped by pool
+
+    @contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        try:
+            with self.borrow_session() as session:
+                session.voidcmd("TYPE I")
+                connection = session.transfercmd(f"STOR {path}")
+                try:
+                    with connection.makefile("wb") as file:
+                        yield file
+
+                    unwrap = getattr(connection, "unwrap", None)
+                    if unwrap:
+                        # properly close TLS data channel, like ftplib does
+                        unwrap()
+                finally:
+                    connection.close()
+
+                session.voidresp()
+        except Exception:
+            with suppress(Exception):
+                self._remove_file(path)
+            raise
+        finally:
+            self._invalidate_stat_cache(path)
 
     def _extract_name_from_entry(self, entry: str) -> str:
         return entry
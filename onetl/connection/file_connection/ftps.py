@@ -13,9 +13,10 @@
 #  limitations under the License.
 
 import ftplib  # NOQA: S402
+import ssl
 import textwrap
+from typing import ClassVar, Optional
 
-from ftputil import FTPHost
 from ftputil import session as ftp_session
 
 try:
@@ -53,6 +54,44 @@ class TLSfix(ftplib.FTP_TLS):  # noqa: N801
         return conn, size
 
 
+class TLSSessionReuse(TLSfix):
+    """
+    Resume TLS session of previously opened control connection in new control connections.
+
+    All sessions of the same connection share one SSL context and the last negotiated TLS session,
+    so only the first login performs full TLS handshake, others are using abbreviated one.
+    If server does not support session resumption, full handshake is performed as usual.
+    """
+
+    tls_context: ClassVar[ssl.SSLContext]
+    tls_session: ClassVar[Optional[ssl.SSLSession]] = None
+
+    def __init__(self, *args, **kwargs):
+        # SSL session can be resumed only within the same context
+        kwargs.setdefault("context", self.tls_context)
+        super().__init__(*args, **kwargs)
+
+    def auth(self):
+        if isinstance(self.sock, ssl.SSLSocket):
+            raise ValueError("Already using TLS")
+
+        response = self.voidcmd("AUTH TLS")
+        self.sock = self.context.wrap_socket(
+            self.sock,
+            server_hostname=self.host,
+            session=type(self).tls_session,
+        )
+        self.file = self.sock.makefile(mode="r", encoding=self.encoding)
+        return response
+
+    def login(self, *args, **kwargs):
+        response = super().login(*args, **kwargs)
+        # TLS 1.3 session ticket is sent after handshake, so it is available only after some reads
+        if isinstance(self.sock, ssl.SSLSocket) and self.sock.session:
+            type(self).tls_session = self.sock.session
+        return response
+
+
 class FTPS(FTP):
     """FTPS file connection.
 
@@ -89,6 +128,21 @@ class FTPS(FTP):
 
         ``None`` means that the user is anonymous.
 
+    max_sessions : int, default: ``4``
+        Maximum number of authenticated sessions used for file transfers.
+
+        Sessions are opened on demand, and reused by subsequent transfers,
+        so login is performed only once per session instead of every transferred file.
+        TLS session of the first connection is resumed by all other sessions and data channels.
+
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -109,21 +163,17 @@ class FTPS(FTP):
     def instance_url(self) -> str:
         return f"ftps://{self.host}:{self.port}"
 
-    def _get_client(self) -> FTPHost:
-        """
-        Returns a FTPS connection object
-        """
+    def _get_session_factory(self) -> type[ftplib.FTP]:
+        # separated class for each connection, to avoid sharing TLS sessions between different servers
+        base_class = type(
+            "TLSSessionReuse",
+            (TLSSessionReuse,),
+            {"tls_context": ssl._create_stdlib_context()},  # noqa: S323, WPS437 # same as FTP_TLS default
+        )
 
-        session_factory = ftp_session.session_factory(
-            base_class=TLSfix,
+        return ftp_session.session_factory(
+            base_class=base_class,
             port=self.port,
             encrypt_data_channel=True,
             debug_level=0,
         )
-
-        return FTPHost(
-            self.host,
-            self.user,
-            self.password.get_secret_value() if self.password else None,
-            session_factory=session_factory,
-        )
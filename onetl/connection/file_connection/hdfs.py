@@ -17,8 +17,9 @@ from __future__ import annotations
 import os
 import stat
 import textwrap
+from contextlib import contextmanager, suppress
 from logging import getLogger
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Tuple
 
 from etl_entities.instance import Cluster, Host
 from pydantic import Field, FilePath, SecretStr, root_validator, validator
@@ -140,6 +141,14 @@ class HDFS(FileConnection, RenameDirMixin):
     timeout : int, default: ``10``
         Connection timeout.
 
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -621,7 +630,7 @@ class HDFS(FileConnection, RenameDirMixin):
             return self.cluster
         return f"hdfs://{self.host}:{self.webhdfs_port}"
 
-    def path_exists(self, path: os.PathLike | str) -> bool:
+    def _path_exists(self, path: RemotePath) -> bool:
         return self.client.status(os.fspath(path), strict=False)
 
     def _get_active_namenode(self) -> str:
@@ -718,6 +727,20 @@ class HDFS(FileConnection, RenameDirMixin):
     def _download_file(self, remote_file_path: RemotePath, local_file_path: LocalPath) -> None:
         self.client.download(os.fspath(remote_file_path), os.fspath(local_file_path))
 
+    def _get_checksum(self, path: RemotePath, algorithm: str) -> str | None:
+        if algorithm != "crc32c":
+            return None
+
+        # By default WebHDFS returns MD5 of block MD5s of chunk CRCs, which depends on block size
+        # and cannot be compared with checksum of file content.
+        # CRC32C of the whole file is returned only if cluster has `dfs.checksum.combine.mode=COMPOSITE_CRC`
+        checksum = self.client.checksum(os.fspath(path))
+        if checksum["algorithm"] != "COMPOSITE-CRC32C":
+            return None
+
+        # only first 4 bytes contain CRC value
+        return checksum["bytes"][:8]
+
     def _remove_file(self, remote_file_path: RemotePath) -> None:
         self.client.delete(os.fspath(remote_file_path), recursive=False)
 
@@ -778,6 +801,22 @@ class HDFS(FileConnection, RenameDirMixin):
         with self.client.read(os.fspath(path), **kwargs) as file:
             return file.read()
 
+    @contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        with self.client.read(os.fspath(path), offset=offset) as file:
+            yield file
+
+    @contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        # content is streamed to datanode by a background thread, without buffering the whole file
+        try:
+            with self.client.write(os.fspath(path), overwrite=True) as file:
+                yield file
+        except Exception:
+            with suppress(Exception):
+                self._remove_file(path)
+            raise
+
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
         self.client.write(os.fspath(path), data=content, encoding=encoding, overwrite=True, **kwargs)
 
@@ -800,7 +839,8 @@ class HDFS(FileConnection, RenameDirMixin):
     def _extract_stat_from_entry(self, top: RemotePath, entry: ENTRY_TYPE) -> PathStatProtocol:
         entry_stat = entry[1]
 
-        return RemotePathStat(
+        # values are already of proper types, so validation can be skipped
+        return RemotePathStat.construct(
             st_size=entry_stat["length"],
             st_mtime=entry_stat["modificationTime"] / 1000,  # HDFS uses timestamps with milliseconds
             st_uid=entry_stat["owner"],
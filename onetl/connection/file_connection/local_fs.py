@@ -0,0 +1,203 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+import shutil
+import socket
+from logging import getLogger
+from typing import BinaryIO, Iterator
+
+from onetl.connection.file_connection.file_connection import FileConnection
+from onetl.connection.file_connection.mixins.rename_dir_mixin import RenameDirMixin
+from onetl.impl import LocalPath, RemotePath
+from onetl.impl.local_file_copy import copy_file
+
+log = getLogger(__name__)
+
+
+class LocalFS(FileConnection, RenameDirMixin):
+    """Local filesystem connection.
+
+    Allows to use local directories (including mounted network filesystems, like NFS) as a source or a target
+    of :ref:`file-downloader`, :ref:`file-uploader` and :ref:`file-mover`, with all the filters, limits and HWM.
+
+    Does not require any additional dependencies. Directories are listed using :obj:`os.scandir`,
+    files and directories are renamed using :obj:`os.replace`. Files are copied using ``copy_file_range`` syscall,
+    if it is supported, so data is not passed through user space, and could be copied by filesystem
+    or NFS server itself. Otherwise ``sendfile`` syscall or :obj:`shutil.copyfileobj` is used.
+
+    Symlinks to files are listed as files. Symlinks to directories and broken symlinks are skipped
+    while listing directories, like :obj:`os.walk` does by default.
+
+    .. note::
+
+        Both "remote" and local paths are paths on the same host where the Python process is running.
+
+    Parameters
+    ----------
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
+    Examples
+    --------
+
+    Local filesystem connection initialization
+
+    .. code:: python
+
+        from onetl.connection import LocalFS
+
+        local_fs = LocalFS()
+
+    Move files from one local directory to another
+
+    .. code:: python
+
+        from onetl.connection import LocalFS
+        from onetl.file import FileMover
+
+        mover = FileMover(
+            connection=LocalFS(),
+            source_path="/mnt/nfs/incoming",
+            target_path="/mnt/nfs/archive",
+        )
+        mover.run()
+    """
+
+    @property
+    def instance_url(self) -> str:
+        return f"file://{socket.getfqdn()}"
+
+    def _get_client(self) -> None:
+        # there is no client, all operations are performed using syscalls
+        return None
+
+    def _is_client_closed(self) -> bool:
+        return False
+
+    def _close_client(self) -> None:
+        pass  # noqa: WPS420
+
+    def _path_exists(self, path: RemotePath) -> bool:
+        return os.path.exists(path)
+
+    def _create_dir(self, path: RemotePath) -> None:
+        os.makedirs(path, exist_ok=True)
+
+    def _upload_file(self, local_file_path: LocalPath, remote_file_path: RemotePath) -> None:
+        copy_file(local_file_path, remote_file_path)
+
+    def _download_file(self, remote_file_path: RemotePath, local_file_path: LocalPath) -> None:
+        copy_file(remote_file_path, local_file_path)
+
+    def _rename_file(self, source: RemotePath, target: RemotePath) -> None:
+        try:
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+            # paths are located on different filesystems, so they cannot be renamed atomically
+            log.debug("|%s| '%s' and '%s' are on different devices, moving", self.__class__.__name__, source, target)
+            shutil.move(os.fspath(source), os.fspath(target))
+
+    _rename_dir = _rename_file
+
+    def _remove_dir(self, path: RemotePath) -> None:
+        os.rmdir(path)
+
+    def _remove_file(self, remote_file_path: RemotePath) -> None:
+        os.remove(remote_file_path)
+
+    def _scan_entries(self, path: RemotePath) -> list[os.DirEntry]:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if self._is_supported_entry(path, entry)]
+
+    def _is_supported_entry(self, top: RemotePath, entry: os.DirEntry) -> bool:
+        # symlinks to files are followed, like any other file.
+        # like os.walk, do not follow symlinks to directories, to avoid infinite loops.
+        # broken symlinks cannot be read, so they are skipped as well
+        if entry.is_symlink() and not entry.is_file():
+            log.debug(
+                "|%s| '%s' is a broken symlink or a symlink to directory, skipping",
+                self.__class__.__name__,
+                top / entry.name,
+            )
+            return False
+
+        return True
+
+    def _is_dir(self, path: RemotePath) -> bool:
+        return os.path.isdir(path)
+
+    def _is_file(self, path: RemotePath) -> bool:
+        return os.path.isfile(path)
+
+    def _get_stat(self, path: RemotePath) -> os.stat_result:
+        return os.stat(path)
+
+    def _extract_name_from_entry(self, entry: os.DirEntry) -> str:
+        return entry.name
+
+    def _is_dir_entry(self, top: RemotePath, entry: os.DirEntry) -> bool:
+        # symlinks to directories are already excluded by _scan_entries
+        return entry.is_dir(follow_symlinks=False)
+
+    def _is_file_entry(self, top: RemotePath, entry: os.DirEntry) -> bool:
+        return entry.is_file()
+
+    def _extract_stat_from_entry(self, top: RemotePath, entry: os.DirEntry) -> os.stat_result:
+        # result is cached by DirEntry
+        return entry.stat()
+
+    def _read_text(self, path: RemotePath, encoding: str, **kwargs) -> str:
+        with open(path, encoding=encoding, **kwargs) as file:
+            return file.read()
+
+    def _read_bytes(self, path: RemotePath, **kwargs) -> bytes:
+        with open(path, "rb", **kwargs) as file:
+            return file.read()
+
+    @contextlib.contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        with open(path, "rb") as file:
+            file.seek(offset)
+            yield file
+
+    @contextlib.contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        try:
+            with open(path, "wb") as file:
+                yield file
+        except Exception:
+            with contextlib.suppress(Exception):
+                self._remove_file(path)
+            raise
+
+    def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
+        with open(path, "w", encoding=encoding, **kwargs) as file:
+            file.write(content)
+
+    def _write_bytes(self, path: RemotePath, content: bytes, **kwargs) -> None:
+        with open(path, "wb", **kwargs) as file:
+            file.write(content)
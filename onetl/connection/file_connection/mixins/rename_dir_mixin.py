@@ -86,6 +86,8 @@ class RenameDirMixin(BaseFileConnection):
 
         self.create_dir(target_dir.parent)
         self._rename_dir(source_dir, target_dir)
+        self._invalidate_cache(source_dir, recursive=True)
+        self._invalidate_cache(target_dir, recursive=True)
         log.info("|%s| Successfully renamed file '%s' to '%s'", self.__class__.__name__, source_dir, target_dir)
 
         return self.resolve_dir(target_dir)
@@ -93,3 +95,7 @@ class RenameDirMixin(BaseFileConnection):
     @abstractmethod
     def _rename_dir(self, source: RemotePath, target: RemotePath) -> None:
         ...
+
+    @abstractmethod
+    def _invalidate_cache(self, path: os.PathLike | str, recursive: bool = False) -> None:
+        ...
@@ -16,9 +16,11 @@ from __future__ import annotations
 
 import io
 import os
+import tempfile
 import textwrap
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Iterator, Optional, Union
 
 try:
     from minio import Minio, commonconfig
@@ -44,6 +46,7 @@ from typing_extensions import Literal
 
 from onetl.connection.file_connection.file_connection import FileConnection
 from onetl.impl import LocalPath, RemoteDirectory, RemotePath, RemotePathStat
+from onetl.impl.remote_file_stream import SPOOLED_MAX_SIZE
 
 log = getLogger(__name__)
 
@@ -92,6 +95,14 @@ class S3(FileConnection):
     region : str, optional
         Region name of bucket in S3 service
 
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -145,7 +156,7 @@ class S3(FileConnection):
         log.info("|%s| Successfully created directory '%s'", self.__class__.__name__, remote_directory)
         return RemoteDirectory(path=remote_directory, stats=RemotePathStat())
 
-    def path_exists(self, path: os.PathLike | str) -> bool:
+    def _path_exists(self, path: RemotePath) -> bool:
         remote_path = RemotePath(os.fspath(path))
         if self._is_root(remote_path):
             return True
@@ -193,6 +204,20 @@ class S3(FileConnection):
         path_str = self._delete_absolute_path_slash(remote_file_path)
         self.client.fget_object(self.bucket, path_str, os.fspath(local_file_path))
 
+    def _get_checksum(self, path: RemotePath, algorithm: str) -> str | None:
+        if algorithm != "md5":
+            return None
+
+        stat = self.client.stat_object(self.bucket, self._delete_absolute_path_slash(path))
+        etag = (stat.etag or "").strip('"')
+
+        # ETag of object uploaded using multipart upload is "<MD5 of parts MD5>-<number of parts>",
+        # not an MD5 of content
+        if not etag or "-" in etag:
+            return None
+
+        return etag
+
     def _get_stat(self, path: RemotePath) -> RemotePathStat:
         path_str = self._delete_absolute_path_slash(path)
 
@@ -247,7 +272,8 @@ class S3(FileConnection):
         return not entry.is_dir
 
     def _extract_stat_from_entry(self, top: RemotePath, entry: Object) -> RemotePathStat:
-        return RemotePathStat(
+        # values are already of proper types, so validation can be skipped
+        return RemotePathStat.construct(
             st_size=entry.size if entry.size else 0,
             st_mtime=entry.last_modified.timestamp() if entry.last_modified else None,
             st_uid=entry.owner_name or entry.owner_id,
@@ -271,6 +297,32 @@ class S3(FileConnection):
         file_handler = self.client.get_object(self.bucket, path_str, **kwargs)
         return file_handler.read()
 
+    @contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        path_str = self._delete_absolute_path_slash(path)
+        response = self.client.get_object(self.bucket, path_str, offset=offset)
+        try:
+            yield response
+        finally:
+            response.close()
+            response.release_conn()
+
+    @contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        # S3 object cannot be written by chunks without multipart upload of known part size,
+        # so content is collected into a temp file (kept in memory while it is small enough), and sent on close
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_MAX_SIZE) as buffer:
+            yield buffer
+
+            length = buffer.tell()
+            buffer.seek(0)
+            self.client.put_object(
+                self.bucket,
+                data=buffer,
+                object_name=self._delete_absolute_path_slash(path),
+                length=length,
+            )
+
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
         content_bytes = content.encode(encoding)
         stream = io.BytesIO(content_bytes)
@@ -19,7 +19,7 @@ import os
 import textwrap
 from logging import getLogger
 from stat import S_ISDIR, S_ISREG
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 
 from etl_entities.instance import Host
 from pydantic import FilePath, SecretStr
@@ -29,7 +29,7 @@ from onetl.connection.file_connection.mixins.rename_dir_mixin import RenameDirMi
 from onetl.impl import LocalPath, RemotePath
 
 try:
-    from paramiko import ProxyCommand, SSHClient, SSHConfig, WarningPolicy
+    from paramiko import ProxyCommand, SFTPError, SSHClient, SSHConfig, WarningPolicy
     from paramiko.sftp_attr import SFTPAttributes
     from paramiko.sftp_client import SFTPClient
     from paramiko.ssh_exception import ConfigParseError
@@ -50,6 +50,9 @@ except (ImportError, NameError) as e:
 
 SSH_CONFIG_PATH = LocalPath("~/.ssh/config").expanduser().resolve()
 
+# algorithms supported by "check-file" SFTP extension (draft-ietf-secsh-filexfer-extensions-00, section 3)
+SFTP_CHECK_FILE_ALGORITHMS = frozenset(("md5", "sha1", "sha256", "sha512", "crc32"))
+
 log = getLogger(__name__)
 
 
@@ -97,6 +100,14 @@ class SFTP(FileConnection, RenameDirMixin):
     compress : bool, default: ``True``
         Set to True to turn on compression
 
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -126,7 +137,7 @@ class SFTP(FileConnection, RenameDirMixin):
     def instance_url(self) -> str:
         return f"sftp://{self.host}:{self.port}"
 
-    def path_exists(self, path: os.PathLike | str) -> bool:
+    def _path_exists(self, path: RemotePath) -> bool:
         try:
             self.client.stat(os.fspath(path))
             return True
@@ -211,6 +222,17 @@ class SFTP(FileConnection, RenameDirMixin):
     def _download_file(self, remote_file_path: RemotePath, local_file_path: RemotePath) -> None:
         self.client.get(os.fspath(remote_file_path), os.fspath(local_file_path))
 
+    def _get_checksum(self, path: RemotePath, algorithm: str) -> str | None:
+        if algorithm not in SFTP_CHECK_FILE_ALGORITHMS:
+            return None
+
+        # "check-file" extension is supported only by some servers, e.g. ProFTPD mod_sftp, but not by OpenSSH
+        try:
+            with self.client.open(os.fspath(path), mode="rb") as file:
+                return file.check(algorithm).hex()
+        except (OSError, SFTPError):
+            return None
+
     def _remove_dir(self, path: RemotePath) -> None:
         self.client.rmdir(os.fspath(path))
 
@@ -252,6 +274,32 @@ class SFTP(FileConnection, RenameDirMixin):
         with self.client.open(os.fspath(path), mode="r", **kwargs) as file:
             return file.read()
 
+    @contextlib.contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        # no prefetch, because it buffers the whole rest of the file in memory if caller is reading it slowly
+        with self.client.open(os.fspath(path), mode="rb") as file:
+            file.seek(offset)
+            yield file
+
+    @contextlib.contextmanager
+    def _open_read_all(self, path: RemotePath) -> Iterator[BinaryIO]:
+        with self.client.open(os.fspath(path), mode="rb") as file:
+            # request all file chunks at once instead of waiting for each one
+            file.prefetch()
+            yield file
+
+    @contextlib.contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        try:
+            with self.client.open(os.fspath(path), mode="wb") as file:
+                # do not wait for server response after each chunk
+                file.set_pipelined(True)
+                yield file
+        except Exception:
+            with contextlib.suppress(Exception):
+                self._remove_file(path)
+            raise
+
     def _write_text(self, path: RemotePath, content: str, encoding: str, **kwargs) -> None:
         with self.client.open(os.fspath(path), mode="w", **kwargs) as file:
             file.write(content.encode(encoding))
@@ -15,24 +15,32 @@
 from __future__ import annotations
 
 import datetime
-import io
 import os
 import stat
+import tempfile
 import textwrap
+from collections import defaultdict
+from contextlib import closing, contextmanager
 from logging import getLogger
 from ssl import SSLContext
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+from urllib.parse import unquote, urlsplit
 
 from etl_entities.instance import Host
 from pydantic import DirectoryPath, FilePath, SecretStr, root_validator
 from typing_extensions import Literal
 
+from onetl.base import BaseFileFilter, BaseFileLimit
 from onetl.connection.file_connection.file_connection import FileConnection
 from onetl.connection.file_connection.mixins.rename_dir_mixin import RenameDirMixin
-from onetl.impl import LocalPath, RemotePath, RemotePathStat
+from onetl.file.limit import reset_limits
+from onetl.impl import LocalPath, RemoteDirectory, RemoteFile, RemotePath, RemotePathStat
+from onetl.impl.remote_file_stream import SPOOLED_MAX_SIZE
 
 try:
-    from webdav3.client import Client
+    from lxml import etree
+    from webdav3.client import Client, Urn, WebDavXmlUtils
+    from webdav3.exceptions import MethodNotSupported, ResponseErrorCode
 except (ImportError, NameError) as e:
     raise ImportError(
         textwrap.dedent(
@@ -94,6 +102,22 @@ class WebDAV(FileConnection, RenameDirMixin):
     port : int, optional
         Connection port
 
+    recursive_listing : bool, default : ``False``
+        If ``True``, :obj:`~walk` fetches the whole directory tree using single ``PROPFIND`` request
+        with header ``Depth: infinity``, instead of sending a separated request for each nested directory.
+        Response is parsed as a stream, so it is not loaded to memory at once.
+
+        Some servers do not allow infinite depth requests. In this case
+        connection falls back to listing each directory separately.
+
+    cache_ttl : float, optional
+        If set, metadata of paths is cached for specified number of seconds.
+        See :ref:`file-connection-common-options`.
+
+    walk_workers : int, default: ``1``
+        Number of threads used by ``walk`` method to list nested directories.
+        See :ref:`file-connection-common-options`.
+
     Examples
     --------
 
@@ -118,6 +142,7 @@ class WebDAV(FileConnection, RenameDirMixin):
     port: Optional[int] = None
     ssl_verify: Union[bool, FilePath, DirectoryPath, SSLContext] = True
     protocol: Union[Literal["http"], Literal["https"]] = "https"
+    recursive_listing: bool = False
 
     @root_validator
     def check_port(cls, values):
@@ -135,9 +160,36 @@ class WebDAV(FileConnection, RenameDirMixin):
     def instance_url(self) -> str:
         return f"webdav://{self.host}:{self.port}"
 
-    def path_exists(self, path: os.PathLike | str) -> bool:
+    def _path_exists(self, path: RemotePath) -> bool:
         return self.client.check(os.fspath(path))
 
+    def walk(
+        self,
+        root: os.PathLike | str,
+        topdown: bool = True,
+        filters: Iterable[BaseFileFilter] | None = None,
+        limits: Iterable[BaseFileLimit] | None = None,
+    ) -> Iterator[tuple[RemoteDirectory, list[RemoteDirectory], list[RemoteFile]]]:
+        if not self.recursive_listing:
+            yield from super().walk(root, topdown=topdown, filters=filters, limits=limits)
+            return
+
+        root_dir = self.resolve_dir(root)
+        tree = self._scan_tree(root_dir)
+        if tree is None:
+            yield from super().walk(root_dir, topdown=topdown, filters=filters, limits=limits)
+            return
+
+        # tree is bound to this specific walk, so other calls using the same connection are not affected
+        scanner = _DirectoryTreeScanner(self, tree)
+        yield from self._walk(
+            root_dir,
+            topdown=topdown,
+            filters=filters or [],
+            limits=reset_limits(limits or []),
+            scanner=scanner,  # type: ignore[arg-type]
+        )
+
     def _get_client(self) -> Any:
         options = {
             "webdav_hostname": f"{self.protocol}://{self.host}:{self.port}",
@@ -157,22 +209,12 @@ class WebDAV(FileConnection, RenameDirMixin):
         pass
 
     def _download_file(self, remote_file_path: RemotePath, local_file_path: LocalPath) -> None:
-        self.client.download_sync(
-            remote_path=os.fspath(remote_file_path),
-            local_path=os.fspath(local_file_path),
-        )
+        with open(local_file_path, "wb") as file:
+            for chunk in self._iter_content(remote_file_path):
+                file.write(chunk)
 
     def _get_stat(self, path: RemotePath) -> RemotePathStat:
-        info = self.client.info(os.fspath(path))
-
-        if self.client.is_dir(os.fspath(path)):
-            return RemotePathStat(st_mode=stat.S_IFDIR)
-
-        return RemotePathStat(
-            st_size=info["size"],
-            st_mtime=datetime.datetime.strptime(info["modified"], DATA_MODIFIED_FORMAT).timestamp(),
-            st_uid=info["name"],
-        )
+        return self._extract_stat_from_entry(path.parent, self._get_info(path))
 
     def _remove_file(self, remote_file_path: RemotePath) -> None:
         self.client.clean(os.fspath(remote_file_path))
@@ -184,10 +226,9 @@ class WebDAV(FileConnection, RenameDirMixin):
         self.client.mkdir(os.fspath(path))
 
     def _upload_file(self, local_file_path: LocalPath, remote_file_path: RemotePath) -> None:
-        self.client.upload_sync(
-            local_path=os.fspath(local_file_path),
-            remote_path=os.fspath(remote_file_path),
-        )
+        with open(local_file_path, "rb") as file:
+            # file object is sent by chunks, without reading it to memory
+            self._upload_content(remote_file_path, file)
 
     def _rename_file(self, source: RemotePath, target: RemotePath) -> None:
         res = self.client.resource(os.fspath(source))
@@ -198,39 +239,125 @@ class WebDAV(FileConnection, RenameDirMixin):
     def _scan_entries(self, path: RemotePath) -> list[dict]:
         return self.client.list(os.fspath(path), get_info=True)
 
+    def _scan_tree(self, root: RemotePath) -> dict[RemotePath, list[dict]] | None:
+        """
+        Returns entries of all nested directories, grouped by parent directory path.
+
+        If server does not support ``Depth: infinity``, returns ``None``.
+        """
+
+        log.debug("|%s| Fetching directory tree '%s' using single request", self.__class__.__name__, root)
+        urn = Urn(os.fspath(root), directory=True)
+        try:
+            response = self.client.execute_request(action="list", path=urn.quote(), headers_ext=["Depth: infinity"])
+        except (MethodNotSupported, ResponseErrorCode) as e:
+            log.debug(
+                "|%s| Server does not support recursive listing, falling back to listing each directory: %s",
+                self.__class__.__name__,
+                e,
+            )
+            return None
+
+        root_path = RemotePath(self.client.get_full_path(urn))
+        result: dict[RemotePath, list[dict]] = defaultdict(list)
+
+        # response may be huge, so parse it as a stream and drop each element after reading
+        response.raw.decode_content = True
+        for _, element in etree.iterparse(response.raw, tag="{DAV:}response"):
+            href = element.findtext(".//{DAV:}href")
+            if href:
+                entry = WebDavXmlUtils.get_info_from_response(element)
+                entry["isdir"] = element.find(".//{DAV:}collection") is not None
+                entry["path"] = unquote(urlsplit(href).path)
+
+                path = RemotePath(entry["path"])
+                if path != root_path:
+                    result[path.parent].append(entry)
+
+            element.clear()
+
+        log.debug("|%s| Directory tree contains %d directories", self.__class__.__name__, len(result))
+        return result
+
     def _remove_dir(self, path: RemotePath) -> None:
         self.client.clean(os.fspath(path))
 
     def _read_text(self, path: RemotePath, encoding: str) -> str:
-        res = self.client.resource(os.fspath(path))
-        stream = io.BytesIO()
-        res.write_to(stream)
-
-        return stream.getvalue().decode(encoding)
+        return self._read_bytes(path).decode(encoding)
 
     def _read_bytes(self, path: RemotePath) -> bytes:
-        res = self.client.resource(os.fspath(path))
-        stream = io.BytesIO()
-        res.write_to(stream)
-
-        return stream.getvalue()
+        return b"".join(self._iter_content(path))
 
     def _write_text(self, path: RemotePath, content: str, encoding: str) -> None:
-        res = self.client.resource(os.fspath(path))
-        content_bytes = content.encode(encoding)
-        stream = io.BytesIO(content_bytes)
-        res.read_from(buff=stream)
+        self._write_bytes(path, content.encode(encoding))
 
     def _write_bytes(self, path: RemotePath, content: bytes) -> None:
-        res = self.client.resource(os.fspath(path))
-        stream = io.BytesIO(content)
-        res.read_from(buff=stream)
+        self._upload_content(path, content)
+
+    @contextmanager
+    def _open_read(self, path: RemotePath, offset: int) -> Iterator[BinaryIO]:
+        urn = Urn(os.fspath(path))
+        headers = [f"Range: bytes={offset}-"] if offset else []
+        response = self.client.execute_request(action="download", path=urn.quote(), headers_ext=headers)
+
+        with closing(response):
+            response.raw.decode_content = True
+            if offset and response.status_code != 206:  # noqa: WPS432
+                # server ignored Range header and returned the whole file, skip to requested position
+                skipped = 0
+                while skipped < offset:
+                    chunk = response.raw.read(min(offset - skipped, self.client.chunk_size))
+                    if not chunk:
+                        break
+                    skipped += len(chunk)
+
+            yield response.raw
+
+    @contextmanager
+    def _open_write(self, path: RemotePath) -> Iterator[BinaryIO]:
+        # PUT request requires all the content to be available when request is started,
+        # so it is collected into a temp file (kept in memory while it is small enough), and sent on close
+        with tempfile.SpooledTemporaryFile(max_size=SPOOLED_MAX_SIZE) as buffer:
+            yield buffer
+
+            buffer.seek(0)
+            self._upload_content(path, buffer)
 
     def _is_dir(self, path: RemotePath) -> bool:
-        return self.client.is_dir(os.fspath(path))
+        return self._get_info(path)["isdir"]
 
     def _is_file(self, path: RemotePath) -> bool:
-        return not self.client.is_dir(os.fspath(path))
+        return not self._get_info(path)["isdir"]
+
+    def _get_info(self, path: RemotePath) -> dict:
+        """
+        Returns properties of resource, including its type, using single ``PROPFIND`` request.
+
+        ``client.info`` and ``client.is_dir`` are sending separated requests,
+        and both are also checking if path exists, which is another request.
+        """
+
+        urn = Urn(os.fspath(path))
+        response = self.client.execute_request(action="info", path=urn.quote(), headers_ext=["Depth: 0"])
+
+        element = WebDavXmlUtils.extract_response_for_path(
+            content=response.content,
+            path=self.client.get_full_path(urn),
+            hostname=self.client.webdav.hostname,
+        )
+        info = WebDavXmlUtils.get_info_from_response(element)
+        info["isdir"] = element.find(".//{DAV:}collection") is not None
+        return info
+
+    def _iter_content(self, path: RemotePath) -> Iterator[bytes]:
+        urn = Urn(os.fspath(path))
+        response = self.client.execute_request(action="download", path=urn.quote())
+        with closing(response):
+            yield from response.iter_content(chunk_size=self.client.chunk_size)
+
+    def _upload_content(self, path: RemotePath, content: bytes | BinaryIO | Iterable[bytes]) -> None:
+        urn = Urn(os.fspath(path))
+        self.client.execute_request(action="upload", path=urn.quote(), data=content)
 
     def _extract_name_from_entry(self, entry: dict) -> str:
         return RemotePath(entry["path"]).name
@@ -242,11 +369,39 @@ class WebDAV(FileConnection, RenameDirMixin):
         return not entry["isdir"]
 
     def _extract_stat_from_entry(self, top: RemotePath, entry: dict) -> RemotePathStat:
+        # values are converted explicitly, so validation can be skipped
         if entry["isdir"]:
-            return RemotePathStat(st_mode=stat.S_IFDIR)
+            return RemotePathStat.construct(st_mode=stat.S_IFDIR)
 
-        return RemotePathStat(
-            st_size=entry["size"],
+        return RemotePathStat.construct(
+            st_size=int(entry["size"] or 0),
             st_mtime=datetime.datetime.strptime(entry["modified"], DATA_MODIFIED_FORMAT).timestamp(),
             st_uid=entry["name"],
         )
+
+
+class _DirectoryTreeScanner:
+    """
+    Returns entries of directories from a tree fetched by a single request, instead of listing each directory.
+
+    Has the same interface as :obj:`onetl.impl.directory_scanner.ConcurrentDirectoryScanner`.
+    """
+
+    def __init__(self, connection: WebDAV, tree: dict[RemotePath, list[dict]]):
+        self._connection = connection
+        self._tree = tree
+
+    def schedule(self, paths: Iterable[RemotePath]) -> None:
+        # all the entries are already fetched
+        pass
+
+    def scan(self, path: RemotePath) -> list[tuple[str, bool, RemotePathStat]]:
+        connection = self._connection
+        return [
+            (
+                connection._extract_name_from_entry(entry),  # noqa: WPS437
+                connection._is_dir_entry(path, entry),  # noqa: WPS437
+                connection._extract_stat_from_entry(path, entry),  # noqa: WPS437
+            )
+            for entry in self._tree.get(RemotePath(path), [])
+        ]
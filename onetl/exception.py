@@ -52,6 +52,12 @@ class FileSizeMismatchError(OSError):
     """
 
 
+class FileChecksumMismatchError(OSError):
+    """
+    Checksum of transferred file does not match the checksum of the source file
+    """
+
+
 class DirectoryExistsError(OSError):
     """
     Like ``FileExistsError``, but for directories.
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from typing import Dict
+
 from pydantic import Field
 
 from onetl.file.file_result import FileResult, FileSet
@@ -75,3 +77,9 @@ class DownloadResult(FileResult):
 
     missing: FileSet[RemotePath] = Field(default_factory=FileSet)
     "File paths (remote) which are not present in the remote file system"
+
+    checksums: Dict[LocalPath, str] = Field(default_factory=dict)
+    "Checksums of downloaded files, calculated if ``checksum_algorithm`` option is set"
+
+    original_sizes: Dict[LocalPath, int] = Field(default_factory=dict)
+    "Sizes of source files before decompression, if ``compression`` option is set"
@@ -14,25 +14,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import os
 import shutil
 import warnings
-from typing import Iterable, List, Optional, Tuple, Type
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, Type
 
-from etl_entities import HWM, FileHWM, RemoteFolder
+from etl_entities import HWM, FileHWM, FileListHWM, RemoteFolder
 from ordered_set import OrderedSet
 from pydantic import Field, validator
 
 from onetl._internal import generate_temp_path  # noqa: WPS436
 from onetl.base import BaseFileConnection, BaseFileFilter, BaseFileLimit
-from onetl.base.path_protocol import PathProtocol
+from onetl.base.path_protocol import PathProtocol, PathWithStatsProtocol
 from onetl.file.file_downloader.download_result import DownloadResult
+from onetl.file.file_downloader.resume_manifest import ResumeManifest
+from onetl.file.file_downloader.sync_index import SyncIndex
 from onetl.file.file_set import FileSet
+from onetl.file.filter.compile_filters import compile_filters
 from onetl.file.filter.file_hwm import FileHWMFilter
+from onetl.file.limit import limits_reached
+from onetl.hwm import FileModifiedSinceHWM
 from onetl.hwm.store import HWMClassRegistry
 from onetl.impl import (
     FailedRemoteFile,
+    FileChecksum,
+    FileCompression,
     FileWriteMode,
     FrozenModel,
     GenericOptions,
@@ -41,7 +52,10 @@ from onetl.impl import (
     RemotePath,
     path_repr,
 )
+from onetl.impl.local_file_copy import is_same_device, move_file
+from onetl.impl.remote_file_stream import DEFAULT_CHUNK_SIZE
 from onetl.log import (
+    ProgressLog,
     entity_boundary_log,
     log_collection,
     log_lines,
@@ -52,6 +66,9 @@ from onetl.strategy import StrategyManager
 from onetl.strategy.batch_hwm_strategy import BatchHWMStrategy
 from onetl.strategy.hwm_strategy import HWMStrategy
 
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
+
 log = logging.getLogger(__name__)
 
 # source, target, temp
@@ -105,6 +122,12 @@ class FileDownloader(FrozenModel):
             Otherwise instead of ``rename``, remote OS will move file between filesystems,
             which is NOT atomic operation.
 
+        .. note::
+
+            If ``temp_path`` and ``local_path`` are located on different local filesystems, file cannot be renamed.
+            Instead, it is copied to a hidden file in the target directory using ``copy_file_range`` or ``sendfile``
+            syscalls, flushed to disk, and then renamed to the target file. This is slower, so a warning is logged.
+
     filters : list of :obj:`BaseFileFilter <onetl.base.base_file_filter.BaseFileFilter>`
         Return only files/directories matching these filters. See :ref:`file-filters`
 
@@ -118,6 +141,8 @@ class FileDownloader(FrozenModel):
     hwm_type : str | type[HWM] | None, default: ``None``
         HWM type to detect changes in incremental run. See :ref:`file-hwm`
 
+        Supported values are ``"file_list"`` and ``"file_modified_since"``.
+
         .. warning ::
             Used only in :obj:`onetl.strategy.incremental_strategy.IncrementalStrategy`.
 
@@ -218,6 +243,141 @@ class FileDownloader(FrozenModel):
         If download failed, file will left intact.
         """
 
+        hwm_max_age: Optional[timedelta] = None
+        """
+        If set, files modified earlier than ``now - hwm_max_age`` are considered already handled,
+        and their paths are removed from HWM value before downloading files.
+
+        Used to keep size of ``hwm_type="file_list"`` value bounded, if files are never removed from ``source_path``.
+        Files older than this will **not** be downloaded, even if they were never handled before.
+
+        Supported only by ``hwm_type="file_list"``.
+        """
+
+        hwm_drop_missing: bool = False
+        """
+        If ``True``, paths which are not found in ``source_path`` (or not matching ``filters``)
+        are removed from HWM value before downloading files.
+
+        Used to keep size of ``hwm_type="file_list"`` value bounded, if files are removed from ``source_path``
+        after downloading (e.g. ``delete_source=True``, or by some rotation process).
+        If the same file will appear again, it will be downloaded once more.
+
+        Not applied if listing was stopped because of reaching ``limits``,
+        as in this case not all files in ``source_path`` are known.
+
+        Supported only by ``hwm_type="file_list"``.
+        """
+
+        max_logged_files: Optional[int] = Field(default=100, ge=0)
+        """
+        Max number of files printed in logs, both in a list of files to download and in a download result.
+        Other files are replaced with ``... and N more files`` line.
+
+        If number of files to download is larger than this value, messages about each file
+        are logged with ``DEBUG`` level, and a progress message is logged with ``INFO`` level every 10 seconds.
+
+        ``None`` means no limit.
+        """
+
+        resume_manifest: Optional[LocalPath] = None
+        """
+        If set, path of each successfully downloaded file is appended to this local file,
+        together with its size and modification time.
+
+        If download was interrupted (e.g. process was killed), the next run with the same ``resume_manifest``
+        skips files which are already downloaded and not changed since that, without checking them on remote side.
+        Skipped files are included into ``successful`` files of download result.
+
+        With ``mode="delete_all"``, local directory is not cleaned up if manifest contains some files.
+
+        Manifest file is removed after a download without failed files.
+        """
+
+        checksum_algorithm: Optional[str] = None
+        """
+        If set, checksum of each file is calculated while it is being downloaded,
+        and saved to ``checksums`` attribute of download result.
+
+        If the source filesystem provides checksum of a file with the same algorithm,
+        it is compared with the calculated one, and in case of mismatch file is marked as failed
+        with :obj:`onetl.exception.FileChecksumMismatchError`. Supported by:
+            * S3 - ``md5`` (ETag of objects uploaded without multipart upload)
+            * SFTP - ``md5``, ``sha1``, ``sha256``, ``sha512``, ``crc32``
+              (only if server supports ``check-file`` extension)
+            * HDFS - ``crc32c`` (only if cluster has ``dfs.checksum.combine.mode=COMPOSITE_CRC``)
+
+        See :obj:`onetl.impl.FileChecksum` for a list of supported algorithms.
+
+        .. note::
+
+            File content is streamed through Python process instead of using a native download method of a client,
+            which can be slower for some filesystems.
+        """
+
+        sync_index: Optional[LocalPath] = None
+        """
+        If set, ``local_path`` is kept as a mirror of ``source_path``, using a local SQLite database
+        with path, size and modification time of each downloaded file
+        (and checksum, if ``checksum_algorithm`` is set).
+
+        Files which are present in the index and not changed on source since the last download
+        are marked as skipped, without downloading them again. Files changed on source are downloaded
+        and replace existing local files, regardless of ``mode``. New files are handled according to ``mode``.
+
+        Decisions are made using the index only, local files are not checked. If some local file was changed
+        or removed by other process, remove the index file to download all the files again.
+
+        Cannot be used with ``mode="delete_all"``.
+        """
+
+        sync_delete: bool = False
+        """
+        If ``True``, local files which were downloaded before (present in ``sync_index``),
+        but are not found in ``source_path`` anymore (or not matching ``filters``),
+        are removed from ``local_path`` and from the index.
+
+        Not applied if listing was stopped because of reaching ``limits``,
+        or if file list was passed to ``run`` method explicitly.
+
+        Can be used only with ``sync_index``, and cannot be used with ``hwm_type``,
+        because files handled by previous runs are not listed.
+        """
+
+        compression: Optional[FileCompression] = None
+        """
+        If set, files are decompressed while they are being downloaded, using specified codec
+        (``gzip``, ``bz2`` or ``zstd``). Only decompressed content is written to ``local_path``,
+        and codec extension (like ``.gz``) is removed from the local file name.
+
+        All downloaded files should be compressed by this codec, use ``filters`` to select them, e.g. ``Glob("*.gz")``.
+        Sizes of source files are saved to ``original_sizes`` attribute of download result.
+
+        Cannot be used with ``checksum_algorithm``.
+        """
+
+        @validator("checksum_algorithm")
+        def _validate_checksum_algorithm(cls, checksum_algorithm):
+            return FileChecksum(checksum_algorithm).algorithm
+
+        @validator("compression")
+        def _validate_compression(cls, compression, values):
+            if compression and values.get("checksum_algorithm"):
+                raise ValueError("Options `compression` and `checksum_algorithm` cannot be used together")
+            return compression
+
+        @validator("sync_index")
+        def _validate_sync_index(cls, sync_index, values):
+            if sync_index and values.get("mode") == FileWriteMode.DELETE_ALL:
+                raise ValueError("Option `sync_index` cannot be used with `mode='delete_all'`")
+            return sync_index
+
+        @validator("sync_delete")
+        def _validate_sync_delete(cls, sync_delete, values):
+            if sync_delete and not values.get("sync_index"):
+                raise ValueError("Option `sync_delete` can be used only with `sync_index`")
+            return sync_delete
+
     connection: BaseFileConnection
 
     local_path: LocalPath
@@ -342,52 +502,125 @@ class FileDownloader(FrozenModel):
             assert not downloaded_files.missing
         """
 
-        self._check_strategy()
+        return self._run(files)
 
-        if files is None and not self.source_path:
-            raise ValueError("Neither file list nor `source_path` are passed")
+    async def arun(self, files: Iterable[str | os.PathLike] | None = None) -> DownloadResult:
+        """
+        Asyncio version of :obj:`~run`.
 
-        self._log_options(files)
+        Download is performed in a separate thread, so event loop is not blocked while files are being downloaded.
+        Parameters and result are the same as for :obj:`~run`.
 
-        # Check everything
-        self._check_local_path()
-        self.connection.check()
-        log_with_indent("")
+        .. note::
 
-        if self.source_path:
-            self._check_source_path()
+            File connections are not thread-safe, so several downloaders running concurrently
+            should use different connection instances.
 
-        if files is None:
-            log.info("|%s| File list is not passed to `run` method", self.__class__.__name__)
+        Examples
+        --------
 
-            files = self.view_files()
+        Download files from several sources concurrently
 
-        if not files:
-            log.info("|%s| No files to download!", self.__class__.__name__)
-            return DownloadResult()
+        .. code:: python
 
-        current_temp_dir: LocalPath | None = None
-        if self.temp_path:
-            current_temp_dir = generate_temp_path(self.temp_path)
+            import asyncio
 
-        to_download = self._validate_files(files, current_temp_dir=current_temp_dir)
+            from onetl.connection import SFTP
+            from onetl.file import FileDownloader
 
-        # remove folder only after everything is checked
-        if self.options.mode == FileWriteMode.DELETE_ALL:
-            if self.local_path.exists():
-                shutil.rmtree(self.local_path)
-            self.local_path.mkdir()
+            downloaders = [
+                FileDownloader(connection=SFTP(...), source_path="/remote1", local_path="/local1"),
+                FileDownloader(connection=SFTP(...), source_path="/remote2", local_path="/local2"),
+            ]
 
-        if self.hwm_type is not None:
-            result = self._download_files_incremental(to_download)
-        else:
-            result = self._download_files(to_download)
 
-        if current_temp_dir:
-            self._remove_temp_dir(current_temp_dir)
+            async def main():
+                return await asyncio.gather(*(downloader.arun() for downloader in downloaders))
 
-        self._log_result(result)
-        return result
+
+            results = asyncio.run(main())
+        """
+
+        # asyncio.to_thread is available only since Python 3.9
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.run, files))
+
+    def run_on_spark(
+        self,
+        spark: SparkSession,
+        files: Iterable[str | os.PathLike] | None = None,
+        partitions: int | None = None,
+    ) -> DownloadResult:
+        """
+        Same as :obj:`~run`, but files are downloaded by Spark executors instead of the driver.
+
+        List of files is created on the driver, applying ``filters``, ``limits`` and ``hwm_type``,
+        and then split between ``partitions`` Spark tasks. Each task creates its own copy of connection,
+        downloads files directly to ``local_path`` and returns download result,
+        which are merged on the driver. HWM is also updated on the driver, after all tasks are finished.
+
+        .. warning::
+
+            ``local_path`` should be located on a storage shared by driver and all executors,
+            like NFS or other network filesystem mounted to all the hosts. ``temp_path``, if set,
+            is created on each executor host.
+
+        .. note::
+
+            onETL and libraries used by connection should be installed on all executors.
+
+        .. note::
+
+            If Spark task is retried (e.g. executor is lost), some files could be already downloaded
+            by previous attempt. Use ``mode="overwrite"`` to download them once more instead of marking them as failed.
+
+        Parameters
+        ----------
+
+        spark : :obj:`pyspark.sql.SparkSession`
+            Spark session used to run download tasks
+
+        files : Iterable[str | os.PathLike] | None, default ``None``
+            File list to download. Same as in :obj:`~run`
+
+        partitions : int, optional
+            Number of Spark tasks. Default is ``spark.sparkContext.defaultParallelism``,
+            but not more than number of files.
+
+        Returns
+        -------
+        downloaded_files : :obj:`DownloadResult <onetl.file.file_downloader.download_result.DownloadResult>`
+
+            Download result object
+
+        Examples
+        --------
+
+        .. code:: python
+
+            from onetl.connection import SFTP
+            from onetl.file import FileDownloader
+
+            downloader = FileDownloader(
+                connection=SFTP(...),
+                source_path="/remote",
+                local_path="/mnt/nfs/local",
+                options=FileDownloader.Options(mode="overwrite"),
+            )
+
+            downloaded_files = downloader.run_on_spark(spark, partitions=100)
+        """
+
+        if self.options.resume_manifest:
+            raise ValueError("Option `resume_manifest` is not supported by `run_on_spark`")
+
+        if self.options.sync_index:
+            raise ValueError("Option `sync_index` is not supported by `run_on_spark`")
+
+        if partitions is not None and partitions < 1:
+            raise ValueError(f"Number of partitions should be positive, got {partitions}")
+
+        return self._run(files, spark=spark, partitions=partitions)
 
     def view_files(self) -> FileSet[RemoteFile]:
         """
@@ -434,26 +667,8 @@ class FileDownloader(FrozenModel):
             }
         """
 
-        log.info("|%s| Getting files list from path '%s'", self.connection.__class__.__name__, self.source_path)
-
-        self._check_source_path()
-        result = FileSet()
-
-        filters = self.filters.copy()
-        if self.hwm_type:
-            filters.append(FileHWMFilter(hwm=self._init_hwm()))
-
-        try:
-            for root, _dirs, files in self.connection.walk(self.source_path, filters=filters, limits=self.limits):
-                for file in files:
-                    result.append(RemoteFile(path=root / file, stats=file.stats))
-
-        except Exception as e:
-            raise RuntimeError(
-                f"Couldn't read directory tree from remote dir '{self.source_path}'",
-            ) from e
-
-        return result
+        files, _hwm_filter = self._view_files()
+        return files
 
     @validator("local_path", pre=True, always=True)
     def _resolve_local_path(cls, local_path):
@@ -480,8 +695,28 @@ class FileDownloader(FrozenModel):
 
             cls._check_hwm_type(hwm_type)
 
+            if issubclass(hwm_type, FileModifiedSinceHWM) and values.get("limits"):
+                # limits are applied in listing order, so some old files could be skipped forever
+                raise ValueError("`limits` cannot be used with `hwm_type='file_modified_since'`")
+
         return hwm_type
 
+    @validator("options")
+    def _validate_options(cls, options, values):
+        hwm_type = values.get("hwm_type")
+        if options.sync_delete and hwm_type:
+            raise ValueError("Option `sync_delete` cannot be used with `hwm_type`")
+
+        if options.hwm_max_age is None and not options.hwm_drop_missing:
+            return options
+
+        if not hwm_type or not issubclass(hwm_type, FileListHWM):
+            raise ValueError(
+                "Options `hwm_max_age` and `hwm_drop_missing` can be used only with `hwm_type='file_list'`",
+            )
+
+        return options
+
     @validator("filters", pre=True)
     def _validate_filters(cls, filters):
         if filters is None:
@@ -522,6 +757,108 @@ class FileDownloader(FrozenModel):
 
         return limits
 
+    def _run(  # noqa: WPS231
+        self,
+        files: Iterable[str | os.PathLike] | None = None,
+        spark: SparkSession | None = None,
+        partitions: int | None = None,
+    ) -> DownloadResult:
+        self._check_strategy()
+
+        if files is None and not self.source_path:
+            raise ValueError("Neither file list nor `source_path` are passed")
+
+        self._log_options(files)
+
+        # Check everything
+        self._check_local_path()
+        self.connection.check()
+        log_with_indent("")
+
+        if self.source_path:
+            self._check_source_path()
+
+        listed = False
+        if files is None:
+            log.info("|%s| File list is not passed to `run` method", self.__class__.__name__)
+
+            files, hwm_filter = self._view_files()
+            listed = True
+            if hwm_filter:
+                self._apply_hwm_retention(hwm_filter)
+
+        sync_index: SyncIndex | None = None
+        if self.options.sync_index:
+            sync_index = SyncIndex(self.options.sync_index)
+
+        try:
+            if self.options.sync_delete:
+                self._delete_removed_files(files, listed, sync_index)
+
+            if not files:
+                log.info("|%s| No files to download!", self.__class__.__name__)
+                return DownloadResult()
+
+            return self._download(files, spark, partitions, sync_index)
+        finally:
+            if sync_index is not None:
+                sync_index.close()
+
+    def _download(  # noqa: WPS231
+        self,
+        files: Iterable[str | os.PathLike],
+        spark: SparkSession | None = None,
+        partitions: int | None = None,
+        sync_index: SyncIndex | None = None,
+    ) -> DownloadResult:
+        current_temp_dir: LocalPath | None = None
+        if self.temp_path:
+            current_temp_dir = generate_temp_path(self.temp_path)
+
+        manifest: ResumeManifest | None = None
+        if self.options.resume_manifest:
+            manifest = ResumeManifest(self.options.resume_manifest)
+
+        to_download, resumed = self._validate_files(files, current_temp_dir=current_temp_dir, manifest=manifest)
+
+        unchanged: FileSet[RemoteFile] = FileSet()
+        if sync_index is not None:
+            to_download, unchanged = self._skip_unchanged_files(to_download, sync_index)
+
+        if current_temp_dir:
+            self._log_temp_path_device(current_temp_dir)
+
+        # remove folder only after everything is checked.
+        # if previous run was interrupted, keep already downloaded files (empty manifest is falsy)
+        if self.options.mode == FileWriteMode.DELETE_ALL and not manifest:
+            if self.local_path.exists():
+                shutil.rmtree(self.local_path)
+            self.local_path.mkdir()
+
+        try:
+            if spark is not None:
+                result = self._download_files_on_spark(spark, to_download, current_temp_dir, partitions)
+            elif self.hwm_type is not None:
+                result = self._download_files_incremental(to_download, manifest, sync_index)
+            else:
+                result = self._download_files(to_download, manifest, sync_index)
+        finally:
+            if manifest is not None:
+                manifest.close()
+
+        result.successful.update(resumed)
+        result.skipped.update(unchanged)
+
+        # in case of download on Spark, temp directory is created only on executors
+        if current_temp_dir and current_temp_dir.exists():
+            self._remove_temp_dir(current_temp_dir)
+
+        if manifest is not None and not result.failed:
+            manifest.remove()
+
+        self._log_result(result)
+        return result
+
     def _check_strategy(self):
         strategy = StrategyManager.get_current()
 
@@ -535,6 +872,34 @@ class FileDownloader(FrozenModel):
             if isinstance(strategy, BatchHWMStrategy):
                 raise ValueError("`hwm_type` cannot be used in batch strategy.")
 
+    def _view_files(self) -> tuple[FileSet[RemoteFile], FileHWMFilter | None]:
+        log.info("|%s| Getting files list from path '%s'", self.connection.__class__.__name__, self.source_path)
+
+        self._check_source_path()
+        result = FileSet()
+
+        filters = compile_filters(self.filters)
+        hwm_filter: FileHWMFilter | None = None
+        if self.hwm_type:
+            min_modified_time = None
+            if self.options.hwm_max_age is not None:
+                min_modified_time = datetime.now(timezone.utc) - self.options.hwm_max_age
+
+            hwm_filter = FileHWMFilter(hwm=self._init_hwm(), min_modified_time=min_modified_time)
+            filters.append(hwm_filter)
+
+        try:
+            for root, _dirs, files in self.connection.walk(self.source_path, filters=filters, limits=self.limits):
+                for file in files:
+                    result.append(RemoteFile(path=root / file, stats=file.stats))
+
+        except Exception as e:
+            raise RuntimeError(
+                f"Couldn't read directory tree from remote dir '{self.source_path}'",
+            ) from e
+
+        return result, hwm_filter
+
     def _init_hwm(self) -> FileHWM:
         strategy: HWMStrategy = StrategyManager.get_current()
 
@@ -551,9 +916,55 @@ class FileDownloader(FrozenModel):
         self._check_hwm_type(file_hwm.__class__)
         return file_hwm
 
-    def _download_files_incremental(self, to_download: DOWNLOAD_ITEMS_TYPE) -> DownloadResult:
-        self._init_hwm()
-        return self._download_files(to_download)
+    def _apply_hwm_retention(self, hwm_filter: FileHWMFilter) -> None:
+        if self.options.hwm_max_age is None and not self.options.hwm_drop_missing:
+            return
+
+        strategy: HWMStrategy = StrategyManager.get_current()
+        file_hwm = strategy.hwm
+
+        keep_missing = not self.options.hwm_drop_missing
+        if not keep_missing and limits_reached(self.limits):
+            log.warning(
+                "|%s| Limits are reached, so some files were not listed. Option `hwm_drop_missing` is ignored",
+                self.__class__.__name__,
+            )
+            keep_missing = True
+
+        listed = hwm_filter.listed_paths
+        expired = hwm_filter.expired_paths
+
+        new_value = set()
+        for path in file_hwm.value:
+            relative_path = os.fspath(path)
+            if relative_path in expired or not (keep_missing or relative_path in listed):
+                continue
+
+            new_value.add(path)
+
+        if new_value == file_hwm.value:
+            return
+
+        log.info(
+            "|%s| Removing %d paths from HWM value according to retention options",
+            self.__class__.__name__,
+            len(file_hwm.value) - len(new_value),
+        )
+        file_hwm.set_value(new_value)
+        strategy.save_hwm()
+
+    def _download_files_incremental(
+        self,
+        to_download: DOWNLOAD_ITEMS_TYPE,
+        manifest: ResumeManifest | None = None,
+        sync_index: SyncIndex | None = None,
+    ) -> DownloadResult:
+        file_hwm = self._init_hwm()
+        if isinstance(file_hwm, FileModifiedSinceHWM):
+            # HWM value cannot decrease, so files should be downloaded from the oldest to the newest one
+            to_download = OrderedSet(sorted(to_download, key=lambda item: self._get_modified_time(item[0])))
+
+        return self._download_files(to_download, manifest, sync_index)
 
     def _log_options(self, files: Iterable[str | os.PathLike] | None = None) -> None:  # noqa: WPS213
         entity_boundary_log(msg="FileDownloader starts")
@@ -591,8 +1002,10 @@ class FileDownloader(FrozenModel):
         self,
         remote_files: Iterable[os.PathLike | str],
         current_temp_dir: LocalPath | None,
-    ) -> DOWNLOAD_ITEMS_TYPE:
+        manifest: ResumeManifest | None = None,
+    ) -> tuple[DOWNLOAD_ITEMS_TYPE, FileSet[LocalPath]]:
         result = OrderedSet()
+        resumed: FileSet[LocalPath] = FileSet()
 
         for file in remote_files:
             remote_file_path = file if isinstance(file, PathProtocol) else RemotePath(file)
@@ -626,16 +1039,122 @@ class FileDownloader(FrozenModel):
                     # Wrong path (not relative path and source path not in the path to the file)
                     raise ValueError(f"File path '{remote_file}' does not match source_path '{self.source_path}'")
 
+            if self.options.compression:
+                local_file = self._get_decompressed_path(local_file)
+                if tmp_file:
+                    tmp_file = self._get_decompressed_path(tmp_file)
+
+            if manifest is not None and manifest.contains(remote_file, local_file):
+                resumed.add(local_file)
+                continue
+
             if self.connection.path_exists(remote_file):
                 remote_file = self.connection.resolve_file(remote_file)
 
             result.add((remote_file, local_file, tmp_file))
 
-        return result
+        if resumed:
+            log.info(
+                "|%s| Skipping %d files already downloaded by previous run, according to resume manifest",
+                self.__class__.__name__,
+                len(resumed),
+            )
+
+        return result, resumed
+
+    def _skip_unchanged_files(
+        self,
+        to_download: DOWNLOAD_ITEMS_TYPE,
+        sync_index: SyncIndex,
+    ) -> tuple[DOWNLOAD_ITEMS_TYPE, FileSet[RemoteFile]]:
+        result = OrderedSet()
+        unchanged: FileSet[RemoteFile] = FileSet()
+
+        for item in to_download:
+            remote_file = item[0]
+            if isinstance(remote_file, PathWithStatsProtocol) and sync_index.is_unchanged(remote_file):
+                unchanged.add(remote_file)
+            else:
+                result.add(item)
+
+        if unchanged:
+            log.info(
+                "|%s| Skipping %d files not changed since previous download, according to sync index",
+                self.__class__.__name__,
+                len(unchanged),
+            )
+
+        return result, unchanged
+
+    def _delete_removed_files(
+        self,
+        files: Iterable[RemoteFile],
+        listed: bool,
+        sync_index: SyncIndex,
+    ) -> None:
+        if not listed:
+            log.warning(
+                "|%s| File list is passed to `run` method explicitly, so option `sync_delete` is ignored",
+                self.__class__.__name__,
+            )
+            return
+
+        if limits_reached(self.limits):
+            log.warning(
+                "|%s| Limits are reached, so some files were not listed. Option `sync_delete` is ignored",
+                self.__class__.__name__,
+            )
+            return
+
+        listed_paths = {os.fspath(file) for file in files}
+        removed = 0
+        for path, entry in sync_index.items():
+            # the same index could be used to mirror several source directories
+            if path in listed_paths or self.source_path not in RemotePath(path).parents:
+                continue
+
+            local_file = LocalPath(entry.local)
+            if local_file.exists():
+                log.info("|Local FS| Removing file '%s' deleted from source", local_file)
+                local_file.unlink()
+
+            sync_index.remove(path)
+            removed += 1
+
+        if removed:
+            log.info(
+                "|%s| Removed %d files deleted from source, according to sync index",
+                self.__class__.__name__,
+                removed,
+            )
+
+    def _get_decompressed_path(self, path: LocalPath) -> LocalPath:
+        extension = self.options.compression.extension
+        # file named just ".gz" keeps its name
+        if path.name.endswith(extension) and path.name != extension:
+            return path.with_name(path.name[: -len(extension)])
+
+        return path
 
     def _check_source_path(self):
         self.connection.resolve_dir(self.source_path)
 
+    def _log_temp_path_device(self, temp_dir: LocalPath) -> None:
+        if is_same_device(temp_dir, self.local_path):
+            log.info(
+                "|Local FS| Temp directory and local directory are on the same filesystem, "
+                "downloaded files will be moved using atomic rename",
+            )
+            return
+
+        log.warning(
+            "|Local FS| Temp directory '%s' and local directory '%s' are on different filesystems, "
+            "so each downloaded file will be copied to local directory. "
+            "This is slower than rename, consider using `temp_path` located on the same filesystem as `local_path`",
+            temp_dir,
+            self.local_path,
+        )
+
     def _check_local_path(self):
         if self.local_path.exists() and not self.local_path.is_dir():
             raise NotADirectoryError(f"{path_repr(self.local_path)} is not a directory")
@@ -645,38 +1164,112 @@ class FileDownloader(FrozenModel):
     def _download_files(
         self,
         to_download: DOWNLOAD_ITEMS_TYPE,
+        manifest: ResumeManifest | None = None,
+        sync_index: SyncIndex | None = None,
     ) -> DownloadResult:
         total_files = len(to_download)
         files = FileSet(item[0] for item in to_download)
 
         log.info("|%s| Files to be downloaded:", self.__class__.__name__)
-        log_lines(str(files))
+        log_lines(files._details(self.options.max_logged_files))  # noqa: WPS437
         log_with_indent("")
         log.info("|%s| Starting the download process", self.__class__.__name__)
 
+        # messages about each file are too verbose for large number of files, log only progress instead
+        verbose = self.options.max_logged_files is None or total_files <= self.options.max_logged_files
+        level = logging.INFO if verbose else logging.DEBUG
+        progress = ProgressLog(name=self.__class__.__name__, action="Downloaded", total=total_files)
+
         result = DownloadResult()
         for i, (source_file, local_file, tmp_file) in enumerate(to_download):
-            log.info("|%s| Downloading file %d of %d", self.__class__.__name__, i + 1, total_files)
-            log_with_indent("from = '%s'", source_file)
+            log.log(level, "|%s| Downloading file %d of %d", self.__class__.__name__, i + 1, total_files)
+            log_with_indent("from = '%s'", source_file, level=level)
             if tmp_file:
-                log_with_indent("temp = '%s'", tmp_file)
-            log_with_indent("to = '%s'", local_file)
+                log_with_indent("temp = '%s'", tmp_file, level=level)
+            log_with_indent("to = '%s'", local_file, level=level)
 
             self._download_file(
                 source_file,
                 local_file,
                 tmp_file,
                 result,
+                manifest,
+                sync_index,
             )
 
+            if not verbose:
+                progress.update(handled=i + 1, size=result.successful_size)
+
         return result
 
+    def _download_files_on_spark(
+        self,
+        spark: SparkSession,
+        to_download: DOWNLOAD_ITEMS_TYPE,
+        current_temp_dir: LocalPath | None,
+        partitions: int | None,
+    ) -> DownloadResult:
+        total_files = len(to_download)
+        files = FileSet(item[0] for item in to_download)
+
+        log.info("|%s| Files to be downloaded:", self.__class__.__name__)
+        log_lines(files._details(self.options.max_logged_files))  # noqa: WPS437
+        log_with_indent("")
+
+        result = DownloadResult()
+        if not total_files:
+            return result
+
+        partitions = min(partitions or spark.sparkContext.defaultParallelism, total_files)
+        log.info(
+            "|%s| Starting the download process on Spark executors, using %d tasks",
+            self.__class__.__name__,
+            partitions,
+        )
+
+        # client and cache of current connection cannot be serialized, so executors are using a new one.
+        # HWM is updated on the driver, after all files are downloaded
+        connection = self.connection.__class__.parse_obj(self.connection.dict())
+        downloader = self.copy(update={"connection": connection, "hwm_type": None})
+
+        rdd = spark.sparkContext.parallelize(list(to_download), partitions)
+        task_results = rdd.mapPartitionsWithIndex(partial(_download_partition, downloader, current_temp_dir)).collect()
+
+        for task_result in task_results:
+            result.successful.update(task_result.successful)
+            result.failed.update(task_result.failed)
+            result.skipped.update(task_result.skipped)
+            result.missing.update(task_result.missing)
+            result.checksums.update(task_result.checksums)
+            result.original_sizes.update(task_result.original_sizes)
+
+        if self.hwm_type:
+            self._update_hwm(to_download, result)
+
+        return result
+
+    def _update_hwm(self, to_download: DOWNLOAD_ITEMS_TYPE, result: DownloadResult) -> None:
+        remote_files = {local_file: remote_file for remote_file, local_file, _ in to_download}
+        handled = [remote_files[local_file] for local_file in result.successful]
+
+        strategy = StrategyManager.get_current()
+        if result.failed and isinstance(strategy.hwm, FileModifiedSinceHWM):
+            # same as sequential download, files with greater modification time than failed one
+            # should not be marked as handled
+            first_failed = min(self._get_modified_time(file) for file in result.failed)
+            handled = [file for file in handled if self._get_modified_time(file) < first_failed]
+
+        strategy.hwm.update(handled)
+        strategy.save_hwm()
+
     def _download_file(  # noqa: WPS231, WPS213
         self,
         source_file: RemotePath,
         local_file: LocalPath,
         tmp_file: LocalPath | None,
         result: DownloadResult,
+        manifest: ResumeManifest | None = None,
+        sync_index: SyncIndex | None = None,
     ) -> None:
         if not self.connection.path_exists(source_file):
             log.warning("|%s| Missing file '%s', skipping", self.__class__.__name__, source_file)
@@ -685,46 +1278,63 @@ class FileDownloader(FrozenModel):
 
         try:
             remote_file = self.connection.resolve_file(source_file)
+            checksum = FileChecksum(self.options.checksum_algorithm) if self.options.checksum_algorithm else None
 
             replace = False
             if local_file.exists():
-                if self.options.mode == FileWriteMode.ERROR:
+                if sync_index is not None and remote_file in sync_index:
+                    # file was downloaded by previous run, and then changed on source
+                    replace = True
+                elif self.options.mode == FileWriteMode.ERROR:
                     raise FileExistsError(f"File {path_repr(local_file)} already exists")
 
-                if self.options.mode == FileWriteMode.IGNORE:
+                elif self.options.mode == FileWriteMode.IGNORE:
                     log.warning("|Local FS| File %s already exists, skipping", path_repr(local_file))
                     result.skipped.add(remote_file)
                     return
-
-                replace = True
+                else:
+                    replace = True
 
             if tmp_file:
                 # Files are loaded to temporary directory before moving them to target dir.
                 # This prevents operations with partly downloaded files
 
-                self.connection.download_file(remote_file, tmp_file, replace=replace)
+                self._transfer_file(remote_file, tmp_file, replace=replace, checksum=checksum)
 
-                # remove existing file only after new file is downloaded
+                # existing file is replaced only after new file is downloaded
                 # to avoid issues then there is no free space to download new file, but existing one is already gone
                 if replace and local_file.exists():
                     log.warning("|Local FS| File %s already exists, overwriting", path_repr(local_file))
-                    local_file.unlink()
 
                 local_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(tmp_file, local_file)
+                move_file(tmp_file, local_file)
             else:
                 # Direct download
-                self.connection.download_file(remote_file, local_file, replace=replace)
+                self._transfer_file(remote_file, local_file, replace=replace, checksum=checksum)
 
             if self.hwm_type:
                 strategy = StrategyManager.get_current()
-                strategy.hwm.update(remote_file)
-                strategy.save_hwm()
+                # if some file was failed, files with greater modification time should not be marked as handled
+                if not (result.failed and isinstance(strategy.hwm, FileModifiedSinceHWM)):
+                    strategy.hwm.update(remote_file)
+                    strategy.save_hwm()
 
             # Delete Remote
             if self.options.delete_source:
                 self.connection.remove_file(remote_file)
 
+            if manifest is not None:
+                manifest.add(remote_file, local_file)
+
+            if checksum is not None:
+                result.checksums[local_file] = checksum.hexdigest()
+
+            if self.options.compression:
+                result.original_sizes[local_file] = remote_file.stat().st_size
+
+            if sync_index is not None:
+                sync_index.add(remote_file, local_file, result.checksums.get(local_file))
+
             result.successful.add(local_file)
 
         except Exception as e:
@@ -743,6 +1353,28 @@ class FileDownloader(FrozenModel):
                 )
             result.failed.add(FailedRemoteFile(path=remote_file.path, stats=remote_file.stats, exception=e))
 
+    def _transfer_file(
+        self,
+        remote_file: RemoteFile,
+        local_file: LocalPath,
+        replace: bool,
+        checksum: FileChecksum | None,
+    ) -> None:
+        if not self.options.compression:
+            self.connection.download_file(remote_file, local_file, replace=replace, checksum=checksum)
+            return
+
+        # decompressed content is written directly to local file, without saving compressed file to disk
+        local_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with self.connection.open(remote_file, "rb") as source, open(local_file, "wb") as target:
+                with self.options.compression.decompress(source) as stream:
+                    shutil.copyfileobj(stream, target, DEFAULT_CHUNK_SIZE)
+        except Exception:
+            with contextlib.suppress(OSError):
+                local_file.unlink()
+            raise
+
     def _remove_temp_dir(self, temp_dir: LocalPath) -> None:
         log.info("|Local FS| Removing temp directory '%s'", temp_dir)
 
@@ -754,12 +1386,47 @@ class FileDownloader(FrozenModel):
     def _log_result(self, result: DownloadResult) -> None:
         log_with_indent("")
         log.info("|%s| Download result:", self.__class__.__name__)
-        log_lines(str(result))
+        log_lines(result._details(self.options.max_logged_files))  # noqa: WPS437
         entity_boundary_log(msg=f"{self.__class__.__name__} ends", char="-")
 
+    @staticmethod
+    def _get_modified_time(path: PathProtocol) -> float:
+        if isinstance(path, PathWithStatsProtocol):
+            return path.stat().st_mtime or 0
+
+        return 0
+
     @staticmethod
     def _check_hwm_type(hwm_type: type[HWM]) -> None:
         if not issubclass(hwm_type, FileHWM):
             raise ValueError(
                 f"`hwm_type` class should be a inherited from FileHWM, got {hwm_type.__name__}",
             )
+
+
+def _download_partition(
+    downloader: FileDownloader,
+    temp_dir: LocalPath | None,
+    index: int,
+    items: Iterable[tuple[RemotePath, LocalPath, LocalPath | None]],
+) -> Iterator[DownloadResult]:
+    # executed by Spark executor.
+    # several tasks can be executed on the same host at the same time, so each one is using its own temp directory
+    task_temp_dir = temp_dir / f"task_{index}" if temp_dir else None
+
+    result = DownloadResult()
+    try:
+        for source_file, local_file, tmp_file in items:
+            if task_temp_dir and tmp_file:
+                tmp_file = task_temp_dir / tmp_file.relative_to(temp_dir)
+
+            downloader._download_file(source_file, local_file, tmp_file, result)  # noqa: WPS437
+    finally:
+        downloader.connection.close()
+        if task_temp_dir:
+            shutil.rmtree(task_temp_dir, ignore_errors=True)
+            # directory is not empty if other tasks are still running on the same host
+            with contextlib.suppress(OSError):
+                temp_dir.rmdir()
+
+    yield result
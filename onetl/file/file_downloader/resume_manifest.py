@@ -0,0 +1,145 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import IO, Optional, Tuple
+
+from onetl.base import PathProtocol, PathWithStatsProtocol
+from onetl.impl import LocalPath
+
+log = logging.getLogger(__name__)
+
+# remote file size and modification time
+ENTRY_TYPE = Tuple[int, Optional[float]]
+
+
+class ResumeManifest:
+    """
+    Append-only local file with a list of downloaded files, used to resume interrupted download.
+
+    Each line is a JSON object with path, size and modification time of remote file, and path and size of local file.
+    Line is flushed right after the file is downloaded, so if process is killed, all the downloaded files
+    are already recorded. Incomplete last line (e.g. if process was killed while writing it) is ignored.
+
+    .. warning::
+
+        Only for onETL internal use.
+    """
+
+    def __init__(self, path: os.PathLike | str):
+        self.path = LocalPath(path)
+        self._entries: dict[str, ENTRY_TYPE] = {}
+        # local file size could differ from remote one, e.g. if file was decompressed while downloading
+        self._local_sizes: dict[str, int] = {}
+        self._file: IO[str] | None = None
+        # last line could be written partially, e.g. if process was killed
+        self._ends_with_newline = True
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, remote_file: PathProtocol, local_file: LocalPath) -> bool:
+        """
+        Check if remote file was already downloaded to local file, and since that both of them are not changed.
+
+        If remote file has no stats (e.g. path was passed explicitly instead of listing ``source_path``),
+        only local file is checked, so no remote calls are made.
+        """
+
+        entry = self._entries.get(os.fspath(remote_file))
+        if entry is None:
+            return False
+
+        if isinstance(remote_file, PathWithStatsProtocol) and entry != self._get_entry(remote_file):
+            return False
+
+        # local file could be removed or replaced after it was downloaded
+        try:
+            return local_file.stat().st_size == self._local_sizes.get(os.fspath(remote_file), entry[0])
+        except OSError:
+            return False
+
+    def add(self, remote_file: PathWithStatsProtocol, local_file: LocalPath) -> None:
+        size, mtime = self._get_entry(remote_file)
+        local_size = local_file.stat().st_size
+        line = json.dumps(
+            {
+                "path": os.fspath(remote_file),
+                "size": size,
+                "mtime": mtime,
+                "local": os.fspath(local_file),
+                "local_size": local_size,
+            },
+        )
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+            if not self._ends_with_newline:
+                # do not append new entry to incomplete line
+                self._file.write("\n")
+                self._ends_with_newline = True
+
+        self._file.write(line + "\n")
+        self._file.flush()
+        self._entries[os.fspath(remote_file)] = (size, mtime)
+        self._local_sizes[os.fspath(remote_file)] = local_size
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        self.close()
+        self._entries.clear()
+        self._local_sizes.clear()
+        if self.path.exists():
+            log.info("|Local FS| Removing resume manifest '%s'", self.path)
+            self.path.unlink()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as file:
+            for line in file:
+                self._ends_with_newline = line.endswith("\n")
+                try:
+                    item = json.loads(line)
+                    path, entry = item["path"], (item["size"], item["mtime"])
+                except (ValueError, KeyError, TypeError):
+                    log.warning("|Local FS| Skipping malformed line in resume manifest '%s': %r", self.path, line)
+                    continue
+
+                self._entries[path] = entry
+                if "local_size" in item:
+                    self._local_sizes[path] = item["local_size"]
+
+        if self._entries:
+            log.info(
+                "|Local FS| Resume manifest '%s' contains %d downloaded files",
+                self.path,
+                len(self._entries),
+            )
+
+    @staticmethod
+    def _get_entry(remote_file: PathWithStatsProtocol) -> ENTRY_TYPE:
+        stat = remote_file.stat()
+        return stat.st_size, stat.st_mtime
@@ -0,0 +1,118 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from typing import Iterator, NamedTuple, Optional
+
+from onetl.base import PathProtocol, PathWithStatsProtocol
+from onetl.impl import LocalPath
+
+log = logging.getLogger(__name__)
+
+
+class SyncIndexEntry(NamedTuple):
+    size: int
+    mtime: Optional[float]
+    checksum: Optional[str]
+    local: str
+
+
+class SyncIndex:
+    """
+    Local SQLite database with path, size, modification time and checksum of each downloaded remote file,
+    and path of local file it was downloaded to. Used to mirror remote directory to a local one.
+
+    All entries are loaded into memory when index is opened, so decisions are made without any queries.
+    Each change is committed immediately, so if process is killed, all the downloaded files are already recorded.
+
+    .. warning::
+
+        Only for onETL internal use.
+    """
+
+    def __init__(self, path: os.PathLike | str):
+        self.path = LocalPath(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(os.fspath(self.path))
+        # commit does not wait for fsync, but database cannot be corrupted by process crash
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL,
+                checksum TEXT,
+                local TEXT NOT NULL
+            )
+            """,
+        )
+        self._connection.commit()
+
+        self._entries: dict[str, SyncIndexEntry] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, remote_file: PathProtocol) -> bool:
+        return os.fspath(remote_file) in self._entries
+
+    def items(self) -> Iterator[tuple[str, SyncIndexEntry]]:
+        # copy, to allow removing entries while iterating
+        yield from list(self._entries.items())
+
+    def is_unchanged(self, remote_file: PathWithStatsProtocol) -> bool:
+        """
+        Check if remote file was already downloaded, and its size and modification time are not changed since that.
+        """
+
+        entry = self._entries.get(os.fspath(remote_file))
+        if entry is None:
+            return False
+
+        stat = remote_file.stat()
+        return (entry.size, entry.mtime) == (stat.st_size, stat.st_mtime)
+
+    def add(self, remote_file: PathWithStatsProtocol, local_file: LocalPath, checksum: str | None = None) -> None:
+        stat = remote_file.stat()
+        entry = SyncIndexEntry(size=stat.st_size, mtime=stat.st_mtime, checksum=checksum, local=os.fspath(local_file))
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime, checksum, local) VALUES (?, ?, ?, ?, ?)",
+            (os.fspath(remote_file), *entry),
+        )
+        self._connection.commit()
+        self._entries[os.fspath(remote_file)] = entry
+
+    def remove(self, path: os.PathLike | str) -> None:
+        self._connection.execute("DELETE FROM files WHERE path = ?", (os.fspath(path),))
+        self._connection.commit()
+        self._entries.pop(os.fspath(path), None)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _load(self) -> None:
+        for path, *fields in self._connection.execute("SELECT path, size, mtime, checksum, local FROM files"):
+            self._entries[path] = SyncIndexEntry(*fields)
+
+        if self._entries:
+            log.info("|Local FS| Sync index '%s' contains %d downloaded files", self.path, len(self._entries))
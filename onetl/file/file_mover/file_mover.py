@@ -25,6 +25,7 @@ from onetl.base import BaseFileConnection, BaseFileFilter, BaseFileLimit
 from onetl.base.path_protocol import PathProtocol
 from onetl.file.file_mover.move_result import MoveResult
 from onetl.file.file_set import FileSet
+from onetl.file.filter.compile_filters import compile_filters
 from onetl.impl import (
     FailedRemoteFile,
     FileWriteMode,
@@ -35,6 +36,7 @@ from onetl.impl import (
     path_repr,
 )
 from onetl.log import (
+    ProgressLog,
     entity_boundary_log,
     log_collection,
     log_lines,
@@ -154,6 +156,17 @@ class FileMover(FrozenModel):
             * ``delete_all`` - delete directory content before moving files
         """
 
+        max_logged_files: Optional[int] = Field(default=100, ge=0)
+        """
+        Max number of files printed in logs, both in a list of files to move and in a move result.
+        Other files are replaced with ``... and N more files`` line.
+
+        If number of files to move is larger than this value, messages about each file
+        are logged with ``DEBUG`` level, and a progress message is logged with ``INFO`` level every 10 seconds.
+
+        ``None`` means no limit.
+        """
+
     connection: BaseFileConnection
 
     target_path: RemotePath
@@ -349,9 +362,10 @@ class FileMover(FrozenModel):
 
         self._check_source_path()
         result = FileSet()
+        filters = compile_filters(self.filters)
 
         try:
-            for root, _dirs, files in self.connection.walk(self.source_path, filters=self.filters, limits=self.limits):
+            for root, _dirs, files in self.connection.walk(self.source_path, filters=filters, limits=self.limits):
                 for file in files:
                     result.append(RemoteFile(path=root / file, stats=file.stats))
 
@@ -451,15 +465,20 @@ class FileMover(FrozenModel):
         files = FileSet(item[0] for item in to_move)
 
         log.info("|%s| Files to be moved:", self.__class__.__name__)
-        log_lines(str(files))
+        log_lines(files._details(self.options.max_logged_files))  # noqa: WPS437
         log_with_indent("")
         log.info("|%s| Starting the move process", self.__class__.__name__)
 
+        # messages about each file are too verbose for large number of files, log only progress instead
+        verbose = self.options.max_logged_files is None or total_files <= self.options.max_logged_files
+        level = logging.INFO if verbose else logging.DEBUG
+        progress = ProgressLog(name=self.__class__.__name__, action="Moved", total=total_files)
+
         result = MoveResult()
         for i, (source_file, target_file) in enumerate(to_move):
-            log.info("|%s| Moving file %d of %d", self.__class__.__name__, i + 1, total_files)
-            log_with_indent("from = '%s'", source_file)
-            log_with_indent("to = '%s'", target_file)
+            log.log(level, "|%s| Moving file %d of %d", self.__class__.__name__, i + 1, total_files)
+            log_with_indent("from = '%s'", source_file, level=level)
+            log_with_indent("to = '%s'", target_file, level=level)
 
             self._move_file(
                 source_file,
@@ -467,6 +486,9 @@ class FileMover(FrozenModel):
                 result,
             )
 
+            if not verbose:
+                progress.update(handled=i + 1, size=result.successful_size)
+
         return result
 
     def _move_file(  # noqa: WPS231, WPS213
@@ -521,5 +543,5 @@ class FileMover(FrozenModel):
     def _log_result(self, result: MoveResult) -> None:
         log_with_indent("")
         log.info("|%s| Move result:", self.__class__.__name__)
-        log_lines(str(result))
+        log_lines(result._details(self.options.max_logged_files))  # noqa: WPS437
         entity_boundary_log(msg=f"{self.__class__.__name__} ends", char="-")
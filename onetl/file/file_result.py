@@ -308,7 +308,7 @@ class FileResult(BaseModel):
         """
 
         if self.failed:
-            raise FailedFilesError(self._failed_message)
+            raise FailedFilesError(self._failed_message())
 
     def raise_if_missing(self) -> None:
         """
@@ -344,7 +344,7 @@ class FileResult(BaseModel):
         """
 
         if self.missing:
-            raise MissingFilesError(self._missing_message)
+            raise MissingFilesError(self._missing_message())
 
     def raise_if_skipped(self) -> None:
         """
@@ -377,7 +377,7 @@ class FileResult(BaseModel):
         """
 
         if self.skipped:
-            raise SkippedFilesError(self._skipped_message)
+            raise SkippedFilesError(self._skipped_message())
 
     def raise_if_contains_zero_size(self) -> None:
         """
@@ -534,17 +534,7 @@ class FileResult(BaseModel):
             assert file_result2.details == details2
         '''
 
-        result = []
-
-        if self.successful or self.failed or self.missing or self.skipped:
-            result.append(self._total_summary)
-
-        result.append(self._successful_message)
-        result.append(self._failed_message)
-        result.append(self._skipped_message)
-        result.append(self._missing_message)
-
-        return (os.linesep * 2).join(result)
+        return self._details()
 
     @property
     def summary(self) -> str:
@@ -590,6 +580,20 @@ class FileResult(BaseModel):
         """Same as :obj:`onetl.file.file_result.FileResult.details`"""
         return self.details
 
+    def _details(self, max_files: int | None = None) -> str:
+        # used for logging, to avoid printing millions of lines
+        result = []
+
+        if self.successful or self.failed or self.missing or self.skipped:
+            result.append(self._total_summary)
+
+        result.append(self._successful_message(max_files))
+        result.append(self._failed_message(max_files))
+        result.append(self._skipped_message(max_files))
+        result.append(self._missing_message(max_files))
+
+        return (os.linesep * 2).join(result)
+
     @property
     def _total_summary(self) -> str:
         if self.successful or self.failed or self.missing or self.skipped:
@@ -605,12 +609,11 @@ class FileResult(BaseModel):
 
         return "Successful: " + self.successful.summary
 
-    @property
-    def _successful_message(self) -> str:
+    def _successful_message(self, max_files: int | None = None) -> str:
         if not self.successful:
             return self._successful_summary
 
-        return "Successful " + self.successful.details
+        return "Successful " + self.successful._details(max_files)  # noqa: WPS437
 
     @property
     def _failed_summary(self) -> str:
@@ -619,12 +622,11 @@ class FileResult(BaseModel):
 
         return "Failed: " + self.failed.summary
 
-    @property
-    def _failed_message(self) -> str:
+    def _failed_message(self, max_files: int | None = None) -> str:
         if not self.failed:
             return self._failed_summary
 
-        return "Failed " + self.failed.details
+        return "Failed " + self.failed._details(max_files)  # noqa: WPS437
 
     @property
     def _skipped_summary(self) -> str:
@@ -633,12 +635,11 @@ class FileResult(BaseModel):
 
         return "Skipped: " + self.skipped.summary
 
-    @property
-    def _skipped_message(self) -> str:
+    def _skipped_message(self, max_files: int | None = None) -> str:
         if not self.skipped:
             return self._skipped_summary
 
-        return "Skipped " + self.skipped.details
+        return "Skipped " + self.skipped._details(max_files)  # noqa: WPS437
 
     @property
     def _missing_summary(self) -> str:
@@ -647,12 +648,11 @@ class FileResult(BaseModel):
 
         return "Missing: " + self.missing.summary.replace(" (size='0 Bytes')", "")
 
-    @property
-    def _missing_message(self) -> str:
+    def _missing_message(self, max_files: int | None = None) -> str:
         if not self.missing:
             return self._missing_summary
 
-        return "Missing " + self.missing.details.replace(" (size='0 Bytes')", "")
+        return "Missing " + self.missing._details(max_files).replace(" (size='0 Bytes')", "")  # noqa: WPS437
 
     @property
     def _total_message(self) -> str:
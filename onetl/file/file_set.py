@@ -14,7 +14,8 @@
 
 import os
 import textwrap
-from typing import Generic, TypeVar
+from itertools import islice
+from typing import Dict, Generic, Iterable, Optional, TypeVar
 
 from humanize import naturalsize
 from ordered_set import OrderedSet
@@ -35,13 +36,54 @@ class FileSet(OrderedSet[T], Generic[T]):
     as well as list (e.g. ``append``, ``index``, ``[]``).
 
     It also has a ``total_size`` helper method.
+
+    Size of each file is calculated only once, while adding it to the set,
+    so getting ``total_size`` does not require accessing the filesystem.
     """
 
+    def __init__(self, initial: Optional[Iterable[T]] = None):
+        self._sizes: Dict[T, int] = {}
+        self._total_size = 0
+        if isinstance(initial, FileSet):
+            # sizes are already known, so copying the set does not access filesystem again
+            self._sizes.update(initial._sizes)  # noqa: WPS437
+
+        super().__init__(initial)
+
+    def add(self, key: T) -> int:
+        if key not in self.map:
+            size = self._sizes[key] if key in self._sizes else self._get_size(key)
+            self._sizes[key] = size
+            self._total_size += size
+
+        return super().add(key)
+
+    append = add
+
+    def pop(self, index: int = -1) -> T:
+        item = super().pop(index)
+        self._total_size -= self._sizes.pop(item, 0)
+        return item
+
+    def discard(self, key: T) -> None:
+        if key in self.map:
+            self._total_size -= self._sizes.pop(key, 0)
+
+        super().discard(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self._sizes.clear()
+        self._total_size = 0
+
     @property
     def total_size(self) -> int:
         """
         Get total size (in bytes) of files in the set
 
+        Size of file is calculated while adding it to the set.
+        Files which do not exist at that moment, or have no stats, have zero size.
+
         Examples
         --------
 
@@ -55,9 +97,7 @@ class FileSet(OrderedSet[T], Generic[T]):
             assert path_set.total_size == 1_000_000  # in bytes
         """
 
-        return sum(
-            file.stat().st_size or 0 for file in self if isinstance(file, PathWithStatsProtocol) and file.exists()
-        )
+        return self._total_size
 
     def raise_if_empty(self) -> None:
         """
@@ -199,16 +239,38 @@ class FileSet(OrderedSet[T], Generic[T]):
             assert FileSet().details == "No files"
         '''
 
+        return self._details()
+
+    def __str__(self) -> str:
+        """Same as :obj:`onetl.file.file_set.file_set.FileSet.details`"""
+        return self.details
+
+    def _details(self, max_files: Optional[int] = None) -> str:
+        # used for logging, to avoid printing millions of lines
         if not self:
             return self.summary
 
-        lines = [path_repr(file, with_mode=False, with_kind=False, with_owner=False, with_mtime=False) for file in self]
+        files = self if max_files is None else islice(self, max_files)
+        lines = [path_repr(file, with_mode=False, with_kind=False, with_owner=False, with_mtime=False) for file in files]
+
+        if max_files is not None and len(self) > max_files:
+            hidden = len(self) - max_files
+            lines.append(f"... and {hidden} more files" if hidden > 1 else "... and 1 more file")
 
         summary = f"{self.summary}:{os.linesep}{INDENT}"
 
         lines_str = textwrap.indent(os.linesep.join(lines), INDENT).strip()
         return summary + lines_str
 
-    def __str__(self) -> str:
-        """Same as :obj:`onetl.file.file_set.file_set.FileSet.details`"""
-        return self.details
+    def _update_items(self, items: list) -> None:
+        # used by methods like difference_update or symmetric_difference_update
+        super()._update_items(items)
+        self._sizes = {item: self._sizes[item] if item in self._sizes else self._get_size(item) for item in items}
+        self._total_size = sum(self._sizes.values())
+
+    @staticmethod
+    def _get_size(file: T) -> int:
+        if isinstance(file, PathWithStatsProtocol) and file.exists():
+            return file.stat().st_size or 0
+
+        return 0
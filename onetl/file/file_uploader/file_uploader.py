@@ -16,18 +16,23 @@ from __future__ import annotations
 
 import logging
 import os
+import secrets
+import shutil
 from typing import Iterable, Optional, Tuple
 
 from ordered_set import OrderedSet
-from pydantic import validator
+from pydantic import ByteSize, Field, validator
 
 from onetl._internal import generate_temp_path  # noqa: WPS436
-from onetl.base import BaseFileConnection
+from onetl.base import BaseFileConnection, PathWithStatsProtocol
 from onetl.exception import DirectoryNotFoundError, NotAFileError
 from onetl.file.file_set import FileSet
+from onetl.file.file_uploader.tar_pack import MANIFEST_SUFFIX, TarPack
 from onetl.file.file_uploader.upload_result import UploadResult
 from onetl.impl import (
     FailedLocalFile,
+    FileChecksum,
+    FileCompression,
     FileWriteMode,
     FrozenModel,
     GenericOptions,
@@ -35,7 +40,14 @@ from onetl.impl import (
     RemotePath,
     path_repr,
 )
-from onetl.log import entity_boundary_log, log_lines, log_options, log_with_indent
+from onetl.impl.remote_file_stream import DEFAULT_CHUNK_SIZE
+from onetl.log import (
+    ProgressLog,
+    entity_boundary_log,
+    log_lines,
+    log_options,
+    log_with_indent,
+)
 
 log = logging.getLogger(__name__)
 
@@ -149,6 +161,91 @@ class FileUploader(FrozenModel):
         If download failed, file will left intact.
         """
 
+        max_logged_files: Optional[int] = Field(default=100, ge=0)
+        """
+        Max number of files printed in logs, both in a list of files to upload and in an upload result.
+        Other files are replaced with ``... and N more files`` line.
+
+        If number of files to upload is larger than this value, messages about each file
+        are logged with ``DEBUG`` level, and a progress message is logged with ``INFO`` level every 10 seconds.
+
+        ``None`` means no limit.
+        """
+
+        checksum_algorithm: Optional[str] = None
+        """
+        If set, checksum of each file is calculated while it is being uploaded,
+        and saved to ``checksums`` attribute of upload result.
+
+        If the target filesystem provides checksum of an uploaded file with the same algorithm,
+        it is compared with the calculated one, and in case of mismatch file is marked as failed
+        with :obj:`onetl.exception.FileChecksumMismatchError`. Supported by:
+            * S3 - ``md5`` (only for files small enough to be uploaded without multipart upload)
+            * SFTP - ``md5``, ``sha1``, ``sha256``, ``sha512``, ``crc32``
+              (only if server supports ``check-file`` extension)
+            * HDFS - ``crc32c`` (only if cluster has ``dfs.checksum.combine.mode=COMPOSITE_CRC``)
+
+        See :obj:`onetl.impl.FileChecksum` for a list of supported algorithms.
+
+        .. note::
+
+            File content is streamed through Python process instead of using a native upload method of a client,
+            which can be slower for some filesystems.
+        """
+
+        compression: Optional[FileCompression] = None
+        """
+        If set, files are compressed while they are being uploaded, using specified codec
+        (``gzip``, ``bz2`` or ``zstd``). Only compressed content is written to ``target_path``,
+        and codec extension (like ``.gz``) is added to the target file name.
+
+        Sizes of local files are saved to ``original_sizes`` attribute of upload result.
+
+        Cannot be used with ``checksum_algorithm``.
+        """
+
+        pack_size: Optional[ByteSize] = None
+        """
+        If set, files are not uploaded one by one, but packed into uncompressed ``.tar`` archives
+        which are uploaded to ``target_path`` instead, like ``part-2bb0a5a8e1-00000.tar``.
+        Files are added to an archive in the same order until its size reaches the specified value,
+        e.g. ``128MiB``. File larger than this value is packed into a separate archive.
+
+        Relative paths of files (like ``nested/path/file3``) are used as names inside the archive.
+        For each archive, a manifest ``part-2bb0a5a8e1-00000.tar.manifest.jsonl`` is uploaded,
+        each line of it contains name, offset and size of a file content in the archive.
+        So any file can be read without unpacking the archive, by seeking to its offset.
+
+        Useful for uploading a large number of small files, e.g. to HDFS, where each file
+        is an object in NameNode memory, and uploading each file requires several requests.
+
+        Archive each local file was packed to is saved to ``packed`` attribute of upload result.
+        Because target files are not created, ``mode`` options are not applied to them.
+
+        Cannot be used with ``checksum_algorithm`` and ``compression``.
+        """
+
+        @validator("checksum_algorithm")
+        def _validate_checksum_algorithm(cls, checksum_algorithm):
+            return FileChecksum(checksum_algorithm).algorithm
+
+        @validator("compression")
+        def _validate_compression(cls, compression, values):
+            if compression and values.get("checksum_algorithm"):
+                raise ValueError("Options `compression` and `checksum_algorithm` cannot be used together")
+            return compression
+
+        @validator("pack_size")
+        def _validate_pack_size(cls, pack_size, values):
+            if not pack_size:
+                return pack_size
+
+            for option in ("checksum_algorithm", "compression"):
+                if values.get(option):
+                    raise ValueError(f"Options `pack_size` and `{option}` cannot be used together")
+
+            return pack_size
+
     connection: BaseFileConnection
 
     target_path: RemotePath
@@ -310,7 +407,10 @@ class FileUploader(FrozenModel):
         if current_temp_dir:
             current_temp_dir = self.connection.create_dir(current_temp_dir)
 
-        result = self._upload_files(to_upload)
+        if self.options.pack_size:
+            result = self._upload_packs(to_upload, current_temp_dir)
+        else:
+            result = self._upload_files(to_upload)
 
         if current_temp_dir:
             self._remove_temp_dir(current_temp_dir)
@@ -449,6 +549,12 @@ class FileUploader(FrozenModel):
             if local_file.exists() and not local_file.is_file():
                 raise NotAFileError(f"{path_repr(local_file)} is not a file")
 
+            if self.options.compression:
+                extension = self.options.compression.extension
+                target_file = target_file.with_name(target_file.name + extension)
+                if tmp_file:
+                    tmp_file = tmp_file.with_name(tmp_file.name + extension)
+
             result.add((local_file, target_file, tmp_file))
 
         return result
@@ -465,20 +571,28 @@ class FileUploader(FrozenModel):
         files = FileSet(item[0] for item in to_upload)
 
         log.info("|%s| Files to be uploaded:", self.__class__.__name__)
-        log_lines(str(files))
+        log_lines(files._details(self.options.max_logged_files))  # noqa: WPS437
         log_with_indent("")
         log.info("|%s| Starting the upload process", self.__class__.__name__)
 
+        # messages about each file are too verbose for large number of files, log only progress instead
+        verbose = self.options.max_logged_files is None or total_files <= self.options.max_logged_files
+        level = logging.INFO if verbose else logging.DEBUG
+        progress = ProgressLog(name=self.__class__.__name__, action="Uploaded", total=total_files)
+
         result = UploadResult()
         for i, (local_file, target_file, tmp_file) in enumerate(to_upload):
-            log.info("|%s| Uploading file %d of %d", self.__class__.__name__, i + 1, total_files)
-            log_with_indent("from = '%s'", local_file)
+            log.log(level, "|%s| Uploading file %d of %d", self.__class__.__name__, i + 1, total_files)
+            log_with_indent("from = '%s'", local_file, level=level)
             if tmp_file:
-                log_with_indent("temp = '%s'", tmp_file)
-            log_with_indent("to = '%s'", target_file)
+                log_with_indent("temp = '%s'", tmp_file, level=level)
+            log_with_indent("to = '%s'", target_file, level=level)
 
             self._upload_file(local_file, target_file, tmp_file, result)
 
+            if not verbose:
+                progress.update(handled=i + 1, size=result.successful_size)
+
         return result
 
     def _upload_file(  # noqa: WPS231
@@ -494,6 +608,7 @@ class FileUploader(FrozenModel):
             return
 
         try:
+            checksum = FileChecksum(self.options.checksum_algorithm) if self.options.checksum_algorithm else None
             replace = False
             if self.connection.path_exists(target_file):
                 file = self.connection.resolve_file(target_file)
@@ -511,16 +626,23 @@ class FileUploader(FrozenModel):
                 # Files are loaded to temporary directory before moving them to target dir.
                 # This prevents operations with partly uploaded files
 
-                self.connection.upload_file(local_file, tmp_file)
+                self._transfer_file(local_file, tmp_file, replace=False, checksum=checksum)
                 uploaded_file = self.connection.rename_file(tmp_file, target_file, replace=replace)
             else:
                 # Direct upload
-                uploaded_file = self.connection.upload_file(local_file, target_file, replace=replace)
+                uploaded_file = self._transfer_file(local_file, target_file, replace=replace, checksum=checksum)
 
+            original_size = local_file.stat().st_size
             if self.options.delete_local:
                 local_file.unlink()
                 log.warning("|Local FS| Successfully removed file %s", local_file)
 
+            if checksum is not None:
+                result.checksums[uploaded_file.path] = checksum.hexdigest()
+
+            if self.options.compression:
+                result.original_sizes[uploaded_file.path] = original_size
+
             result.successful.add(uploaded_file)
 
         except Exception as e:
@@ -531,6 +653,129 @@ class FileUploader(FrozenModel):
 
             result.failed.add(FailedLocalFile(path=local_file, exception=e))
 
+    def _upload_packs(self, to_upload: UPLOAD_ITEMS_TYPE, current_temp_dir: RemotePath | None) -> UploadResult:
+        total_files = len(to_upload)
+        files = FileSet(item[0] for item in to_upload)
+
+        log.info("|%s| Files to be packed and uploaded:", self.__class__.__name__)
+        log_lines(files._details(self.options.max_logged_files))  # noqa: WPS437
+        log_with_indent("")
+
+        result = UploadResult()
+        packs = self._split_packs(to_upload, result)
+        log.info("|%s| Starting the upload process, %d archives", self.__class__.__name__, len(packs))
+
+        progress = ProgressLog(name=self.__class__.__name__, action="Uploaded", total=total_files)
+        prefix = f"part-{secrets.token_hex(5)}"
+        handled = len(result.missing)
+        for i, pack in enumerate(packs):
+            target_file = self.target_path / f"{prefix}-{i:05d}.tar"
+            tmp_file = current_temp_dir / target_file.name if current_temp_dir else None
+
+            log.info("|%s| Uploading archive %d of %d, %d files", self.__class__.__name__, i + 1, len(packs), len(pack))
+            if tmp_file:
+                log_with_indent("temp = '%s'", tmp_file)
+            log_with_indent("to = '%s'", target_file)
+
+            self._upload_pack(pack, target_file, tmp_file, result)
+
+            handled += len(pack)
+            progress.update(handled=handled, size=result.successful_size)
+
+        return result
+
+    def _split_packs(
+        self,
+        to_upload: UPLOAD_ITEMS_TYPE,
+        result: UploadResult,
+    ) -> list[list[tuple[LocalPath, str]]]:
+        packs: list[list[tuple[LocalPath, str]]] = []
+        pack_size = 0
+
+        for local_file, target_file, _tmp_file in to_upload:
+            if not local_file.exists():
+                log.warning("|%s| Missing file '%s', skipping", self.__class__.__name__, local_file)
+                result.missing.add(local_file)
+                continue
+
+            file_size = local_file.stat().st_size
+            if not packs or pack_size + file_size > self.options.pack_size:
+                packs.append([])
+                pack_size = 0
+
+            packs[-1].append((local_file, os.fspath(target_file.relative_to(self.target_path))))
+            pack_size += file_size
+
+        # file larger than pack_size creates an empty pack before itself
+        return [pack for pack in packs if pack]
+
+    def _upload_pack(  # noqa: WPS231
+        self,
+        pack: list[tuple[LocalPath, str]],
+        target_file: RemotePath,
+        tmp_file: RemotePath | None,
+        result: UploadResult,
+    ) -> None:
+        archive = tmp_file or target_file
+        manifest = archive.with_name(archive.name + MANIFEST_SUFFIX)
+
+        try:
+            # archive is written directly to remote file, without saving it to disk
+            with self.connection.open(archive, "wb") as target, TarPack(target) as tar_pack:
+                for local_file, name in pack:
+                    tar_pack.add(local_file, name)
+
+            self.connection.write_bytes(manifest, tar_pack.manifest())
+
+            if tmp_file:
+                # Archive is moved to target dir only after manifest is written.
+                # This prevents operations with archives which cannot be read yet
+                uploaded_file = self.connection.rename_file(tmp_file, target_file)
+                self.connection.rename_file(manifest, target_file.with_name(target_file.name + MANIFEST_SUFFIX))
+            else:
+                uploaded_file = self.connection.resolve_file(target_file)
+
+        except Exception as e:
+            if log.isEnabledFor(logging.DEBUG):
+                log.exception("|%s| Couldn't upload archive to target dir", self.__class__.__name__, exc_info=e)
+            else:
+                log.exception(
+                    "|%s| Couldn't upload archive to target dir: %s",
+                    self.__class__.__name__,
+                    e,
+                    exc_info=False,
+                )
+
+            for local_file, _name in pack:
+                result.failed.add(FailedLocalFile(path=local_file, exception=e))
+            return
+
+        for local_file, _name in pack:
+            if self.options.delete_local:
+                local_file.unlink()
+                log.warning("|Local FS| Successfully removed file %s", local_file)
+
+            result.packed[local_file] = uploaded_file.path
+
+        result.successful.add(uploaded_file)
+
+    def _transfer_file(
+        self,
+        local_file: LocalPath,
+        target_file: RemotePath,
+        replace: bool,
+        checksum: FileChecksum | None,
+    ) -> PathWithStatsProtocol:
+        if not self.options.compression:
+            return self.connection.upload_file(local_file, target_file, replace=replace, checksum=checksum)
+
+        # compressed content is written directly to remote file, without saving compressed file to disk
+        with open(local_file, "rb") as source, self.connection.open(target_file, "wb") as target:
+            with self.options.compression.compress(target) as stream:
+                shutil.copyfileobj(source, stream, DEFAULT_CHUNK_SIZE)
+
+        return self.connection.resolve_file(target_file)
+
     def _remove_temp_dir(self, temp_dir: RemotePath) -> None:
         try:
             self.connection.remove_dir(temp_dir, recursive=True)
@@ -540,5 +785,5 @@ class FileUploader(FrozenModel):
     def _log_result(self, result: UploadResult) -> None:
         log.info("")
         log.info("|%s| Upload result:", self.__class__.__name__)
-        log_lines(str(result))
+        log_lines(result._details(self.options.max_logged_files))  # noqa: WPS437
         entity_boundary_log(msg=f"{self.__class__.__name__} ends", char="-")
@@ -0,0 +1,74 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+import os
+import tarfile
+from typing import BinaryIO, NamedTuple
+
+from onetl.impl import LocalPath
+
+MANIFEST_SUFFIX = ".manifest.jsonl"
+
+
+class TarPackEntry(NamedTuple):
+    name: str
+    offset: int
+    size: int
+
+
+class TarPack:
+    """
+    Uncompressed tar archive written sequentially to a stream, e.g. to a remote file opened for writing.
+
+    For each added file, an offset of its content within the archive is recorded.
+    Content of files is stored as is, so it can be read directly from the archive without unpacking it,
+    using :obj:`onetl.base.BaseFileConnection.open` and ``seek(offset)``.
+
+    Manifest is a JSON Lines file, each line contains name, offset and size of a file in the archive.
+
+    .. warning::
+
+        Only for onETL internal use.
+    """
+
+    def __init__(self, target: BinaryIO):
+        # stream mode does not require target to be seekable.
+        # symlinks are resolved, so content of linked file is stored, not the link itself
+        self._tar = tarfile.open(fileobj=target, mode="w|", dereference=True)  # noqa: SIM115
+        self.entries: list[TarPackEntry] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, local_file: LocalPath, name: str) -> None:
+        tarinfo = self._tar.gettarinfo(os.fspath(local_file), arcname=name)
+        with open(local_file, "rb") as file:
+            self._tar.addfile(tarinfo, file)
+
+        # content is written right after header, and padded to the block size
+        padded_size = -(-tarinfo.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        self.entries.append(TarPackEntry(name=name, offset=self._tar.offset - padded_size, size=tarinfo.size))
+
+    def close(self) -> None:
+        self._tar.close()
+
+    def manifest(self) -> bytes:
+        lines = (json.dumps(entry._asdict()) + "\n" for entry in self.entries)
+        return "".join(lines).encode("utf-8")
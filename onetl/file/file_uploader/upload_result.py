@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+from typing import Dict
+
 from pydantic import Field
 
 from onetl.file.file_result import FileResult, FileSet
-from onetl.impl import FailedLocalFile, LocalPath, RemoteFile
+from onetl.impl import FailedLocalFile, LocalPath, RemoteFile, RemotePath
 
 
 class UploadResult(FileResult):
@@ -75,3 +77,12 @@ class UploadResult(FileResult):
 
     missing: FileSet[LocalPath] = Field(default_factory=FileSet)
     "File paths (local) which are not present in the local file system"
+
+    checksums: Dict[RemotePath, str] = Field(default_factory=dict)
+    "Checksums of uploaded files, calculated if ``checksum_algorithm`` option is set"
+
+    original_sizes: Dict[RemotePath, int] = Field(default_factory=dict)
+    "Sizes of local files before compression, if ``compression`` option is set"
+
+    packed: Dict[LocalPath, RemotePath] = Field(default_factory=dict)
+    "Archives (remote) which local files were packed to, if ``pack_size`` option is set"
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 
+from onetl.file.filter.compile_filters import compile_filters
 from onetl.file.filter.exclude_dir import ExcludeDir
 from onetl.file.filter.file_hwm import FileHWMFilter
 from onetl.file.filter.glob import Glob
@@ -0,0 +1,246 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Iterable, Sequence
+
+from onetl.base import BaseFileFilter, PathProtocol
+from onetl.file.filter.exclude_dir import ExcludeDir
+from onetl.file.filter.glob import Glob
+from onetl.file.filter.regexp import Regexp
+from onetl.impl import RemotePath
+
+# regexp flags which can be set for a part of pattern, like (?i:...)
+SCOPED_FLAGS = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+
+# patterns with backreferences, named groups, conditionals or global inline flags cannot be safely merged with others
+UNMERGEABLE_REGEXP = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def compile_filters(filters: Iterable[BaseFileFilter]) -> list[BaseFileFilter]:
+    """
+    Replace filters with equivalent ones which are faster to check.
+
+    * All :obj:`Glob <onetl.file.filter.glob.Glob>` and :obj:`Regexp <onetl.file.filter.regexp.Regexp>` filters
+      are merged into one regular expression, so path is matched against all of them at once.
+    * All :obj:`ExcludeDir <onetl.file.filter.exclude_dir.ExcludeDir>` filters are merged into a prefix tree,
+      so checking a path does not depend on number of excluded directories.
+
+    Other filters are returned as is.
+
+    .. warning::
+
+        Only for onETL internal use.
+
+    Parameters
+    ----------
+    filters : Iterable of :obj:`onetl.base.base_file_filter.BaseFileFilter`
+        Filters to compile.
+
+    Returns
+    -------
+    List of filters, matching the same paths as input ones.
+
+    Examples
+    --------
+
+    .. code:: python
+
+        from onetl.file.filter import ExcludeDir, Glob, compile_filters, match_all_filters
+        from onetl.impl import RemoteFile
+
+        filters = compile_filters([Glob("*.csv"), Glob("file*"), ExcludeDir("/excluded")])
+
+        assert match_all_filters(RemoteFile("/path/to/file.csv"), filters)
+        assert not match_all_filters(RemoteFile("/path/to/other.csv"), filters)
+        assert not match_all_filters(RemoteFile("/excluded/file.csv"), filters)
+    """
+
+    result: list[BaseFileFilter] = []
+    patterns: list[Glob | Regexp] = []
+    exclude_dirs: list[ExcludeDir] = []
+
+    for file_filter in filters:
+        if isinstance(file_filter, Glob) or (isinstance(file_filter, Regexp) and _is_mergeable(file_filter.pattern)):
+            patterns.append(file_filter)
+        elif isinstance(file_filter, ExcludeDir):
+            exclude_dirs.append(file_filter)
+        else:
+            result.append(file_filter)
+
+    if len(patterns) > 1:
+        result.insert(0, CompiledPatterns(patterns))
+    else:
+        result[0:0] = patterns
+
+    if len(exclude_dirs) > 1:
+        result.insert(0, CompiledExcludeDirs(exclude_dirs))
+    else:
+        result[0:0] = exclude_dirs
+
+    return result
+
+
+class CompiledPatterns(BaseFileFilter):
+    """
+    Several :obj:`Glob <onetl.file.filter.glob.Glob>` and :obj:`Regexp <onetl.file.filter.regexp.Regexp>` filters,
+    merged into one regular expression.
+
+    Each filter is converted to a lookahead assertion, so file path should match all of them.
+    Like original filters, directories are not checked.
+    """
+
+    def __init__(self, filters: Sequence[Glob | Regexp]):
+        self.filters = list(filters)
+        self.regexp = re.compile("".join(_lookahead(file_filter) for file_filter in self.filters))
+
+    def __repr__(self):
+        return " & ".join(repr(file_filter) for file_filter in self.filters)
+
+    def match(self, path: PathProtocol) -> bool:
+        if not path.is_file():
+            return True
+
+        return self.regexp.match(os.fspath(path)) is not None
+
+    def match_dir_prefix(self, path: PathProtocol) -> bool:
+        return all(file_filter.match_dir_prefix(path) for file_filter in self.filters)
+
+
+class CompiledExcludeDirs(BaseFileFilter):
+    """
+    Several :obj:`ExcludeDir <onetl.file.filter.exclude_dir.ExcludeDir>` filters, merged into a prefix tree.
+
+    Path is checked by walking the tree using its parts, instead of comparing every parent
+    with every excluded directory.
+    """
+
+    # key of tree node means that path consisting of all parts above the node is excluded
+    _EXCLUDED = object()
+
+    def __init__(self, filters: Sequence[ExcludeDir]):
+        self.filters = list(filters)
+        self._tree: dict[Any, Any] = {}
+        for file_filter in self.filters:
+            node = self._tree
+            for part in file_filter.path.parts:
+                node = node.setdefault(part, {})
+            node[self._EXCLUDED] = True
+
+    def __repr__(self):
+        return " & ".join(repr(file_filter) for file_filter in self.filters)
+
+    def match(self, path: PathProtocol) -> bool:
+        # like ExcludeDir, file with the same path as excluded directory is not excluded
+        return not self._is_excluded(path, include_self=path.is_dir())
+
+    def match_dir_prefix(self, path: PathProtocol) -> bool:
+        return not self._is_excluded(path, include_self=True)
+
+    def _is_excluded(self, path: PathProtocol, include_self: bool) -> bool:
+        parts = path.parts
+        node = self._tree
+        # "." is a parent of any relative path, but not of absolute one
+        if self._EXCLUDED in node and not path.is_absolute() and (parts or include_self):
+            return True
+
+        if not include_self:
+            parts = parts[:-1]
+
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                return False
+
+            if self._EXCLUDED in node:
+                return True
+
+        return False
+
+
+def _is_mergeable(pattern: re.Pattern) -> bool:
+    unsupported_flags = pattern.flags & ~(re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
+    return isinstance(pattern.pattern, str) and not unsupported_flags and not UNMERGEABLE_REGEXP.search(pattern.pattern)
+
+
+def _lookahead(file_filter: Glob | Regexp) -> str:
+    if isinstance(file_filter, Glob):
+        return f"(?={_glob_to_regexp(file_filter.pattern)})"
+
+    pattern = file_filter.pattern
+    flags = "".join(letter for flag, letter in SCOPED_FLAGS.items() if pattern.flags & flag)
+    # comment in verbose pattern lasts until the end of line, so it should not hide the closing bracket
+    source = pattern.pattern + "\n" if pattern.flags & re.VERBOSE else pattern.pattern
+    return f"(?=(?s:.)*?(?{flags}:{source}))"
+
+
+def _glob_to_regexp(pattern: str) -> str:
+    # same as PurePath.match: relative pattern is matched against the end of path, absolute one - against whole path
+    path = RemotePath(pattern)
+    if path.is_absolute():
+        prefix = re.escape(path.parts[0])
+        parts = path.parts[1:]
+    else:
+        prefix = r"(?:(?s:.)*/)?"
+        parts = path.parts
+
+    return prefix + "/".join(_glob_part_to_regexp(part) for part in parts) + r"\Z"
+
+
+def _glob_part_to_regexp(pattern: str) -> str:  # noqa: WPS231
+    # same as fnmatch.translate, but wildcards cannot match path separator
+    result = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        index += 1
+
+        if char == "*":
+            if not result or result[-1] != "[^/]*":
+                result.append("[^/]*")
+        elif char == "?":
+            result.append("[^/]")
+        elif char == "[":
+            end = index
+            if end < length and pattern[end] == "!":
+                end += 1
+            if end < length and pattern[end] == "]":
+                end += 1
+            while end < length and pattern[end] != "]":
+                end += 1
+
+            if end >= length:
+                result.append(r"\[")
+                continue
+
+            chars = pattern[index:end].replace("\\", r"\\")
+            index = end + 1
+            if chars[0] == "!":
+                chars = "^" + chars[1:]
+            elif chars[0] in "^[":
+                chars = "\\" + chars
+            result.append(f"(?!/)[{chars}]")
+        else:
+            result.append(re.escape(char))
+
+    return "".join(result)
@@ -62,6 +62,9 @@ class ExcludeDir(BaseFileFilter, FrozenModel):
 
         return self.path not in path.parents
 
+    def match_dir_prefix(self, path: PathProtocol) -> bool:
+        return self.path != path and self.path not in path.parents
+
     @validator("path", pre=True)
     def _validate_path(cls, value: str | os.PathLike) -> PurePathProtocol:
         if isinstance(value, PurePathProtocol):
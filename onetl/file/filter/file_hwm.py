@@ -14,9 +14,13 @@
 
 from __future__ import annotations
 
-from etl_entities import FileHWM
+import os
+from datetime import datetime
+from typing import Any, FrozenSet, Optional, Set
 
-from onetl.base import BaseFileFilter, PathProtocol
+from etl_entities import FileHWM, FileListHWM
+
+from onetl.base import BaseFileFilter, PathProtocol, PathWithStatsProtocol
 from onetl.impl import FrozenModel
 
 
@@ -33,19 +37,86 @@ class FileHWMFilter(BaseFileFilter, FrozenModel):
     hwm : :obj:`etl_entities.FileHWM`
 
         File HWM instance
+
+    min_modified_time : :obj:`datetime.datetime`, optional
+
+        Files modified before this time are considered already handled, even if they are not covered by HWM.
+
+        Supported only by ``FileListHWM``.
     """
 
     class Config:
         arbitrary_types_allowed = True
 
     hwm: FileHWM
+    min_modified_time: Optional[datetime] = None
+
+    _file_list_index: Optional[FrozenSet[str]] = None
+    _indexed_value: Any = None
+    _listed_paths: Set[str] = set()
+    _expired_paths: Set[str] = set()
+
+    @property
+    def listed_paths(self) -> FrozenSet[str]:
+        """
+        Paths from ``FileListHWM`` value (relative to source), which were found while matching files,
+        and were modified after ``min_modified_time``
+        """
+
+        return frozenset(self._listed_paths)
+
+    @property
+    def expired_paths(self) -> FrozenSet[str]:
+        """
+        Paths from ``FileListHWM`` value (relative to source), which were found while matching files,
+        but were modified before ``min_modified_time``
+        """
+
+        return frozenset(self._expired_paths)
 
     def match(self, path: PathProtocol) -> bool:
         if path.is_dir():
             return True
 
+        if isinstance(self.hwm, FileListHWM):
+            relative_path = self._file_list_relative_path(path)
+            expired = self._is_expired(path)
+            if relative_path is not None and self._file_list_covers(relative_path):
+                (self._expired_paths if expired else self._listed_paths).add(relative_path)
+                return False
+
+            return not expired
+
         return not self.hwm.covers(path)
 
+    def _file_list_covers(self, relative_path: str) -> bool:
+        # FileListHWM.covers converts all HWM paths to absolute ones on every call,
+        # so use index of relative paths instead. It is rebuilt only if HWM value is replaced
+        if self._indexed_value is not self.hwm.value:
+            self._file_list_index = frozenset(os.fspath(item) for item in self.hwm.value)
+            self._indexed_value = self.hwm.value
+
+        return relative_path in self._file_list_index  # type: ignore[operator]
+
+    def _file_list_relative_path(self, path: PathProtocol) -> str | None:
+        relative_path = os.fspath(path)
+        if not relative_path.startswith("/"):
+            return relative_path
+
+        source_prefix = os.fspath(self.hwm.source.name).rstrip("/") + "/"
+        if not relative_path.startswith(source_prefix):
+            return None
+
+        return relative_path[len(source_prefix) :]
+
+    def _is_expired(self, path: PathProtocol) -> bool:
+        if self.min_modified_time is None or not isinstance(path, PathWithStatsProtocol):
+            return False
+
+        modified_time = path.stat().st_mtime
+        # files with unknown modification time are never expired
+        return modified_time is not None and modified_time < self.min_modified_time.timestamp()
+
     def __str__(self):
         return self.hwm.qualified_name
 
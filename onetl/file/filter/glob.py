@@ -15,11 +15,12 @@
 from __future__ import annotations
 
 import glob
+from fnmatch import fnmatchcase
 
 from pydantic import validator
 
 from onetl.base import BaseFileFilter, PathProtocol
-from onetl.impl import FrozenModel
+from onetl.impl import FrozenModel, RemotePath
 
 
 class Glob(BaseFileFilter, FrozenModel):
@@ -62,6 +63,19 @@ class Glob(BaseFileFilter, FrozenModel):
 
         return path.match(self.pattern)
 
+    def match_dir_prefix(self, path: PathProtocol) -> bool:
+        pattern = RemotePath(self.pattern)
+        if not pattern.is_absolute():
+            # relative pattern is matched against the end of path, so files can be located in any directory
+            return True
+
+        # absolute pattern is matched against the whole path, so files cannot be located deeper than pattern
+        pattern_parts = pattern.parts
+        if len(path.parts) >= len(pattern_parts):
+            return False
+
+        return all(fnmatchcase(part, part_pattern) for part, part_pattern in zip(path.parts[1:], pattern_parts[1:]))
+
     @validator("pattern", pre=True)
     def _validate_pattern(cls, value: str) -> str:
         if not glob.has_magic(value):
@@ -16,4 +16,5 @@
 from onetl.file.limit.limits_reached import limits_reached
 from onetl.file.limit.limits_stop_at import limits_stop_at
 from onetl.file.limit.max_files_count import MaxFilesCount
+from onetl.file.limit.max_files_size import MaxFilesSize
 from onetl.file.limit.reset_limits import reset_limits
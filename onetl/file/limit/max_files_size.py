@@ -0,0 +1,92 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+import logging
+
+from pydantic import ByteSize
+
+from onetl.base import BaseFileLimit, PathProtocol, PathWithStatsProtocol
+from onetl.impl import FrozenModel
+
+log = logging.getLogger(__name__)
+
+
+class MaxFilesSize(BaseFileLimit, FrozenModel):
+    """Limits the total size of files handled by :ref:`file-downloader` or :ref:`file-mover`.
+
+    File size is taken from file stats returned by file listing, so no additional requests are made.
+
+    .. note::
+
+        This is a soft limit. Files are handled until their total size reaches ``limit``,
+        and the file on which the limit is reached is handled too.
+        So total size can exceed ``limit`` by size of just one file.
+        This also means that file with size larger than ``limit`` is still handled, instead of blocking all the next runs.
+
+    Parameters
+    ----------
+
+    limit : int or str
+
+        Total size of files in bytes. Can be passed as a string with units, like ``"10GiB"`` or ``"500MB"``.
+
+        Files are handled until their total size reaches ``limit`` (including the last file),
+        and all the next files will not.
+
+    Examples
+    --------
+
+    Create filter which allows to handle files with total size 10GiB, and stops after that:
+
+    .. code:: python
+
+        from onetl.file.limit import MaxFilesSize
+
+        limit = MaxFilesSize("10GiB")
+        # or
+        limit = MaxFilesSize(10 * 1024 * 1024 * 1024)
+    """
+
+    limit: ByteSize
+
+    _total_size: int = 0
+
+    def __init__(self, limit: int | str):
+        # this is only to allow passing limit as positional argument
+        super().__init__(limit=limit)  # type: ignore
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.limit.human_readable()!r})"
+
+    def reset(self):
+        self._total_size = 0
+        return self
+
+    def stops_at(self, path: PathProtocol) -> bool:
+        if self.is_reached:
+            return True
+
+        if path.is_dir() or not isinstance(path, PathWithStatsProtocol):
+            # directories size does not matter, and files without stats cannot be measured
+            return False
+
+        self._total_size += path.stat().st_size or 0
+        return self.is_reached
+
+    @property
+    def is_reached(self) -> bool:
+        return self._total_size >= self.limit
@@ -1 +1,2 @@
+from onetl.hwm.file_modified_since_hwm import FileModifiedSinceHWM
 from onetl.hwm.statement import Statement
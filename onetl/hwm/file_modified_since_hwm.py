@@ -0,0 +1,296 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING, FrozenSet, Iterable, Optional
+
+from etl_entities import FileHWM, register_hwm_type
+from etl_entities.instance import AbsolutePath, RelativePath
+from pydantic import Field, validator
+from pydantic.validators import strict_str_validator
+
+if TYPE_CHECKING:
+    from onetl.base import PathWithStatsProtocol
+
+
+@register_hwm_type("file_modified_since")
+class FileModifiedSinceHWM(FileHWM[Optional[datetime], str]):
+    """File HWM type, which stores max modification time of handled files.
+
+    Files modified before this time are considered handled. Files modified at exactly this time
+    are compared by name, so files created at the same second as the last handled one are not skipped.
+
+    Unlike ``FileListHWM``, size of HWM value does not depend on number of handled files.
+    But if file is changed after it was handled, it will be handled again.
+
+    Parameters
+    ----------
+    source : :obj:`etl_entities.instance.path.remote_folder.RemoteFolder`
+        Folder instance
+
+    value : :obj:`datetime.datetime` or ``None``, default: ``None``
+        Max modification time of handled files (in UTC)
+
+    boundary_files : :obj:`frozenset` of :obj:`pathlib.PurePosixPath`, default: empty set
+        Paths of handled files with modification time equal to ``value``, relative to ``source``
+
+    modified_time : :obj:`datetime.datetime`, default: current datetime
+        HWM value modification time
+
+    process : :obj:`etl_entities.process.process.Process`, default: current process
+        Process instance
+
+    Examples
+    --------
+
+    .. code:: python
+
+        from datetime import datetime, timezone
+
+        from etl_entities import RemoteFolder
+        from onetl.hwm import FileModifiedSinceHWM
+
+        folder = RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21")
+        hwm = FileModifiedSinceHWM(
+            source=folder,
+            value=datetime(2023, 9, 9, 10, 15, tzinfo=timezone.utc),
+            boundary_files=["some/path", "another.file"],
+        )
+    """
+
+    value: Optional[datetime] = None
+    boundary_files: FrozenSet[RelativePath] = Field(default_factory=frozenset)
+
+    class Config:  # noqa: WPS431
+        json_encoders = {RelativePath: os.fspath}
+
+    @validator("value", pre=True)
+    def _validate_value(cls, value):
+        if isinstance(value, str):
+            value = cls.deserialize_value(value)
+
+        if isinstance(value, datetime) and value.tzinfo is None:
+            # naive datetime is treated as local time, like datetime.timestamp() does
+            return value.astimezone(timezone.utc)
+
+        return value
+
+    @validator("boundary_files", pre=True)
+    def _validate_boundary_files(cls, value, values):
+        if "source" not in values:
+            raise ValueError("Missing `source` key")
+
+        source = values["source"]
+        if isinstance(value, (os.PathLike, str)):
+            value = [value]
+
+        return frozenset(_relative_path(item, source.name) for item in value)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of HWM
+
+        Returns
+        ----------
+        value : str
+            Static value ``"file_modified_since"``
+        """
+
+        return "file_modified_since"
+
+    def serialize_value(self) -> str:
+        """Return string representation of HWM value
+
+        Returns
+        -------
+        result : str
+            Serialized value
+
+        Examples
+        ----------
+
+        .. code:: python
+
+            from datetime import datetime, timezone
+            from onetl.hwm import FileModifiedSinceHWM
+
+            hwm = FileModifiedSinceHWM(value=datetime(2023, 9, 9, 10, 15, tzinfo=timezone.utc), ...)
+            assert hwm.serialize_value() == "2023-09-09T10:15:00+00:00"
+
+            hwm = FileModifiedSinceHWM(value=None, ...)
+            assert hwm.serialize_value() == "null"
+        """
+
+        if self.value is None:
+            return "null"
+
+        return self.value.isoformat()
+
+    @classmethod
+    def deserialize_value(cls, value: str) -> datetime | None:
+        """Parse string representation to get HWM value
+
+        Parameters
+        ----------
+        value : str
+            Serialized value
+
+        Returns
+        -------
+        result : :obj:`datetime.datetime` or ``None``
+            Deserialized value
+
+        Examples
+        ----------
+
+        .. code:: python
+
+            from datetime import datetime, timezone
+            from onetl.hwm import FileModifiedSinceHWM
+
+            assert FileModifiedSinceHWM.deserialize_value("2023-09-09T10:15:00+00:00") == datetime(
+                2023, 9, 9, 10, 15, tzinfo=timezone.utc
+            )
+            assert FileModifiedSinceHWM.deserialize_value("null") is None
+        """
+
+        result = strict_str_validator(value).strip()
+        if result.lower() == "null":
+            return None
+
+        return datetime.fromisoformat(result)
+
+    def covers(self, value: PathWithStatsProtocol) -> bool:
+        """Return ``True`` if input file is already covered by HWM
+
+        Files with unknown modification time are never covered.
+
+        Examples
+        ----------
+
+        .. code:: python
+
+            from onetl.hwm import FileModifiedSinceHWM
+            from onetl.impl import RemoteFile, RemotePathStat
+
+            hwm = FileModifiedSinceHWM(value=datetime(2023, 9, 9, 10, 15, tzinfo=timezone.utc), ...)
+
+            # 2023-09-09T10:00:00+00:00
+            assert hwm.covers(RemoteFile("/absolute/path/old.file", stats=RemotePathStat(st_mtime=1694253600)))
+
+            # 2023-09-09T10:30:00+00:00
+            assert not hwm.covers(RemoteFile("/absolute/path/new.file", stats=RemotePathStat(st_mtime=1694255400)))
+        """
+
+        if self.value is None:
+            return False
+
+        modified_time = _get_modified_time(value)
+        if modified_time is None:
+            return False
+
+        if modified_time != self.value:
+            return modified_time < self.value
+
+        return _relative_path(value, self.source.name) in self.boundary_files
+
+    def update(self, value: PathWithStatsProtocol | Iterable[PathWithStatsProtocol]):
+        """Updates current HWM value using modification time of file or files, and return HWM.
+
+        .. note::
+
+            Changes HWM value in place
+
+        Returns
+        -------
+        result : FileModifiedSinceHWM
+            Self
+
+        Examples
+        ----------
+
+        .. code:: python
+
+            from onetl.hwm import FileModifiedSinceHWM
+            from onetl.impl import RemoteFile, RemotePathStat
+
+            hwm = FileModifiedSinceHWM(value=None, ...)
+
+            # 2023-09-09T10:00:00+00:00
+            hwm.update(RemoteFile("/absolute/path/some.file", stats=RemotePathStat(st_mtime=1694253600)))
+            hwm.update(RemoteFile("/absolute/path/another.file", stats=RemotePathStat(st_mtime=1694253600)))
+
+            assert hwm.value == datetime(2023, 9, 9, 10, 0, tzinfo=timezone.utc)
+            assert hwm.boundary_files == {RelativePath("some.file"), RelativePath("another.file")}
+
+            # value cannot decrease
+            hwm.update(RemoteFile("/absolute/path/old.file", stats=RemotePathStat(st_mtime=1694250000)))
+            assert hwm.value == datetime(2023, 9, 9, 10, 0, tzinfo=timezone.utc)
+        """
+
+        if isinstance(value, os.PathLike):
+            value = [value]
+
+        new_value = self.value
+        boundary_files = set(self.boundary_files)
+        for path in value:
+            modified_time = _get_modified_time(path)
+            if modified_time is None:
+                continue
+
+            if new_value is None or modified_time > new_value:
+                new_value = modified_time
+                boundary_files = {_relative_path(path, self.source.name)}
+            elif modified_time == new_value:
+                boundary_files.add(_relative_path(path, self.source.name))
+
+        if new_value != self.value or boundary_files != self.boundary_files:
+            object.__setattr__(self, "value", new_value)  # noqa: WPS609
+            object.__setattr__(self, "boundary_files", frozenset(boundary_files))  # noqa: WPS609
+            object.__setattr__(self, "modified_time", datetime.now())  # noqa: WPS609
+
+        return self
+
+    def __add__(self, value: PathWithStatsProtocol | Iterable[PathWithStatsProtocol]):
+        """Updates HWM value using modification time of file or files, and return copy of HWM
+
+        Returns
+        --------
+        result : FileModifiedSinceHWM
+            HWM copy with new value
+        """
+
+        return self.copy().update(value)
+
+
+def _get_modified_time(path: PathWithStatsProtocol) -> datetime | None:
+    modified_time = path.stat().st_mtime
+    if modified_time is None:
+        return None
+
+    # values are compared with ones read from HWM store, so timezone should not depend on current process settings
+    return datetime.fromtimestamp(modified_time, tz=timezone.utc)
+
+
+def _relative_path(path: str | os.PathLike, source: AbsolutePath) -> RelativePath:
+    result = PurePosixPath(os.fspath(path).strip())
+    if result.is_absolute():
+        result = result.relative_to(source)
+
+    return RelativePath(result)
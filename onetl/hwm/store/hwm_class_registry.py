@@ -19,6 +19,8 @@ from typing import Any, Callable, ClassVar, Iterator, Optional
 from etl_entities import HWM, DateHWM, DateTimeHWM, FileListHWM, IntHWM
 from pydantic import StrictInt
 
+from onetl.hwm.file_modified_since_hwm import FileModifiedSinceHWM
+
 
 class HWMClassRegistry:
     """Registry class for HWM types
@@ -48,6 +50,7 @@ class HWMClassRegistry:
         "date": DateHWM,
         "timestamp": DateTimeHWM,
         "file_list": FileListHWM,
+        "file_modified_since": FileModifiedSinceHWM,
     }
 
     @classmethod
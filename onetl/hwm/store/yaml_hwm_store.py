@@ -15,11 +15,12 @@
 from __future__ import annotations
 
 import operator
+import os
 import re
 from typing import ClassVar
 
 import yaml
-from etl_entities import HWM, HWMTypeRegistry
+from etl_entities import HWM, FileListHWM, HWMTypeRegistry
 from platformdirs import user_data_dir
 from pydantic import validator
 
@@ -32,6 +33,60 @@ from onetl.impl import FrozenModel, LocalPath
 
 DATA_PATH = LocalPath(user_data_dir("onETL", "ONEtools"))
 
+COMPRESSED_FILE_LIST_KEY = "prefix_compressed"
+
+
+def compress_file_list(paths: list[str]) -> str | None:
+    """
+    Encode sorted list of paths as lines ``{common_prefix_length}:{suffix}``,
+    where common prefix is calculated for each path and the previous one.
+
+    Returns ``None`` if paths cannot be encoded this way (e.g. some path contains newline symbol).
+    """
+
+    lines = []
+    previous = ""
+    for path in sorted(paths):
+        if "\n" in path:
+            return None
+
+        prefix_length = len(os.path.commonprefix([previous, path]))
+        lines.append(f"{prefix_length}:{path[prefix_length:]}")
+        previous = path
+
+    return "\n".join(lines)
+
+
+class _HWMDumper(yaml.Dumper):
+    # compressed file list is dumped as a multiline block instead of quoted string with escaped newlines
+    def represent_str(self, data: str) -> yaml.ScalarNode:
+        if "\n" in data:
+            return self.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+
+        return super().represent_str(data)
+
+
+_HWMDumper.add_representer(str, _HWMDumper.represent_str)
+
+
+def decompress_file_list(value: str) -> list[str]:
+    """
+    Decode paths list encoded by :obj:`compress_file_list`
+    """
+
+    result = []
+    previous = ""
+    if not value:
+        return result
+
+    # not splitlines(), because paths could contain other line break symbols, like ``\r``
+    for line in value.split("\n"):
+        prefix_length, suffix = line.split(":", 1)
+        previous = previous[: int(prefix_length)] + suffix
+        result.append(previous)
+
+    return result
+
 
 @default_hwm_store_class
 @register_hwm_store_class("yaml", "yml")
@@ -54,6 +109,14 @@ class YAMLHWMStore(BaseHWMStore, FrozenModel):
 
         Encoding of files with HWM value
 
+    compress_file_list : bool, default: ``False``
+
+        If ``True``, value of ``file_list`` HWM is saved as a sorted list of paths
+        with common prefix of each path and the previous one replaced by its length,
+        which is significantly smaller than plain list of paths.
+
+        Both formats are supported while reading HWM, but older onETL versions can read only a plain list.
+
     Examples
     --------
 
@@ -156,6 +219,7 @@ class YAMLHWMStore(BaseHWMStore, FrozenModel):
 
     path: LocalPath = DATA_PATH / "yml_hwm_store"
     encoding: str = "utf-8"
+    compress_file_list: bool = False
 
     ITEMS_DELIMITER_PATTERN: ClassVar[re.Pattern] = re.compile("[#@|]+")
     PROHIBITED_SYMBOLS_PATTERN: ClassVar[re.Pattern] = re.compile(r"[=:/\\]+")
@@ -173,11 +237,20 @@ class YAMLHWMStore(BaseHWMStore, FrozenModel):
             return None
 
         latest = sorted(data, key=operator.itemgetter("modified_time"))[-1]
+        if isinstance(latest["value"], dict) and COMPRESSED_FILE_LIST_KEY in latest["value"]:
+            latest = {**latest, "value": decompress_file_list(latest["value"][COMPRESSED_FILE_LIST_KEY])}
+
         return HWMTypeRegistry.parse(latest)
 
     def save(self, hwm: HWM) -> LocalPath:
         data = self._load(hwm.qualified_name)
-        self._dump(hwm.qualified_name, [hwm.serialize()] + data)
+        serialized = hwm.serialize()
+        if self.compress_file_list and isinstance(hwm, FileListHWM):
+            compressed = compress_file_list(serialized["value"])
+            if compressed is not None:
+                serialized["value"] = {COMPRESSED_FILE_LIST_KEY: compressed}
+
+        self._dump(hwm.qualified_name, [serialized] + data)
         return self.get_file_path(hwm.qualified_name)
 
     @classmethod
@@ -205,4 +278,4 @@ class YAMLHWMStore(BaseHWMStore, FrozenModel):
     def _dump(self, name: str, data: list[dict]) -> None:
         path = self.get_file_path(name)
         with path.open("w", encoding=self.encoding) as file:
-            yaml.dump(data, file)
+            yaml.dump(data, file, Dumper=_HWMDumper)
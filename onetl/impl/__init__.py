@@ -14,6 +14,8 @@
 
 from onetl.impl.base_model import BaseModel
 from onetl.impl.failed_local_file import FailedLocalFile
+from onetl.impl.file_checksum import FileChecksum
+from onetl.impl.file_compression import FileCompression
 from onetl.impl.file_write_mode import FileWriteMode
 from onetl.impl.frozen_model import FrozenModel
 from onetl.impl.generic_options import GenericOptions
@@ -21,5 +23,11 @@ from onetl.impl.local_path import LocalPath
 from onetl.impl.path_repr import path_repr
 from onetl.impl.remote_directory import RemoteDirectory
 from onetl.impl.remote_file import FailedRemoteFile, RemoteFile
+from onetl.impl.remote_file_stream import (
+    RawRemoteFileReader,
+    RawRemoteFileWriter,
+    RemoteFileReader,
+    RemoteFileWriter,
+)
 from onetl.impl.remote_path import RemotePath
 from onetl.impl.remote_path_stat import RemotePathStat
@@ -0,0 +1,81 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Iterable, TypeVar
+
+from onetl.impl.remote_path import RemotePath
+
+T = TypeVar("T")
+
+
+class ConcurrentDirectoryScanner(Generic[T]):
+    """
+    Lists directories using a thread pool, ahead of the caller.
+
+    Caller gets listing results in the same order as it would be without prefetching,
+    so filters and limits are applied to the same entries.
+
+    Directories passed to :obj:`~schedule` are listed in the background,
+    in the depth-first order they are expected to be requested by :obj:`~scan`.
+    Number of directories listed ahead of the caller is bounded, so memory usage is not growing
+    in case of large number of subdirectories.
+    """
+
+    def __init__(self, scan: Callable[[RemotePath], T], workers: int, prefetch: int | None = None):
+        self._scan = scan
+        self._max_prefetch = prefetch or workers * 4
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="onetl-walk")
+        self._futures: dict[RemotePath, Future] = {}
+        self._pending: deque[RemotePath] = deque()
+        self._requested: set[RemotePath] = set()
+
+    def schedule(self, paths: Iterable[RemotePath]) -> None:
+        """
+        Schedule directories listing. These directories will be requested next, in the same order
+        """
+
+        # nested directories are requested before siblings of their parent, so put them in the front
+        self._pending.extendleft(reversed(list(paths)))
+        self._submit_pending()
+
+    def scan(self, path: RemotePath) -> T:
+        self._requested.add(path)
+        future = self._futures.pop(path, None)
+        if future is None:
+            future = self._executor.submit(self._scan, path)
+
+        self._submit_pending()
+        return future.result()
+
+    def close(self) -> None:
+        """
+        Cancel all pending listings (e.g. after reaching limits) and stop worker threads
+        """
+
+        self._pending.clear()
+        for future in self._futures.values():
+            future.cancel()
+
+        self._futures.clear()
+        self._executor.shutdown(wait=True)
+
+    def _submit_pending(self) -> None:
+        while self._pending and len(self._futures) < self._max_prefetch:
+            path = self._pending.popleft()
+            if path not in self._futures and path not in self._requested:
+                self._futures[path] = self._executor.submit(self._scan, path)
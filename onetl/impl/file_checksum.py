@@ -0,0 +1,116 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import textwrap
+import zlib
+from typing import BinaryIO
+
+from onetl.impl.remote_file_stream import DEFAULT_CHUNK_SIZE
+
+HASHLIB_ALGORITHMS = frozenset(("md5", "sha1", "sha256", "sha512"))
+SUPPORTED_CHECKSUM_ALGORITHMS = HASHLIB_ALGORITHMS | {"crc32", "crc32c"}
+
+
+class FileChecksum:
+    """
+    Checksum of file content, calculated while file is being transferred.
+
+    Supported algorithms:
+        * ``md5``, ``sha1``, ``sha256``, ``sha512`` - using :obj:`hashlib`
+        * ``crc32`` - using :obj:`zlib.crc32`
+        * ``crc32c`` - requires `crc32c <https://pypi.org/project/crc32c/>`_ package to be installed
+
+    Examples
+    --------
+
+    .. code:: python
+
+        from onetl.impl import FileChecksum
+
+        checksum = FileChecksum("md5")
+        connection.download_file("/remote/file.csv", "/local/file.csv", checksum=checksum)
+
+        assert checksum.hexdigest() == "d41d8cd98f00b204e9800998ecf8427e"
+    """
+
+    def __init__(self, algorithm: str):
+        algorithm = algorithm.lower()
+        if algorithm not in SUPPORTED_CHECKSUM_ALGORITHMS:
+            supported = ", ".join(map(repr, sorted(SUPPORTED_CHECKSUM_ALGORITHMS)))
+            raise ValueError(f"Unsupported checksum algorithm {algorithm!r}, should be one of {supported}")
+
+        self.algorithm = algorithm
+        self._hash = hashlib.new(algorithm) if algorithm in HASHLIB_ALGORITHMS else None
+        self._crc = 0
+
+        if algorithm == "crc32c":
+            self._crc32c = _import_crc32c()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.algorithm!r})"
+
+    def update(self, data: bytes) -> None:
+        if self._hash is not None:
+            self._hash.update(data)
+        elif self.algorithm == "crc32":
+            self._crc = zlib.crc32(data, self._crc)
+        else:
+            self._crc = self._crc32c(data, self._crc)
+
+    def hexdigest(self) -> str:
+        if self._hash is not None:
+            return self._hash.hexdigest()
+
+        # big-endian, like in SFTP "check-file" extension and HDFS composite CRC
+        return f"{self._crc:08x}"
+
+    def copy(self, source: BinaryIO, target: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Copy content from ``source`` stream to ``target`` one, updating checksum with each chunk.
+
+        Returns number of copied bytes.
+        """
+
+        copied = 0
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+
+            self.update(chunk)
+            target.write(chunk)
+            copied += len(chunk)
+
+        return copied
+
+
+def _import_crc32c():
+    try:
+        from crc32c import crc32c
+    except (ImportError, NameError) as e:
+        raise ImportError(
+            textwrap.dedent(
+                """
+                Cannot import module "crc32c".
+
+                You should install package as follows:
+                    pip install crc32c
+                """,
+            ).strip(),
+        ) from e
+
+    return crc32c
@@ -0,0 +1,96 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import textwrap
+from enum import Enum
+from typing import BinaryIO
+
+
+class FileCompression(str, Enum):
+    """
+    Compression codec applied to file content while it is being transferred.
+
+    ``zstd`` requires `zstandard <https://pypi.org/project/zstandard/>`_ package to be installed.
+    """
+
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    ZSTD = "zstd"
+
+    def __str__(self):
+        return str(self.value)
+
+    @property
+    def extension(self) -> str:
+        """File name extension used by this codec, like ``.gz``"""
+        return _EXTENSIONS[self]
+
+    def compress(self, target: BinaryIO) -> BinaryIO:
+        """
+        Returns writable stream which compresses data and writes it to ``target``.
+
+        Closing returned stream writes the end of compressed data, but does not close ``target``.
+        """
+
+        if self == FileCompression.GZIP:
+            return gzip.GzipFile(fileobj=target, mode="wb")  # type: ignore[return-value]
+
+        if self == FileCompression.BZ2:
+            return bz2.BZ2File(target, mode="wb")  # type: ignore[return-value]
+
+        return _import_zstandard().ZstdCompressor().stream_writer(target, closefd=False)
+
+    def decompress(self, source: BinaryIO) -> BinaryIO:
+        """
+        Returns readable stream which reads compressed data from ``source`` and decompresses it.
+
+        ``source`` is read sequentially, so it may be not seekable. Closing returned stream does not close ``source``.
+        """
+
+        if self == FileCompression.GZIP:
+            return gzip.GzipFile(fileobj=source, mode="rb")  # type: ignore[return-value]
+
+        if self == FileCompression.BZ2:
+            return bz2.BZ2File(source, mode="rb")  # type: ignore[return-value]
+
+        return _import_zstandard().ZstdDecompressor().stream_reader(source, closefd=False)
+
+
+_EXTENSIONS = {
+    FileCompression.GZIP: ".gz",
+    FileCompression.BZ2: ".bz2",
+    FileCompression.ZSTD: ".zst",
+}
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except (ImportError, NameError) as e:
+        raise ImportError(
+            textwrap.dedent(
+                """
+                Cannot import module "zstandard".
+
+                You should install package as follows:
+                    pip install zstandard
+                """,
+            ).strip(),
+        ) from e
+
+    return zstandard
@@ -0,0 +1,162 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+import secrets
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+# copy_file_range and sendfile can copy at most 2GiB per call on some kernels
+MAX_COPY_RANGE_SIZE = 1024 * 1024 * 1024  # 1GiB
+
+# errors meaning that syscall is not supported for a specific pair of files, like different filesystems
+COPY_RANGE_UNSUPPORTED_ERRORS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EPERM", None),
+    )
+    if code is not None
+)
+
+
+def copy_file(source: os.PathLike | str, target: os.PathLike | str, fsync: bool = False) -> None:
+    """
+    Copy file content from source to target, without copying metadata.
+
+    Uses ``copy_file_range`` syscall (Linux, Python 3.8+), which allows filesystem to copy data
+    without passing it through user space, or even to share data blocks between files (reflink, e.g. on Btrfs or XFS),
+    and NFS 4.2 server to copy file without sending its content over network.
+
+    If it is not supported (e.g. files are located on different filesystems on old kernels), ``sendfile`` is used,
+    which still copies data inside the kernel. Otherwise falls back to :obj:`shutil.copyfileobj`.
+
+    If ``fsync=True``, target file content is flushed to disk before returning.
+    """
+
+    with open(source, "rb") as source_file, open(target, "wb") as target_file:
+        source_fd = source_file.fileno()
+        target_fd = target_file.fileno()
+        size = os.fstat(source_fd).st_size
+
+        copied = hasattr(os, "copy_file_range") and _copy_by_chunks(_copy_file_range, source_fd, target_fd, size)
+        if not copied:
+            _rewind(source_file, target_file)
+            copied = hasattr(os, "sendfile") and _copy_by_chunks(_sendfile, source_fd, target_fd, size)
+
+        if not copied:
+            _rewind(source_file, target_file)
+            shutil.copyfileobj(source_file, target_file)
+            target_file.flush()
+
+        if fsync:
+            os.fsync(target_fd)
+
+
+def move_file(source: os.PathLike | str, target: os.PathLike | str) -> None:
+    """
+    Move file from source to target, replacing existing target file.
+
+    If both paths are located on the same filesystem, file is renamed using :obj:`os.replace`, which is atomic.
+
+    Otherwise content is copied using :obj:`copy_file` to a temporary file in the target directory,
+    flushed to disk, and then renamed to target path. So target file is never seen partially written,
+    and existing target file is replaced only after new content is successfully copied.
+    Source file is removed after that.
+    """
+
+    try:
+        os.replace(source, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    target_path = Path(target)
+    partial_path = target_path.with_name(f".{target_path.name}.{secrets.token_hex(5)}.tmp")
+    try:
+        copy_file(source, partial_path, fsync=True)
+        os.replace(partial_path, target_path)
+    except Exception:
+        with contextlib.suppress(OSError):
+            os.remove(partial_path)
+        raise
+
+    os.remove(source)
+
+
+def is_same_device(path1: os.PathLike | str, path2: os.PathLike | str) -> bool:
+    """
+    Returns ``True`` if both paths are located on the same filesystem, so files can be renamed between them.
+
+    Paths may not exist yet, in this case their nearest existing parent directories are checked.
+    """
+
+    return _get_device(Path(path1)) == _get_device(Path(path2))
+
+
+def _get_device(path: Path) -> int:
+    for item in (path, *path.absolute().parents):
+        with contextlib.suppress(FileNotFoundError):
+            return os.stat(item).st_dev
+
+    raise FileNotFoundError(f"Path '{path}' does not exist")
+
+
+def _copy_file_range(source_fd: int, target_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(source_fd, target_fd, count, offset, offset)
+
+
+def _sendfile(source_fd: int, target_fd: int, offset: int, count: int) -> int:
+    # target offset is changed by syscall itself
+    return os.sendfile(target_fd, source_fd, offset, count)
+
+
+def _copy_by_chunks(copy_chunk: Callable[[int, int, int, int], int], source_fd: int, target_fd: int, size: int) -> bool:
+    if not size:
+        # some filesystems (e.g. procfs) report zero size for files with content
+        return False
+
+    copied = 0
+    while copied < size:
+        try:
+            chunk = copy_chunk(source_fd, target_fd, copied, min(size - copied, MAX_COPY_RANGE_SIZE))
+        except OSError as e:
+            if e.errno in COPY_RANGE_UNSUPPORTED_ERRORS:
+                return False
+            raise
+
+        if not chunk:
+            # file was truncated while copying
+            return False
+
+        copied += chunk
+
+    return True
+
+
+def _rewind(source_file: BinaryIO, target_file: BinaryIO) -> None:
+    # previous copy method could fail in the middle of a file
+    source_file.seek(0)
+    target_file.seek(0)
+    target_file.truncate()
@@ -0,0 +1,121 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+from onetl.base import PathStatProtocol
+from onetl.impl.remote_path import RemotePath
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass
+class _CacheEntry:
+    expires_at: float
+    is_dir: Optional[bool] = None
+    stat: Optional[PathStatProtocol] = None
+
+
+class PathStatCache:
+    """
+    Thread-safe cache of remote paths metadata (path type and stats) with TTL.
+
+    Only existing paths are cached, so missing entry means "unknown", not "does not exist".
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[RemotePath, _CacheEntry] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def exists(self, path: RemotePath, count: bool = True) -> bool:
+        """
+        If ``count=False``, lookup is not included into cache statistics,
+        e.g. if miss is already recorded by another lookup of the same path.
+        """
+
+        return self._get(path, "expires_at", count=count) is not None
+
+    def get_is_dir(self, path: RemotePath) -> bool | None:
+        return self._get(path, "is_dir")
+
+    def get_stat(self, path: RemotePath) -> PathStatProtocol | None:
+        return self._get(path, "stat")
+
+    def update(self, path: RemotePath, is_dir: bool | None = None, stat: PathStatProtocol | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(path)
+            if entry is None or entry.expires_at <= now:
+                entry = self._entries[path] = _CacheEntry(expires_at=now + self.ttl)
+
+            if is_dir is not None:
+                entry.is_dir = is_dir
+            if stat is not None:
+                entry.stat = stat
+
+    def invalidate(self, path: RemotePath, recursive: bool = False) -> None:
+        """
+        Remove path from cache, as well as its parent (its stats are changed too).
+
+        If ``recursive=True``, also removes all nested paths.
+        """
+
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries.pop(path.parent, None)
+
+            if recursive:
+                nested = [entry_path for entry_path in self._entries if path in entry_path.parents]
+                for entry_path in nested:
+                    del self._entries[entry_path]
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(hits=self._hits, misses=self._misses, size=len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _get(self, path: RemotePath, attribute: str, count: bool = True):
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[path]
+                entry = None
+
+            value = getattr(entry, attribute) if entry is not None else None
+            if not count:
+                return value
+
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+            return value
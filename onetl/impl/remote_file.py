@@ -32,6 +32,10 @@ class RemoteFile(PathContainer[RemotePath]):
     stats: PathStatProtocol
 
     def __post_init__(self):
+        if isinstance(self.path, RemotePath):
+            # parsing path again is quite expensive, and there are millions of such objects while walking a tree
+            return
+
         # frozen=True does not allow to change any field in __post_init__, small hack here
         object.__setattr__(self, "path", RemotePath(self.path))  # noqa: WPS609
 
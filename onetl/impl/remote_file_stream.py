@@ -0,0 +1,176 @@
+#  Copyright 2023 MTS (Mobile Telesystems)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import io
+from contextlib import ExitStack
+from typing import Any, BinaryIO, Callable, ContextManager, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MiB
+
+# content written to connections without streaming upload support is kept in memory until reaching this size,
+# and then moved to a temp file on disk
+SPOOLED_MAX_SIZE = 16 * 1024 * 1024  # 16MiB
+
+
+class RawRemoteFileReader(io.RawIOBase):
+    """
+    Unbuffered seekable reader of remote file.
+
+    Remote stream is opened lazily by calling ``open_at(offset)``.
+    Seeking to another position closes current stream, and the next read opens a new one
+    starting from the requested offset. So sequential reads are performed using just one request.
+    """
+
+    def __init__(self, open_at: Callable[[int], ContextManager[BinaryIO]], size: Optional[int] = None):
+        super().__init__()
+        self._open_at = open_at
+        self._size = size
+        self._position = 0
+        self._stream: Optional[BinaryIO] = None
+        self._exit_stack = ExitStack()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            if self._size is None:
+                raise io.UnsupportedOperation("File size is unknown, cannot seek relative to the end")
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        if position != self._position:
+            self._close_stream()
+            self._position = position
+
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        if self._size is not None and self._position >= self._size:
+            return 0
+
+        if self._stream is None:
+            self._stream = self._exit_stack.enter_context(self._open_at(self._position))
+
+        readinto = getattr(self._stream, "readinto", None)
+        if readinto:
+            read_bytes = readinto(buffer) or 0
+        else:
+            # some clients support only read()
+            data = self._stream.read(len(buffer))
+            read_bytes = len(data)
+            memoryview(buffer).cast("B")[:read_bytes] = data
+
+        self._position += read_bytes
+        return read_bytes
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._close_stream()
+            finally:
+                super().close()
+
+    def _close_stream(self) -> None:
+        self._stream = None
+        self._exit_stack.close()
+
+
+class RawRemoteFileWriter(io.RawIOBase):
+    """
+    Unbuffered writer of remote file.
+
+    Wraps a context manager returning writable stream. File is committed by exiting it on :obj:`~close`,
+    while :obj:`~abort` passes an exception into the context manager, so it can drop written content.
+    """
+
+    def __init__(self, target: ContextManager[BinaryIO]):
+        super().__init__()
+        self._exit_stack = ExitStack()
+        self._stream = self._exit_stack.enter_context(target)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        # buffer passed by BufferedWriter can be reused after return, and some clients are writing asynchronously
+        chunk = bytes(data)
+        self._stream.write(chunk)
+        return len(chunk)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._exit_stack.close()
+            finally:
+                super().close()
+
+    def abort(self, exc_type, exc_value, traceback) -> None:
+        if not self.closed:
+            try:
+                self._exit_stack.__exit__(exc_type, exc_value, traceback)
+            finally:
+                super().close()
+
+
+class RemoteFileReader(io.BufferedReader):
+    """
+    Buffered binary stream for reading remote file, returned by ``FileConnection.open(path, mode="rb")``.
+
+    Supports all methods of :obj:`io.BufferedReader`, like ``read``, ``read1``, ``readinto``, ``seek`` and ``tell``.
+    Reading into a buffer larger than the internal one skips the internal buffer, so data is not copied twice.
+    """
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over file content by chunks of specified size (the last chunk can be smaller).
+        """
+
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class RemoteFileWriter(io.BufferedWriter):
+    """
+    Buffered binary stream for writing remote file, returned by ``FileConnection.open(path, mode="wb")``.
+
+    File content is committed on ``close()``. If used as context manager, and exception is raised within it,
+    written content is not committed, if the underlying filesystem supports that.
+    """
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            return super().__exit__(exc_type, exc_value, traceback)
+
+        self.raw.abort(exc_type, exc_value, traceback)
+        return None
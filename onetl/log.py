@@ -17,12 +17,15 @@ from __future__ import annotations
 import io
 import json
 import logging
+import time
 from contextlib import redirect_stdout
+from datetime import timedelta
 from enum import Enum
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, Iterable
 
 from deprecated import deprecated
+from humanize import naturalsize
 
 if TYPE_CHECKING:
     from pyspark.sql import DataFrame
@@ -34,6 +37,7 @@ root_log = logging.getLogger()
 HALF_SCREEN_SIZE = 45
 BASE_LOG_INDENT = 8
 LOG_FORMAT = "%(asctime)s [%(levelname)-8s] %(message)s"
+PROGRESS_LOG_INTERVAL = 10  # seconds
 CLIENT_MODULES = {"hdfs", "paramiko", "ftputil", "smbclient"}
 
 DISABLED = 9999  # CRITICAL is 50, we need even higher to disable all logs
@@ -275,6 +279,58 @@ def log_collection(name: str, collection: Iterable, indent: int = 0, level: int
     log.log(level, "%s]", base_indent)
 
 
+class ProgressLog:
+    """Periodically log progress of handling large number of files.
+
+    Message is logged not more often than once per ``interval`` seconds, and after handling the last file.
+
+    Examples
+    --------
+
+    .. code:: python
+
+        progress = ProgressLog(name="FileDownloader", action="Downloaded", total=500_000)
+
+        for i, file in enumerate(files):
+            download(file)
+            progress.update(handled=i + 1, size=downloaded_size)
+
+    .. code-block:: text
+
+        INFO  onetl.module        |FileDownloader| Downloaded 1500 of 500000 files (size='1.5 GB'), 150.0 files/s, 153.6 MB/s, ETA 0:55:23
+
+    """
+
+    def __init__(self, name: str, action: str, total: int, interval: float = PROGRESS_LOG_INTERVAL):
+        self.name = name
+        self.action = action
+        self.total = total
+        self.interval = interval
+        self._started_at = self._logged_at = time.monotonic()
+
+    def update(self, handled: int, size: int) -> None:
+        now = time.monotonic()
+        if handled < self.total and now - self._logged_at < self.interval:
+            return
+
+        self._logged_at = now
+        elapsed = max(now - self._started_at, 1e-6)
+        files_per_second = handled / elapsed
+        eta = timedelta(seconds=round((self.total - handled) / files_per_second)) if handled else "unknown"
+
+        log.info(
+            "|%s| %s %d of %d files (size=%r), %.1f files/s, %s/s, ETA %s",
+            self.name,
+            self.action,
+            handled,
+            self.total,
+            naturalsize(size),
+            files_per_second,
+            naturalsize(size / elapsed),
+            eta,
+        )
+
+
 def entity_boundary_log(msg: str, char: str = "=") -> None:
     """Prints message with boundary characters.
 
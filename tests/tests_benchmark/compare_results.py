@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark reports, and exit with non-zero code if some operation became slower.
+
+Usage:
+    python tests/tests_benchmark/compare_results.py baseline.json reports/benchmark.json --threshold 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def load_results(path: Path) -> dict[tuple[str, str], float]:
+    report = json.loads(path.read_text())
+    return {(item["connection"], item["operation"]): item["seconds"] for item in report["results"]}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path, help="Report to compare with")
+    parser.add_argument("current", type=Path, help="Report of current run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Max allowed ratio of current time to baseline time (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+
+    regressions = 0
+    print(f"{'connection':<12} {'operation':<24} {'baseline, s':>12} {'current, s':>12} {'ratio':>7}")
+    for key in sorted(baseline.keys() & current.keys()):
+        connection, operation = key
+        ratio = current[key] / baseline[key] if baseline[key] else float("inf")
+        marker = ""
+        if ratio > args.threshold:
+            regressions += 1
+            marker = "  <-- REGRESSION"
+
+        print(f"{connection:<12} {operation:<24} {baseline[key]:>12.3f} {current[key]:>12.3f} {ratio:>7.2f}{marker}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import onetl
+
+# Benchmarks are not collected by default (see `norecursedirs` in pytest.ini), run them explicitly:
+#   pytest tests/tests_benchmark -m "ftp or local_fs"
+BENCHMARK_FILES = int(os.getenv("ONETL_BENCHMARK_FILES", "1000"))
+BENCHMARK_FILE_SIZE = int(os.getenv("ONETL_BENCHMARK_FILE_SIZE", "1024"))
+BENCHMARK_FILES_PER_DIR = 100
+BENCHMARK_RESULTS = os.getenv("ONETL_BENCHMARK_RESULTS", "reports/benchmark.json")
+
+
+class BenchmarkResults:
+    def __init__(self):
+        self.results = []
+
+    @contextmanager
+    def measure(self, connection, operation: str, files: int, size: int):
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+
+        self.results.append(
+            {
+                "connection": connection.__class__.__name__,
+                "operation": operation,
+                "files": files,
+                "bytes": size,
+                "seconds": round(seconds, 6),
+                "files_per_second": round(files / seconds, 3) if seconds else None,
+            },
+        )
+
+    def dump(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "onetl_version": onetl.__version__,
+            "python_version": platform.python_version(),
+            "platform": sys.platform,
+            "files_count": BENCHMARK_FILES,
+            "file_size": BENCHMARK_FILE_SIZE,
+            "results": self.results,
+        }
+        path.write_text(json.dumps(report, indent=2))
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = BenchmarkResults()
+    yield results
+
+    if results.results:
+        results.dump(Path(BENCHMARK_RESULTS))
+
+
+@pytest.fixture(scope="session")
+def benchmark_tree(tmp_path_factory):
+    """
+    Local directory with ``ONETL_BENCHMARK_FILES`` files of ``ONETL_BENCHMARK_FILE_SIZE`` bytes,
+    ``BENCHMARK_FILES_PER_DIR`` files per directory, with 2 levels of nesting.
+    """
+
+    root = tmp_path_factory.mktemp("benchmark_tree")
+    content = os.urandom(BENCHMARK_FILE_SIZE)
+
+    files = []
+    for i in range(BENCHMARK_FILES):
+        directory = i // BENCHMARK_FILES_PER_DIR
+        path = root / f"dir_{directory // 10}" / f"subdir_{directory % 10}" / f"file_{i}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        files.append(path)
+
+    return root, files
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from onetl.file import FileDownloader
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def test_file_connection_benchmark(
+    file_all_connections,
+    source_path,
+    benchmark_tree,
+    benchmark_results,
+    tmp_path_factory,
+):
+    local_root, local_files = benchmark_tree
+    files_count = len(local_files)
+    total_size = sum(file.stat().st_size for file in local_files)
+    remote_files = [source_path / file.relative_to(local_root) for file in local_files]
+
+    with benchmark_results.measure(file_all_connections, "upload_file", files_count, total_size):
+        for local_file, remote_file in zip(local_files, remote_files):
+            file_all_connections.upload_file(local_file, remote_file)
+
+    with benchmark_results.measure(file_all_connections, "walk", files_count, total_size):
+        walked = [root / file for root, _dirs, files in file_all_connections.walk(source_path) for file in files]
+
+    assert sorted(map(os.fspath, walked)) == sorted(map(os.fspath, remote_files))
+
+    concurrent_connection = file_all_connections.copy(update={"walk_workers": 4})
+    with benchmark_results.measure(file_all_connections, "walk(walk_workers=4)", files_count, total_size):
+        walked = [root / file for root, _dirs, files in concurrent_connection.walk(source_path) for file in files]
+
+    assert len(walked) == files_count
+
+    local_path = tmp_path_factory.mktemp("benchmark_download_file")
+    with benchmark_results.measure(file_all_connections, "download_file", files_count, total_size):
+        for remote_file in remote_files:
+            file_all_connections.download_file(remote_file, local_path / remote_file.relative_to(source_path))
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=tmp_path_factory.mktemp("benchmark_downloader"),
+    )
+    with benchmark_results.measure(file_all_connections, "FileDownloader.run", files_count, total_size):
+        download_result = downloader.run()
+
+    assert not download_result.failed
+    assert download_result.successful_count == files_count
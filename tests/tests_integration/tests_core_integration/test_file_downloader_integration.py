@@ -1,3 +1,6 @@
+import asyncio
+import gzip
+import hashlib
 import logging
 import os
 import re
@@ -97,6 +100,141 @@ def test_downloader_run(
         assert local_file.read_bytes() == file_all_connections.read_bytes(remote_file)
 
 
+def test_downloader_arun(file_all_connections, source_path, upload_test_files, tmp_path_factory):
+    local_path = tmp_path_factory.mktemp("local_path")
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=local_path,
+    )
+
+    download_result = asyncio.run(downloader.arun())
+
+    assert not download_result.failed
+    assert not download_result.skipped
+    assert not download_result.missing
+    assert sorted(download_result.successful) == sorted(
+        local_path / file.relative_to(source_path) for file in upload_test_files
+    )
+
+
+def test_downloader_run_with_checksum(file_all_connections, source_path, upload_test_files, tmp_path_factory):
+    local_path = tmp_path_factory.mktemp("local_path")
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=local_path,
+        options=FileDownloader.Options(checksum_algorithm="md5"),
+    )
+
+    download_result = downloader.run()
+
+    assert not download_result.failed
+    assert download_result.successful
+    assert download_result.checksums.keys() == set(download_result.successful)
+    for local_file in download_result.successful:
+        assert download_result.checksums[local_file] == hashlib.md5(local_file.read_bytes()).hexdigest()  # noqa: S303
+
+
+def test_downloader_run_with_compression(request, file_all_connections, tmp_path_factory):
+    source_path = PurePosixPath(f"/tmp/test_download_{secrets.token_hex(5)}")
+    local_path = tmp_path_factory.mktemp("local_path")
+
+    def finalizer():
+        file_all_connections.remove_dir(source_path, recursive=True)
+
+    request.addfinalizer(finalizer)
+
+    content = b"some content" * 100
+    compressed = gzip.compress(content)
+    file_all_connections.write_bytes(source_path / "file.csv.gz", compressed)
+    file_all_connections.write_bytes(source_path / "nested" / "file.txt.gz", compressed)
+    file_all_connections.write_bytes(source_path / ".gz", compressed)
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=local_path,
+        options=FileDownloader.Options(compression="gzip"),
+    )
+
+    download_result = downloader.run()
+
+    assert not download_result.failed
+    assert sorted(download_result.successful) == sorted(
+        [
+            local_path / "file.csv",
+            local_path / "nested" / "file.txt",
+            local_path / ".gz",
+        ],
+    )
+
+    for local_file in download_result.successful:
+        assert local_file.read_bytes() == content
+        assert download_result.original_sizes[local_file] == len(compressed)
+
+
+def test_downloader_run_with_sync_index(file_all_connections, source_path, upload_test_files, tmp_path_factory):
+    local_path = tmp_path_factory.mktemp("local_path")
+    sync_index = tmp_path_factory.mktemp("sync_index") / "index.db"
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=local_path,
+        options=FileDownloader.Options(sync_index=sync_index, sync_delete=True),
+    )
+
+    download_result = downloader.run()
+    assert not download_result.failed
+    assert not download_result.skipped
+    assert len(download_result.successful) == len(upload_test_files)
+
+    # nothing is changed
+    download_result = downloader.run()
+    assert not download_result.failed
+    assert not download_result.successful
+    assert sorted(download_result.skipped) == sorted(upload_test_files)
+
+    changed_file, removed_file, *_ = upload_test_files
+    file_all_connections.write_bytes(changed_file, b"changed content")
+    file_all_connections.remove_file(removed_file)
+
+    download_result = downloader.run()
+    assert not download_result.failed
+    assert download_result.successful == {local_path / changed_file.relative_to(source_path)}
+    assert len(download_result.skipped) == len(upload_test_files) - 2
+
+    assert (local_path / changed_file.relative_to(source_path)).read_bytes() == b"changed content"
+    assert not (local_path / removed_file.relative_to(source_path)).exists()
+
+
+def test_downloader_run_on_spark(spark, file_all_connections, source_path, upload_test_files, tmp_path_factory):
+    local_path = tmp_path_factory.mktemp("local_path")
+    temp_path = tmp_path_factory.mktemp("tmp")
+
+    downloader = FileDownloader(
+        connection=file_all_connections,
+        source_path=source_path,
+        local_path=local_path,
+        temp_path=temp_path,
+    )
+
+    download_result = downloader.run_on_spark(spark, partitions=2)
+
+    assert not download_result.failed
+    assert not download_result.skipped
+    assert not download_result.missing
+    assert sorted(download_result.successful) == sorted(
+        local_path / file.relative_to(source_path) for file in upload_test_files
+    )
+
+    # temp directories of all tasks are removed
+    assert not list(temp_path.rglob("*"))
+
+
 def test_downloader_run_delete_source(
     file_all_connections,
     source_path,
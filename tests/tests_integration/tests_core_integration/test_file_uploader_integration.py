@@ -1,3 +1,6 @@
+import gzip
+import hashlib
+import json
 import logging
 import os
 import re
@@ -130,6 +133,89 @@ def test_uploader_run_with_local_path(request, file_all_connections, resource_pa
         assert file_all_connections.read_bytes(remote_file) == local_file.read_bytes()
 
 
+def test_uploader_run_with_checksum(request, file_all_connections, test_files):
+    target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
+
+    def finalizer():
+        file_all_connections.remove_dir(target_path, recursive=True)
+
+    request.addfinalizer(finalizer)
+
+    uploader = FileUploader(
+        connection=file_all_connections,
+        target_path=target_path,
+        options=FileUploader.Options(checksum_algorithm="sha256"),
+    )
+
+    upload_result = uploader.run(test_files)
+
+    assert not upload_result.failed
+    assert len(upload_result.checksums) == len(test_files)
+    for local_file in test_files:
+        remote_file = target_path / local_file.name
+        assert upload_result.checksums[remote_file] == hashlib.sha256(local_file.read_bytes()).hexdigest()
+
+
+def test_uploader_run_with_compression(request, file_all_connections, test_files):
+    target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
+
+    def finalizer():
+        file_all_connections.remove_dir(target_path, recursive=True)
+
+    request.addfinalizer(finalizer)
+
+    uploader = FileUploader(
+        connection=file_all_connections,
+        target_path=target_path,
+        options=FileUploader.Options(compression="gzip"),
+    )
+
+    upload_result = uploader.run(test_files)
+
+    assert not upload_result.failed
+    assert sorted(upload_result.successful) == sorted(target_path / f"{file.name}.gz" for file in test_files)
+
+    for local_file in test_files:
+        remote_file = target_path / f"{local_file.name}.gz"
+        assert upload_result.original_sizes[remote_file] == local_file.stat().st_size
+        assert gzip.decompress(file_all_connections.read_bytes(remote_file)) == local_file.read_bytes()
+
+
+def test_uploader_run_with_pack_size(request, file_all_connections, resource_path, test_files):
+    target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
+
+    def finalizer():
+        file_all_connections.remove_dir(target_path, recursive=True)
+
+    request.addfinalizer(finalizer)
+
+    uploader = FileUploader(
+        connection=file_all_connections,
+        target_path=target_path,
+        local_path=resource_path,
+        options=FileUploader.Options(pack_size="1KiB"),
+    )
+
+    upload_result = uploader.run(test_files)
+
+    assert not upload_result.failed
+    assert not upload_result.missing
+    assert upload_result.packed.keys() == set(test_files)
+    assert set(upload_result.packed.values()) == {file.path for file in upload_result.successful}
+    assert all(file.name.endswith(".tar") for file in upload_result.successful)
+
+    # every file can be read from archive using offset from manifest
+    for archive in upload_result.successful:
+        content = file_all_connections.read_bytes(archive)
+        manifest = file_all_connections.read_text(archive.path.with_name(archive.name + ".manifest.jsonl"))
+
+        for line in manifest.splitlines():
+            entry = json.loads(line)
+            local_file = resource_path / entry["name"]
+            assert upload_result.packed[local_file] == archive.path
+            assert content[entry["offset"] : entry["offset"] + entry["size"]] == local_file.read_bytes()
+
+
 def test_uploader_run_missing_file(request, file_all_connections, test_files, caplog):
     target_path = PurePosixPath(f"/tmp/test_upload_{secrets.token_hex(5)}")
 
@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import os
 import secrets
 from pathlib import PurePosixPath
@@ -7,7 +9,7 @@ from pytest_lazyfixture import lazy_fixture
 
 from onetl.base import SupportsRenameDir
 from onetl.exception import DirectoryExistsError, DirectoryNotFoundError, NotAFileError
-from onetl.impl import RemotePath
+from onetl.impl import FileChecksum, RemotePath
 
 
 @pytest.mark.parametrize("path_type", [str, PurePosixPath])
@@ -226,6 +228,59 @@ def test_file_connection_write_bytes(file_all_connections, source_path, file_nam
     assert file_all_connections.read_bytes(source_path / file_name) == b"ascii test text"
 
 
+def test_file_connection_open_read(file_all_connections, upload_files_with_encoding):
+    with file_all_connections.open(upload_files_with_encoding["ascii"], mode="rb") as file:
+        assert file.read(4) == b"test"
+
+        file.seek(13)
+        assert file.tell() == 13
+
+        buffer = bytearray(4)
+        assert file.readinto(buffer) == 4
+        assert buffer == b"test"
+
+        file.seek(-5, os.SEEK_END)
+        assert file.read() == b"file\n"
+
+        file.seek(0)
+        assert b"".join(file.iter_chunks(3)) == b"test text in test file\n"
+
+
+@pytest.mark.parametrize(
+    "path,exception",
+    [(lazy_fixture("source_path"), NotAFileError), ("/no_such_file.txt", FileNotFoundError)],
+)
+def test_file_connection_open_read_negative(
+    file_all_connections,
+    source_path,
+    upload_files_with_encoding,
+    path,
+    exception,
+):
+    with pytest.raises(exception):
+        file_all_connections.open(path, mode="rb")
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["file_connection_open_write.txt", "file_connection_utf.txt"],
+    ids=["new file", "file existed"],
+)
+def test_file_connection_open_write(file_all_connections, source_path, file_name, upload_files_with_encoding):
+    content = secrets.token_bytes(1024 * 1024)
+
+    with file_all_connections.open(source_path / file_name, mode="wb") as file:
+        for i in range(0, len(content), 1000):
+            file.write(content[i : i + 1000])
+
+    assert file_all_connections.read_bytes(source_path / file_name) == content
+
+
+def test_file_connection_open_wrong_mode(file_all_connections, source_path):
+    with pytest.raises(ValueError, match="Unsupported mode 'r', should be 'rb' or 'wb'"):
+        file_all_connections.open(source_path / "some_file.txt", mode="r")
+
+
 def test_file_connection_write_text_fail_on_bytes_input(file_all_connections, source_path):
     with pytest.raises(TypeError):
         file_all_connections.write_text(path=source_path / "some_file_name.txt", content=b"bytes to text")
@@ -318,6 +373,38 @@ def test_file_connection_upload_file(file_all_connections, test_files, path_type
     assert file_all_connections.read_text(upload_result) == test_files[0].read_text()
 
 
+def test_file_connection_download_file_with_checksum(
+    file_all_connections,
+    source_path,
+    upload_test_files,
+    tmp_path_factory,
+):
+    local_path = tmp_path_factory.mktemp("local_path")
+    remote_file_path = source_path / "news_parse_zp/2018_03_05_10_00_00/newsage-zp-2018_03_05_10_00_00.csv"
+
+    checksum = FileChecksum("md5")
+    download_result = file_all_connections.download_file(
+        remote_file_path=remote_file_path,
+        local_file_path=local_path / "file.csv",
+        checksum=checksum,
+    )
+
+    assert download_result.read_bytes() == file_all_connections.read_bytes(remote_file_path)
+    assert checksum.hexdigest() == hashlib.md5(download_result.read_bytes()).hexdigest()  # noqa: S303
+
+
+def test_file_connection_upload_file_with_checksum(file_all_connections, test_files):
+    checksum = FileChecksum("sha256")
+    upload_result = file_all_connections.upload_file(
+        local_file_path=test_files[0],
+        remote_file_path=f"/tmp/test_upload_{secrets.token_hex(5)}",
+        checksum=checksum,
+    )
+
+    assert file_all_connections.read_bytes(upload_result) == test_files[0].read_bytes()
+    assert checksum.hexdigest() == hashlib.sha256(test_files[0].read_bytes()).hexdigest()
+
+
 @pytest.mark.parametrize(
     "path,exception",
     [
@@ -476,3 +563,53 @@ def test_file_connection_upload_replace_target_negative(
     assert (
         file_all_connections.read_text(source_path / "file_connection_utf.txt") == "тестовый текст в  тестовом файле\n"
     )
+
+
+def test_file_connection_to_async(file_all_connections, source_path, upload_test_files, tmp_path_factory):
+    local_path = tmp_path_factory.mktemp("local_path")
+    remote_files = [RemotePath(file) for file in upload_test_files]
+
+    async def run():
+        async with file_all_connections.to_async(workers=2) as connection:
+            downloaded = await asyncio.gather(
+                *(connection.download_file(file, local_path / file.relative_to(source_path)) for file in remote_files),
+            )
+
+            walked = []
+            async for root, _dirs, files in connection.walk(source_path):
+                walked.extend(os.fspath(root / file) for file in files)
+
+            return downloaded, walked
+
+    downloaded, walked = asyncio.run(run())
+
+    assert len(downloaded) == len(remote_files)
+    for local_file, remote_file in zip(downloaded, remote_files):
+        assert local_file.stat().st_size == file_all_connections.resolve_file(remote_file).stat().st_size
+
+    assert sorted(walked) == sorted(os.fspath(file) for file in remote_files)
+
+
+def test_file_connection_to_async_upload_file(request, file_all_connections, test_files):
+    target_path = RemotePath(f"/tmp/test_upload_{secrets.token_hex(5)}")
+
+    def finalizer():
+        file_all_connections.remove_dir(target_path, recursive=True)
+
+    request.addfinalizer(finalizer)
+
+    checksum = FileChecksum("md5")
+
+    async def run():
+        async with file_all_connections.to_async() as connection:
+            await connection.create_dir(target_path)
+            uploaded = await connection.upload_file(test_files[0], target_path / "file.txt", checksum=checksum)
+            renamed = await connection.rename_file(uploaded, target_path / "renamed.txt")
+            return uploaded, renamed
+
+    uploaded, renamed = asyncio.run(run())
+
+    assert uploaded.path == target_path / "file.txt"
+    assert renamed.path == target_path / "renamed.txt"
+    assert file_all_connections.read_bytes(renamed) == test_files[0].read_bytes()
+    assert checksum.hexdigest() == hashlib.md5(test_files[0].read_bytes()).hexdigest()  # noqa: S303
@@ -1,7 +1,10 @@
 import logging
+import os
 
 import pytest
 
+from tests.lib.common import upload_files
+
 pytestmark = [pytest.mark.webdav, pytest.mark.file_connection, pytest.mark.connection]
 
 
@@ -34,3 +37,28 @@ def test_webdav_wrong_source_check(webdav_server):
 
     with pytest.raises(RuntimeError, match="Connection is unavailable"):
         webdav.check()
+
+
+@pytest.mark.parametrize("topdown", [True, False])
+def test_webdav_walk_recursive_listing(webdav_data, resource_path, topdown):
+    webdav_connection, source_path = webdav_data
+    webdav_connection.remove_dir(source_path, recursive=True)
+    upload_files(resource_path, source_path, webdav_connection)
+
+    recursive_connection = webdav_connection.copy(update={"recursive_listing": True})
+
+    expected = [
+        (os.fspath(root), sorted(map(os.fspath, dirs)), sorted(map(os.fspath, files)))
+        for root, dirs, files in webdav_connection.walk(source_path, topdown=topdown)
+    ]
+    result = [
+        (os.fspath(root), sorted(map(os.fspath, dirs)), sorted(map(os.fspath, files)))
+        for root, dirs, files in recursive_connection.walk(source_path, topdown=topdown)
+    ]
+
+    assert sorted(result) == sorted(expected)
+
+    # directories outside of walked root are listed as usual, even while walk is in progress
+    expected_root = sorted(map(os.fspath, webdav_connection.list_dir(source_path)))
+    for _root, _dirs, _files in recursive_connection.walk(source_path / "news_parse_zp", topdown=topdown):
+        assert sorted(map(os.fspath, recursive_connection.list_dir(source_path))) == expected_root
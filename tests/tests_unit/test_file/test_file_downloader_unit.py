@@ -1,5 +1,7 @@
+import os
 import re
 import textwrap
+from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -8,8 +10,11 @@ from etl_entities import HWM, ColumnHWM, DateHWM, DateTimeHWM, IntHWM
 from onetl.base import BaseFileConnection
 from onetl.core import FileFilter, FileLimit
 from onetl.file import FileDownloader
+from onetl.file.file_downloader.resume_manifest import ResumeManifest
+from onetl.file.file_downloader.sync_index import SyncIndex
 from onetl.file.filter import Glob
 from onetl.file.limit import MaxFilesCount
+from onetl.impl import RemoteFile, RemotePath, RemotePathStat
 
 
 def test_file_downloader_deprecated_import():
@@ -75,6 +80,36 @@ def test_file_downloader_hwm_type_without_source_path():
         )
 
 
+def test_file_downloader_file_modified_since_hwm_with_limits():
+    with pytest.raises(ValueError, match="`limits` cannot be used with `hwm_type='file_modified_since'`"):
+        FileDownloader(
+            connection=Mock(),
+            local_path="/path",
+            source_path="/path",
+            limits=[MaxFilesCount(10)],
+            hwm_type="file_modified_since",
+        )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"hwm_max_age": timedelta(days=1)},
+        {"hwm_drop_missing": True},
+    ],
+)
+@pytest.mark.parametrize("hwm_type", [None, "file_modified_since"])
+def test_file_downloader_hwm_retention_unsupported_hwm_type(options, hwm_type):
+    with pytest.raises(ValueError, match="can be used only with `hwm_type='file_list'`"):
+        FileDownloader(
+            connection=Mock(),
+            local_path="/path",
+            source_path="/path",
+            hwm_type=hwm_type,
+            options=options,
+        )
+
+
 def test_file_downloader_filter_default():
     downloader = FileDownloader(
         connection=Mock(spec=BaseFileConnection),
@@ -149,3 +184,150 @@ def test_file_downloader_limit_legacy(file_limit):
         )
 
     assert downloader.limits == [file_limit]
+
+
+def test_file_downloader_run_on_spark_wrong_options(tmp_path):
+    downloader = FileDownloader(
+        connection=Mock(spec=BaseFileConnection),
+        local_path="/local/path",
+        source_path="/source/path",
+        options=FileDownloader.Options(resume_manifest=tmp_path / "manifest.jsonl"),
+    )
+
+    with pytest.raises(ValueError, match="Option `resume_manifest` is not supported by `run_on_spark`"):
+        downloader.run_on_spark(Mock())
+
+    downloader = FileDownloader(
+        connection=Mock(spec=BaseFileConnection),
+        local_path="/local/path",
+        source_path="/source/path",
+    )
+
+    with pytest.raises(ValueError, match="Number of partitions should be positive, got 0"):
+        downloader.run_on_spark(Mock(), partitions=0)
+
+
+def test_file_downloader_resume_manifest(tmp_path):
+    local_file = tmp_path / "local" / "file.txt"
+    local_file.parent.mkdir()
+    local_file.write_bytes(b"abc")
+
+    remote_file = RemoteFile("/remote/file.txt", stats=RemotePathStat(st_size=3, st_mtime=50))
+
+    manifest = ResumeManifest(tmp_path / "manifest.jsonl")
+    assert not manifest
+    assert not manifest.contains(remote_file, local_file)
+
+    manifest.add(remote_file, local_file)
+    manifest.close()
+
+    # incomplete line written by killed process is ignored
+    with open(tmp_path / "manifest.jsonl", "a") as file:
+        file.write('{"path": "/remote/another.txt", "si')
+
+    manifest = ResumeManifest(tmp_path / "manifest.jsonl")
+    assert len(manifest) == 1
+    assert manifest.contains(remote_file, local_file)
+    assert manifest.contains(RemotePath("/remote/file.txt"), local_file)
+
+    # remote file is changed
+    changed_file = RemoteFile("/remote/file.txt", stats=RemotePathStat(st_size=3, st_mtime=100))
+    assert not manifest.contains(changed_file, local_file)
+
+    # local file is changed
+    local_file.write_bytes(b"abcdef")
+    assert not manifest.contains(remote_file, local_file)
+
+    manifest.remove()
+    assert not (tmp_path / "manifest.jsonl").exists()
+
+
+def test_file_downloader_resume_manifest_malformed_lines(tmp_path):
+    local_file = tmp_path / "file.txt"
+    local_file.write_bytes(b"abc")
+
+    remote_file = RemoteFile("/remote/file.txt", stats=RemotePathStat(st_size=3, st_mtime=50))
+    another_file = RemoteFile("/remote/another.txt", stats=RemotePathStat(st_size=3, st_mtime=50))
+
+    # valid JSON values without required keys, and incomplete line without trailing newline
+    (tmp_path / "manifest.jsonl").write_text('{}\n[]\n"abc"\n{"path": "/remote/file.txt", "si')
+
+    manifest = ResumeManifest(tmp_path / "manifest.jsonl")
+    assert not manifest
+
+    # new entry is not merged with incomplete line
+    manifest.add(remote_file, local_file)
+    manifest.close()
+
+    manifest = ResumeManifest(tmp_path / "manifest.jsonl")
+    assert len(manifest) == 1
+    assert manifest.contains(remote_file, local_file)
+
+    manifest.add(another_file, local_file)
+    manifest.close()
+
+    assert len(ResumeManifest(tmp_path / "manifest.jsonl")) == 2
+
+
+def test_file_downloader_sync_index(tmp_path):
+    remote_file = RemoteFile("/remote/file.txt", stats=RemotePathStat(st_size=3, st_mtime=50))
+    local_file = tmp_path / "local" / "file.txt"
+
+    index = SyncIndex(tmp_path / "index.db")
+    assert not index
+    assert remote_file not in index
+    assert not index.is_unchanged(remote_file)
+
+    index.add(remote_file, local_file, checksum="900150983cd24fb0d6963f7d28e17f72")
+    index.close()
+
+    index = SyncIndex(tmp_path / "index.db")
+    assert len(index) == 1
+    assert remote_file in index
+    assert index.is_unchanged(remote_file)
+    assert dict(index.items()) == {
+        "/remote/file.txt": (3, 50, "900150983cd24fb0d6963f7d28e17f72", os.fspath(local_file)),
+    }
+
+    # remote file is changed
+    changed_file = RemoteFile("/remote/file.txt", stats=RemotePathStat(st_size=3, st_mtime=100))
+    assert remote_file in index
+    assert not index.is_unchanged(changed_file)
+
+    index.remove(remote_file)
+    index.close()
+
+    index = SyncIndex(tmp_path / "index.db")
+    assert not index
+    index.close()
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"sync_delete": True}, "Option `sync_delete` can be used only with `sync_index`"),
+        (
+            {"sync_index": "/index.db", "mode": "delete_all"},
+            "Option `sync_index` cannot be used with `mode='delete_all'`",
+        ),
+    ],
+)
+def test_file_downloader_sync_wrong_options(options, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        FileDownloader.Options(**options)
+
+
+def test_file_downloader_sync_delete_with_hwm():
+    with pytest.raises(ValueError, match="Option `sync_delete` cannot be used with `hwm_type`"):
+        FileDownloader(
+            connection=Mock(spec=BaseFileConnection),
+            local_path="/local/path",
+            source_path="/source/path",
+            hwm_type="file_list",
+            options=FileDownloader.Options(sync_index="/index.db", sync_delete=True),
+        )
+
+
+def test_file_downloader_compression_with_checksum():
+    with pytest.raises(ValueError, match="Options `compression` and `checksum_algorithm` cannot be used together"):
+        FileDownloader.Options(checksum_algorithm="md5", compression="gzip")
@@ -72,6 +72,40 @@ def test_file_set():
     assert len(empty_file_set) == 0  # noqa: WPS507
 
 
+def test_file_set_total_size_is_cached(tmp_path):
+    file1 = RemoteFile(path="a/b/c", stats=RemotePathStat(st_size=10, st_mtime=50))
+    file2 = RemoteFile(path="a/b/c/d", stats=RemotePathStat(st_size=20, st_mtime=50))
+    local_file = LocalPath(tmp_path / "file")
+    local_file.write_bytes(b"x" * 30)
+
+    file_set = FileSet([file1, file2, local_file])
+    assert file_set.total_size == 10 + 20 + 30
+
+    # size is calculated while adding file to the set
+    local_file.unlink()
+    assert file_set.total_size == 10 + 20 + 30
+    assert file_set.copy().total_size == 10 + 20 + 30
+
+    file_set.discard(local_file)
+    assert file_set.total_size == 10 + 20
+
+    file_set.pop()
+    assert file_set.total_size == 10
+
+    file_set.remove(file1)
+    assert file_set.total_size == 0
+
+    file_set = FileSet([file1, file2])
+    file_set.symmetric_difference_update([file2, RemoteFile(path="e", stats=RemotePathStat(st_size=40))])
+    assert file_set.total_size == 10 + 40
+
+    file_set -= {file1}
+    assert file_set.total_size == 40
+
+    file_set.clear()
+    assert file_set.total_size == 0
+
+
 def test_file_set_details():
     path1 = RemoteFile(path="a/b/c", stats=RemotePathStat(st_size=10, st_mtime=50))
     path2 = "a/b/c/f"
@@ -94,6 +128,29 @@ def test_file_set_details():
     assert empty_file_set.details == empty_file_set.summary == str(empty_file_set) == "No files"
 
 
+def test_file_set_details_max_files():
+    file_set = FileSet(RemoteFile(path=f"file{i}", stats=RemotePathStat(st_size=10)) for i in range(4))
+
+    details = """
+        4 files (size='40 Bytes'):
+            'file0' (size='10 Bytes')
+            'file1' (size='10 Bytes')
+            ... and 2 more files
+    """
+    assert file_set._details(max_files=2) == textwrap.dedent(details).strip()
+
+    details = """
+        4 files (size='40 Bytes'):
+            'file0' (size='10 Bytes')
+            'file1' (size='10 Bytes')
+            'file2' (size='10 Bytes')
+            ... and 1 more file
+    """
+    assert file_set._details(max_files=3) == textwrap.dedent(details).strip()
+
+    assert file_set._details(max_files=4) == file_set._details() == file_set.details
+
+
 def test_file_set_raise_if_empty():
     empty_file_set = FileSet()
 
@@ -1,4 +1,7 @@
+import io
+import json
 import re
+import tarfile
 import textwrap
 
 import pytest
@@ -22,3 +25,56 @@ def test_file_uploader_deprecated_import():
         from onetl.core import FileUploader as OldFileUploader
 
         assert OldFileUploader is FileUploader
+
+
+def test_file_uploader_compression_with_checksum():
+    with pytest.raises(ValueError, match="Options `compression` and `checksum_algorithm` cannot be used together"):
+        FileUploader.Options(checksum_algorithm="md5", compression="gzip")
+
+
+def test_file_uploader_tar_pack(tmp_path):
+    from onetl.file.file_uploader.tar_pack import TarPack
+
+    files = {
+        "file1.txt": b"",
+        "nested/file2.txt": b"a" * 100,
+        "nested/path/" + "long" * 50: b"b" * 1000,
+    }
+    for name, content in files.items():
+        local_file = tmp_path / name
+        local_file.parent.mkdir(parents=True, exist_ok=True)
+        local_file.write_bytes(content)
+
+    # content of linked file is stored instead of the link itself
+    files["link.txt"] = files["nested/file2.txt"]
+    (tmp_path / "link.txt").symlink_to(tmp_path / "nested/file2.txt")
+
+    target = io.BytesIO()
+    with TarPack(target) as tar_pack:
+        for name in files:
+            tar_pack.add(tmp_path / name, name)
+
+    archive = target.getvalue()
+    manifest = [json.loads(line) for line in tar_pack.manifest().decode("utf-8").splitlines()]
+    assert [entry["name"] for entry in manifest] == list(files)
+
+    # content can be read from archive using offsets from manifest
+    for entry in manifest:
+        assert archive[entry["offset"] : entry["offset"] + entry["size"]] == files[entry["name"]]
+
+    # and archive can be unpacked as usual
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        assert tar.getnames() == list(files)
+        assert all(member.isfile() for member in tar.getmembers())
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"checksum_algorithm": "md5"}, "Options `pack_size` and `checksum_algorithm` cannot be used together"),
+        ({"compression": "gzip"}, "Options `pack_size` and `compression` cannot be used together"),
+    ],
+)
+def test_file_uploader_pack_size_wrong_options(options, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        FileUploader.Options(pack_size="1MiB", **options)
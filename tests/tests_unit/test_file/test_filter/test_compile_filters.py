@@ -0,0 +1,81 @@
+import re
+
+import pytest
+
+from onetl.file.filter import ExcludeDir, Glob, Regexp, compile_filters
+from onetl.file.filter.compile_filters import CompiledExcludeDirs, CompiledPatterns
+from onetl.impl import RemoteDirectory, RemoteFile, RemotePathStat
+
+
+def test_compile_filters_single_filter_is_not_changed():
+    filters = [ExcludeDir("/exclude1"), Glob("*.csv")]
+
+    assert compile_filters(filters) == filters
+    assert compile_filters([]) == []
+
+
+def test_compile_filters_merged():
+    glob = Glob("*.csv")
+    regexp = Regexp(r"\d+")
+    exclude_dir1 = ExcludeDir("/exclude1")
+    exclude_dir2 = ExcludeDir("exclude2")
+    other = Regexp("(?P<name>abc)")
+
+    compiled = compile_filters([glob, exclude_dir1, other, regexp, exclude_dir2])
+    assert len(compiled) == 3
+
+    assert isinstance(compiled[0], CompiledExcludeDirs)
+    assert compiled[0].filters == [exclude_dir1, exclude_dir2]
+    assert repr(compiled[0]) == "ExcludeDir('/exclude1') & ExcludeDir('exclude2')"
+
+    assert isinstance(compiled[1], CompiledPatterns)
+    assert compiled[1].filters == [glob, regexp]
+
+    # regexp with named group cannot be merged with others
+    assert compiled[2] is other
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        RemoteFile(path="/file1.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="/some/file2.csv", stats=RemotePathStat(st_size=20 * 1024, st_mtime=50)),
+        RemoteFile(path="/some/file2.txt", stats=RemotePathStat(st_size=30 * 1024, st_mtime=50)),
+        RemoteFile(path="/some/other.csv", stats=RemotePathStat(st_size=30 * 1024, st_mtime=50)),
+        RemoteFile(path="/some*/nested/file3.CSV", stats=RemotePathStat(st_size=40 * 1024, st_mtime=50)),
+        RemoteFile(path="/data/file4/some.csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteFile(path="/data/2023/file5.csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteFile(path="/exclude1/file6.csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteFile(path="/exclude2/nested/file7.csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteFile(path="exclude2/file8.csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteFile(path="file[9].csv", stats=RemotePathStat(st_size=50 * 1024, st_mtime=50)),
+        RemoteDirectory("/"),
+        RemoteDirectory("/exclude1"),
+        RemoteDirectory("/exclude1/nested"),
+        RemoteDirectory("/exclude2"),
+        RemoteDirectory("/data/file"),
+        RemoteDirectory("exclude2"),
+    ],
+)
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [Glob("*.csv"), Glob("file*")],
+        [Glob("/data/*/*.csv"), Glob("*/file?.csv")],
+        [Glob("file[0-9].*"), Glob("[!o]*"), Regexp(r"\.csv$")],
+        [Regexp("^/some"), Regexp(re.compile("FILE", re.IGNORECASE | re.MULTILINE)), Glob("*.[cC][sS][vV]")],
+        [Regexp(re.compile(r"file \d  # file number", re.VERBOSE)), Regexp("[0-9]")],
+        [ExcludeDir("/exclude1"), ExcludeDir("exclude2"), ExcludeDir("/data/file4")],
+        [ExcludeDir("/exclude1"), ExcludeDir("/exclude1/nested"), Glob("*.csv"), Regexp("file")],
+    ],
+)
+def test_compile_filters_match(filters, path):
+    compiled = compile_filters(filters)
+    assert len(compiled) < len(filters)
+
+    expected = all(file_filter.match(path) for file_filter in filters)
+    assert all(file_filter.match(path) for file_filter in compiled) == expected
+
+    if path.is_dir():
+        expected = all(file_filter.match_dir_prefix(path) for file_filter in filters)
+        assert all(file_filter.match_dir_prefix(path) for file_filter in compiled) == expected
@@ -42,3 +42,20 @@ def test_exclude_dir_match_absolute(matched, path):
     file_filter = ExcludeDir("/exclude1")
 
     assert file_filter.match(path) == matched
+
+
+@pytest.mark.parametrize(
+    "matched, path",
+    [
+        (True, RemoteDirectory("/")),
+        (True, RemoteDirectory("/some")),
+        (True, RemoteDirectory("/exclude2")),
+        (False, RemoteDirectory("/exclude1")),
+        (False, RemoteDirectory("/exclude1/nested")),
+        (True, RemoteDirectory("exclude1")),
+    ],
+)
+def test_exclude_dir_match_dir_prefix(matched, path):
+    file_filter = ExcludeDir("/exclude1")
+
+    assert file_filter.match_dir_prefix(path) == matched
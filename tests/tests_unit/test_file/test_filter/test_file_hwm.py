@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+from etl_entities import FileListHWM, RemoteFolder
+
+from onetl.file.filter import FileHWMFilter
+from onetl.impl import RemoteDirectory, RemoteFile, RemotePathStat
+
+
+def test_file_hwm_filter_file_list():
+    hwm = FileListHWM(
+        source=RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21"),
+        value=["some/file1.csv", "file2.csv"],
+    )
+    file_filter = FileHWMFilter(hwm=hwm)
+
+    paths = [
+        RemoteFile(path="/absolute/path/some/file1.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="/absolute/path/file2.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="some/file1.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="/absolute/path/file1.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="/absolute/pathfile2.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="/another/path/file2.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+        RemoteFile(path="file3.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50)),
+    ]
+    assert [file_filter.match(path) for path in paths] == [False, False, False, True, True, True, True]
+    assert [file_filter.match(path) for path in paths] == [not hwm.covers(path) for path in paths]
+
+    assert file_filter.match(RemoteDirectory("/absolute/path/some"))
+
+    # HWM value is changed after filter is created
+    hwm.update("file3.csv")
+    assert not file_filter.match(paths[-1])
+
+
+def test_file_hwm_filter_file_list_min_modified_time():
+    hwm = FileListHWM(
+        source=RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21"),
+        value=["old.csv", "new.csv", "missing.csv"],
+    )
+    file_filter = FileHWMFilter(hwm=hwm, min_modified_time=datetime.fromtimestamp(100, tz=timezone.utc))
+
+    # not in HWM, but too old
+    assert not file_filter.match(RemoteFile(path="/absolute/path/other_old.csv", stats=RemotePathStat(st_mtime=50)))
+    # not in HWM, modification time is unknown
+    assert file_filter.match(RemoteFile(path="/absolute/path/unknown.csv", stats=RemotePathStat()))
+    assert file_filter.match(RemoteFile(path="/absolute/path/other_new.csv", stats=RemotePathStat(st_mtime=150)))
+    assert not file_filter.match(RemoteFile(path="/absolute/path/old.csv", stats=RemotePathStat(st_mtime=50)))
+    assert not file_filter.match(RemoteFile(path="/absolute/path/new.csv", stats=RemotePathStat(st_mtime=150)))
+
+    assert file_filter.listed_paths == {"new.csv"}
+    assert file_filter.expired_paths == {"old.csv"}
@@ -28,3 +28,21 @@ def test_glob_match(matched, path):
     file_filter = Glob("*.csv")
 
     assert file_filter.match(path) == matched
+
+
+@pytest.mark.parametrize(
+    "pattern, matched, path",
+    [
+        ("*.csv", True, RemoteDirectory("/")),
+        ("*.csv", True, RemoteDirectory("/some/nested")),
+        ("/data/*/file*.csv", True, RemoteDirectory("/")),
+        ("/data/*/file*.csv", True, RemoteDirectory("/data")),
+        ("/data/*/file*.csv", True, RemoteDirectory("/data/2023")),
+        ("/data/*/file*.csv", False, RemoteDirectory("/other")),
+        ("/data/*/file*.csv", False, RemoteDirectory("/data/2023/nested")),
+    ],
+)
+def test_glob_match_dir_prefix(pattern, matched, path):
+    file_filter = Glob(pattern)
+
+    assert file_filter.match_dir_prefix(path) == matched
@@ -0,0 +1,63 @@
+import pytest
+
+from onetl.file.limit import MaxFilesSize
+from onetl.impl import RemoteDirectory, RemoteFile, RemotePathStat
+
+
+def test_max_files_size():
+    limit = MaxFilesSize("50KiB")
+    assert not limit.is_reached
+
+    directory = RemoteDirectory("some", stats=RemotePathStat(st_size=100 * 1024))
+    file1 = RemoteFile(path="file1.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50))
+    file2 = RemoteFile(path="file2.csv", stats=RemotePathStat(st_size=10 * 1024, st_mtime=50))
+    file3 = RemoteFile(path="nested/file3.csv", stats=RemotePathStat(st_size=40 * 1024, st_mtime=50))
+    file4 = RemoteFile(path="nested/file4.csv", stats=RemotePathStat(st_size=1, st_mtime=50))
+
+    assert not limit.stops_at(file1)
+    assert not limit.is_reached
+
+    assert not limit.stops_at(file2)
+    assert not limit.is_reached
+
+    # directories are not checked by limit
+    assert not limit.stops_at(directory)
+    assert not limit.is_reached
+
+    # limit is reached on file which total size exceeds the limit - all check are True, input does not matter
+    assert limit.stops_at(file3)
+    assert limit.is_reached
+
+    assert limit.stops_at(file4)
+    assert limit.is_reached
+
+    assert limit.stops_at(directory)
+    assert limit.is_reached
+
+    # reset internal state
+    limit.reset()
+
+    assert not limit.stops_at(file1)
+    assert not limit.is_reached
+
+    # file larger than the limit reaches it immediately
+    assert limit.stops_at(RemoteFile(path="large.csv", stats=RemotePathStat(st_size=100 * 1024, st_mtime=50)))
+    assert limit.is_reached
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1024, 1024),
+        ("1024", 1024),
+        ("1KiB", 1024),
+        ("1kb", 1000),
+        ("10 MiB", 10 * 1024 * 1024),
+    ],
+)
+def test_max_files_size_parse(value, expected):
+    assert MaxFilesSize(value).limit == expected
+
+
+def test_max_files_size_repr():
+    assert repr(MaxFilesSize("1KiB")) == "MaxFilesSize('1.0KiB')"
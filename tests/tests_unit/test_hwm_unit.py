@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+import pytest
+from etl_entities import HWMTypeRegistry, RemoteFolder
+
+from onetl.hwm import FileModifiedSinceHWM
+from onetl.hwm.store import HWMClassRegistry
+from onetl.impl import RemoteFile, RemotePath, RemotePathStat
+
+# 2023-08-15T11:22:33+00:00
+MTIME = 1692098553
+
+
+def test_file_modified_since_hwm_registered():
+    assert HWMClassRegistry.get("file_modified_since") is FileModifiedSinceHWM
+    assert HWMTypeRegistry.get("file_modified_since") is FileModifiedSinceHWM
+
+
+def test_file_modified_since_hwm_covers_update():
+    folder = RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21")
+    hwm = FileModifiedSinceHWM(source=folder)
+    assert not hwm
+    assert not hwm.covers(RemoteFile(path="/absolute/path/file1", stats=RemotePathStat(st_mtime=MTIME)))
+
+    hwm.update(
+        [
+            RemoteFile(path="/absolute/path/file1", stats=RemotePathStat(st_mtime=MTIME - 10)),
+            RemoteFile(path="/absolute/path/nested/file2", stats=RemotePathStat(st_mtime=MTIME)),
+            RemoteFile(path="file3", stats=RemotePathStat(st_mtime=MTIME)),
+            # unknown modification time
+            RemoteFile(path="/absolute/path/file4", stats=RemotePathStat()),
+        ],
+    )
+    assert hwm.value == datetime(2023, 8, 15, 11, 22, 33, tzinfo=timezone.utc)
+    assert hwm.boundary_files == {RemotePath("nested/file2"), RemotePath("file3")}
+
+    assert hwm.covers(RemoteFile(path="/absolute/path/file1", stats=RemotePathStat(st_mtime=MTIME - 10)))
+    assert hwm.covers(RemoteFile(path="/absolute/path/nested/file2", stats=RemotePathStat(st_mtime=MTIME)))
+    assert hwm.covers(RemoteFile(path="/absolute/path/file3", stats=RemotePathStat(st_mtime=MTIME)))
+    # created at the same time as the last handled file
+    assert not hwm.covers(RemoteFile(path="/absolute/path/file5", stats=RemotePathStat(st_mtime=MTIME)))
+    # file was changed after it has been handled
+    assert not hwm.covers(RemoteFile(path="/absolute/path/file1", stats=RemotePathStat(st_mtime=MTIME + 10)))
+    assert not hwm.covers(RemoteFile(path="/absolute/path/file4", stats=RemotePathStat()))
+
+    # value cannot decrease
+    hwm.update(RemoteFile(path="/absolute/path/file6", stats=RemotePathStat(st_mtime=MTIME - 20)))
+    assert hwm.value == datetime(2023, 8, 15, 11, 22, 33, tzinfo=timezone.utc)
+
+    # boundary files are reset then value is increased
+    new_hwm = hwm + RemoteFile(path="/absolute/path/file7", stats=RemotePathStat(st_mtime=MTIME + 0.5))
+    assert new_hwm.value == datetime(2023, 8, 15, 11, 22, 33, 500000, tzinfo=timezone.utc)
+    assert new_hwm.boundary_files == {RemotePath("file7")}
+    assert hwm.boundary_files == {RemotePath("nested/file2"), RemotePath("file3")}
+
+
+def test_file_modified_since_hwm_serialization():
+    folder = RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21")
+    hwm = FileModifiedSinceHWM(
+        source=folder,
+        value=datetime(2023, 8, 15, 11, 22, 33, tzinfo=timezone.utc),
+        boundary_files=["/absolute/path/some/file", "another.file"],
+    )
+    assert hwm.serialize_value() == "2023-08-15T11:22:33+00:00"
+
+    serialized = hwm.serialize()
+    assert serialized["type"] == "file_modified_since"
+    assert sorted(serialized["boundary_files"]) == ["another.file", "some/file"]
+    assert HWMTypeRegistry.parse(serialized) == hwm
+
+    assert FileModifiedSinceHWM(source=folder).serialize_value() == "null"
+
+
+def test_file_modified_since_hwm_wrong_boundary_file():
+    folder = RemoteFolder(name="/absolute/path", instance="ftp://ftp.server:21")
+
+    with pytest.raises(ValueError):
+        FileModifiedSinceHWM(source=folder, boundary_files=["/another/path/file"])
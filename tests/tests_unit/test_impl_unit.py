@@ -1,7 +1,10 @@
+import io
 import os
 import stat
 import textwrap
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import PurePosixPath
 from time import time
 
 import pytest
@@ -9,9 +12,15 @@ import pytest
 from onetl.impl import (
     FailedLocalFile,
     FailedRemoteFile,
+    FileChecksum,
+    FileCompression,
     LocalPath,
+    RawRemoteFileReader,
+    RawRemoteFileWriter,
     RemoteDirectory,
     RemoteFile,
+    RemoteFileReader,
+    RemoteFileWriter,
     RemotePath,
     RemotePathStat,
     path_repr,
@@ -22,6 +31,7 @@ from onetl.impl import (
     "path",
     [
         "a/b/c",
+        PurePosixPath("a/b/c"),
         RemotePath("a/b/c"),
     ],
 )
@@ -29,6 +39,7 @@ def test_remote_directory(path):
     remote_directory = RemoteDirectory(path)
 
     assert remote_directory.path == RemotePath(path)
+    assert isinstance(remote_directory.path, RemotePath)
     assert remote_directory.exists()
     assert remote_directory.is_dir()
     assert not remote_directory.is_file()
@@ -45,6 +56,7 @@ def test_remote_directory(path):
     "path",
     [
         "a/b/c",
+        PurePosixPath("a/b/c"),
         RemotePath("a/b/c"),
     ],
 )
@@ -53,6 +65,7 @@ def test_remote_file(path):
     remote_file = RemoteFile(path, stats=file_stat)
 
     assert remote_file.path == RemotePath(path)
+    assert isinstance(remote_file.path, RemotePath)
     assert remote_file.stats == file_stat
 
     assert remote_file.exists()
@@ -463,3 +476,246 @@ def test_path_repr_with_exception(exception, exception_str):
     # no exception - nothing to show
     assert path_repr(file2, with_exception=True).strip() == "'a/b/c' (kind='file', size='56.3 kB')"
     assert path_repr(file2, with_exception=False).strip() == "'a/b/c' (kind='file', size='56.3 kB')"
+
+
+def test_remote_file_reader():
+    content = os.urandom(100)
+    offsets = []
+
+    @contextmanager
+    def open_at(offset):
+        offsets.append(offset)
+        yield io.BytesIO(content[offset:])
+
+    with RemoteFileReader(RawRemoteFileReader(open_at, size=len(content)), buffer_size=10) as file:
+        assert file.seekable()
+        assert file.read(5) == content[:5]
+        assert file.read(10) == content[5:15]
+
+        buffer = bytearray(30)
+        assert file.readinto(buffer) == 30
+        assert buffer == content[15:45]
+
+        # sequential reads are using the same stream
+        assert offsets == [0]
+
+        file.seek(-10, os.SEEK_END)
+        assert file.read() == content[-10:]
+        assert offsets == [0, 90]
+
+        file.seek(0)
+        assert b"".join(file.iter_chunks(7)) == content
+        assert [len(chunk) for chunk in file.iter_chunks(7)] == []
+
+    assert file.closed
+
+
+def test_remote_file_writer():
+    committed = []
+
+    @contextmanager
+    def target():
+        buffer = io.BytesIO()
+        yield buffer
+        committed.append(buffer.getvalue())
+
+    with RemoteFileWriter(RawRemoteFileWriter(target()), buffer_size=10) as file:
+        file.write(b"abc")
+        file.write(b"d" * 100)
+
+    assert committed == [b"abc" + b"d" * 100]
+
+    with pytest.raises(ValueError):
+        with RemoteFileWriter(RawRemoteFileWriter(target()), buffer_size=10) as file:
+            file.write(b"abc")
+            raise ValueError("error")
+
+    # content is not committed on exception
+    assert committed == [b"abc" + b"d" * 100]
+    assert file.closed
+
+
+def test_path_stat_cache(monkeypatch):
+    from onetl.impl import path_stat_cache
+
+    now = 1000.0
+    monkeypatch.setattr(path_stat_cache.time, "monotonic", lambda: now)
+
+    cache = path_stat_cache.PathStatCache(ttl=10)
+    stat = RemotePathStat(st_size=10)
+
+    assert not cache.exists(RemotePath("/a/b"))
+    assert cache.info() == (0, 1, 0)
+
+    cache.update(RemotePath("/a"), is_dir=True)
+    cache.update(RemotePath("/a/b"), is_dir=False)
+    cache.update(RemotePath("/a/b"), stat=stat)
+
+    assert cache.exists(RemotePath("/a/b"))
+    assert cache.get_is_dir(RemotePath("/a/b")) is False
+    assert cache.get_stat(RemotePath("/a/b")) == stat
+    # value is unknown
+    assert cache.get_stat(RemotePath("/a")) is None
+    assert cache.info() == (3, 2, 2)
+
+    now += 10
+    assert not cache.exists(RemotePath("/a/b"))
+    assert cache.info().size == 1
+
+    cache.update(RemotePath("/a/b/c"), is_dir=False)
+    cache.update(RemotePath("/a/d"), is_dir=False)
+    cache.update(RemotePath("/e"), is_dir=False)
+
+    # parent is removed as well
+    cache.invalidate(RemotePath("/a/d"))
+    assert cache.info().size == 2
+    assert not cache.exists(RemotePath("/a"))
+
+    cache.update(RemotePath("/a"), is_dir=True)
+    cache.invalidate(RemotePath("/a"), recursive=True)
+    assert not cache.exists(RemotePath("/a/b/c"))
+    assert cache.exists(RemotePath("/e"))
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0)
+
+
+def test_concurrent_directory_scanner():
+    import threading
+
+    from onetl.impl.directory_scanner import ConcurrentDirectoryScanner
+
+    scanned = []
+    lock = threading.Lock()
+
+    def scan(path):
+        with lock:
+            scanned.append(path)
+        if path.name == "fail":
+            raise FileNotFoundError(path)
+        return [path / "child"]
+
+    scanner = ConcurrentDirectoryScanner(scan, workers=2, prefetch=2)
+    try:
+        # not scheduled directory is listed immediately
+        assert scanner.scan(RemotePath("/a")) == [RemotePath("/a/child")]
+
+        scanner.schedule([RemotePath("/a/b"), RemotePath("/a/c"), RemotePath("/a/d")])
+        assert scanner.scan(RemotePath("/a/b")) == [RemotePath("/a/b/child")]
+
+        # nested directories are listed before siblings of parent
+        scanner.schedule([RemotePath("/a/b/fail")])
+        with pytest.raises(FileNotFoundError):
+            scanner.scan(RemotePath("/a/b/fail"))
+
+        assert scanner.scan(RemotePath("/a/c")) == [RemotePath("/a/c/child")]
+    finally:
+        scanner.close()
+
+    # each directory is listed only once, and "/a/d" is either listed in background or cancelled
+    assert scanned[0] == RemotePath("/a")
+    assert len(scanned) == len(set(scanned))
+    assert set(scanned) - {RemotePath("/a/d")} == {
+        RemotePath("/a"),
+        RemotePath("/a/b"),
+        RemotePath("/a/c"),
+        RemotePath("/a/b/fail"),
+    }
+
+
+@pytest.mark.parametrize(
+    "algorithm,digest",
+    [
+        ("md5", "9e107d9d372bb6826bd81d3542a419d6"),
+        ("sha1", "2fd4e1c67a2d28fced849ee1bb76e7391b93eb12"),
+        ("SHA256", "d7a8fbb307d7809469ca9abcb0082e4f8d5651e46d3cdb762d02d0bf37c9e592"),
+        ("crc32", "414fa339"),
+    ],
+)
+def test_file_checksum(algorithm, digest):
+    content = b"The quick brown fox jumps over the lazy dog"
+
+    checksum = FileChecksum(algorithm)
+    assert checksum.algorithm == algorithm.lower()
+
+    target = io.BytesIO()
+    assert checksum.copy(io.BytesIO(content), target, chunk_size=10) == len(content)
+    assert target.getvalue() == content
+    assert checksum.hexdigest() == digest
+
+
+def test_file_checksum_unsupported_algorithm():
+    with pytest.raises(ValueError, match="Unsupported checksum algorithm 'unknown'"):
+        FileChecksum("unknown")
+
+
+@pytest.mark.parametrize(
+    "compression, extension",
+    [
+        ("gzip", ".gz"),
+        ("bz2", ".bz2"),
+    ],
+)
+def test_file_compression(compression, extension):
+    content = b"The quick brown fox jumps over the lazy dog" * 100
+
+    compression = FileCompression(compression)
+    assert compression.extension == extension
+
+    target = io.BytesIO()
+    with compression.compress(target) as stream:
+        stream.write(content)
+
+    # target is not closed
+    compressed = target.getvalue()
+    assert len(compressed) < len(content)
+
+    with compression.decompress(io.BytesIO(compressed)) as stream:
+        assert stream.read() == content
+
+
+def test_move_file_same_device(tmp_path):
+    from onetl.impl.local_file_copy import is_same_device, move_file
+
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"new content")
+
+    target = tmp_path / "target" / "target.bin"
+    target.parent.mkdir()
+    target.write_bytes(b"old content")
+
+    assert is_same_device(source, target)
+    # path is not created yet
+    assert is_same_device(source, tmp_path / "not" / "exist")
+
+    move_file(source, target)
+    assert not source.exists()
+    assert target.read_bytes() == b"new content"
+
+
+def test_move_file_different_devices(tmp_path, monkeypatch):
+    import errno
+
+    from onetl.impl.local_file_copy import move_file
+
+    replace = os.replace
+
+    def replace_cross_device(source, target):
+        if os.fspath(source).endswith("source.bin"):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return replace(source, target)
+
+    monkeypatch.setattr(os, "replace", replace_cross_device)
+
+    content = os.urandom(1024 * 1024)
+    source = tmp_path / "source.bin"
+    source.write_bytes(content)
+
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"old content")
+
+    move_file(source, target)
+    assert not source.exists()
+    assert target.read_bytes() == content
+    # no temporary files left
+    assert os.listdir(tmp_path) == ["target.bin"]
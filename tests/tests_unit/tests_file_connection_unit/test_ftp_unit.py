@@ -44,3 +44,131 @@ def test_ftp_connection_without_mandatory_args():
 
     with pytest.raises(ValueError):
         FTP()
+
+
+def test_ftp_connection_max_sessions():
+    from onetl.connection import FTP
+
+    assert FTP(host="some_host").max_sessions == 4
+    assert FTP(host="some_host", max_sessions=1).max_sessions == 1
+
+    with pytest.raises(ValueError):
+        FTP(host="some_host", max_sessions=0)
+
+
+def test_ftp_session_pool_reuses_sessions():
+    from unittest.mock import Mock
+
+    from onetl.connection.file_connection.ftp import FTPSessionPool
+
+    factory = Mock(side_effect=lambda: Mock())
+    pool = FTPSessionPool(factory, max_size=2)
+
+    with pool.borrow() as session1:
+        with pool.borrow() as session2:
+            assert session1 is not session2
+
+    with pool.borrow() as session3:
+        assert session3 in {session1, session2}
+
+    assert factory.call_count == 2
+    assert pool.size == 2
+
+    pool.close()
+    assert pool.size == 0
+    session1.quit.assert_called_once()
+    session2.quit.assert_called_once()
+
+    with pytest.raises(RuntimeError):
+        with pool.borrow():
+            pass
+
+
+def test_ftp_session_pool_drops_broken_session():
+    from unittest.mock import Mock
+
+    from onetl.connection.file_connection.ftp import FTPSessionPool
+
+    pool = FTPSessionPool(Mock(side_effect=lambda: Mock()), max_size=1)
+
+    with pytest.raises(EOFError):
+        with pool.borrow() as session:
+            raise EOFError
+
+    session.quit.assert_called_once()
+    assert pool.size == 0
+
+    with pool.borrow() as new_session:
+        assert new_session is not session
+
+
+def test_ftp_session_pool_blocks_if_all_sessions_are_busy():
+    import threading
+    from unittest.mock import Mock
+
+    from onetl.connection.file_connection.ftp import FTPSessionPool
+
+    pool = FTPSessionPool(Mock(side_effect=lambda: Mock()), max_size=1)
+    borrowed = []
+
+    def borrow():
+        with pool.borrow() as session:
+            borrowed.append(session)
+
+    with pool.borrow() as session:
+        thread = threading.Thread(target=borrow)
+        thread.start()
+        thread.join(timeout=0.5)
+        assert thread.is_alive()
+
+    thread.join(timeout=5)
+    assert borrowed == [session]
+
+
+
+@pytest.fixture()
+def ftp_with_dropped_transfer(monkeypatch):
+    import ftplib
+    import io
+    from contextlib import contextmanager
+    from unittest.mock import Mock
+
+    from onetl.connection import FTP
+
+    session = Mock()
+    session.transfercmd.return_value.makefile.side_effect = lambda mode: io.BufferedReader(io.BytesIO(b"content"))
+    session.voidresp.side_effect = ftplib.error_temp("426 Connection closed; transfer aborted")
+
+    @contextmanager
+    def borrow_session(self):
+        yield session
+
+    monkeypatch.setattr(FTP, "borrow_session", borrow_session)
+    return FTP(host="some_host"), session
+
+
+def test_ftp_open_read_closed_before_end_of_file(ftp_with_dropped_transfer):
+    from onetl.impl import RemotePath
+
+    ftp, session = ftp_with_dropped_transfer
+
+    # stream is closed by caller, so transfer is aborted and abort reply is ignored
+    with ftp._open_read(RemotePath("/file"), offset=0) as file:  # noqa: WPS437
+        assert file.read(3) == b"con"
+
+    session.abort.assert_called_once()
+
+
+def test_ftp_open_read_connection_dropped_by_server(ftp_with_dropped_transfer):
+    import ftplib
+
+    from onetl.impl import RemotePath
+
+    ftp, session = ftp_with_dropped_transfer
+
+    # data connection is closed by server, so content could be truncated
+    with pytest.raises(ftplib.error_temp, match="transfer aborted"):
+        with ftp._open_read(RemotePath("/file"), offset=0) as file:  # noqa: WPS437
+            file.read()
+
+    session.abort.assert_not_called()
@@ -0,0 +1,184 @@
+import os
+import socket
+
+import pytest
+
+from onetl.connection import FileConnection
+
+pytestmark = [pytest.mark.local_fs]
+
+
+def test_local_fs_connection():
+    from onetl.connection import LocalFS
+
+    local_fs = LocalFS()
+    assert isinstance(local_fs, FileConnection)
+    assert local_fs.instance_url == f"file://{socket.getfqdn()}"
+
+
+@pytest.mark.parametrize("size", [0, 1, 10 * 1024 * 1024])
+def test_local_fs_copy_file(tmp_path, size):
+    from onetl.connection.file_connection.local_fs import copy_file
+
+    content = os.urandom(size)
+    source = tmp_path / "source.bin"
+    source.write_bytes(content)
+
+    target = tmp_path / "target.bin"
+    target.write_bytes(b"previous content, longer than a new one")
+
+    copy_file(source, target)
+    assert target.read_bytes() == content
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="procfs is not available")
+def test_local_fs_copy_file_zero_size_with_content(tmp_path):
+    from onetl.connection.file_connection.local_fs import copy_file
+
+    # procfs reports zero size for files with content
+    source = "/proc/self/status"
+    assert os.stat(source).st_size == 0
+
+    target = tmp_path / "target.txt"
+    copy_file(source, target)
+    assert target.read_text().startswith("Name:")
+
+
+def test_local_fs_copy_file_range_not_supported(tmp_path, monkeypatch):
+    import errno
+
+    from onetl.connection.file_connection.local_fs import copy_file
+
+    def copy_file_range(*args, **kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", copy_file_range, raising=False)
+
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"content")
+
+    target = tmp_path / "target.bin"
+    copy_file(source, target)
+    assert target.read_bytes() == b"content"
+
+
+def test_local_fs_download_file_checksum_mismatch(tmp_path, monkeypatch):
+    from onetl.connection import LocalFS
+    from onetl.exception import FileChecksumMismatchError
+    from onetl.impl import FileChecksum
+
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"content")
+
+    local_fs = LocalFS()
+
+    checksum = FileChecksum("md5")
+    local_fs.download_file(source, tmp_path / "target.bin", checksum=checksum)
+    assert checksum.hexdigest() == "9a0364b9e99bb480dd25e1f0284c8555"
+
+    monkeypatch.setattr(LocalFS, "_get_checksum", lambda self, path, algorithm: "0" * 32)
+    with pytest.raises(FileChecksumMismatchError):
+        local_fs.download_file(source, tmp_path / "target.bin", checksum=FileChecksum("md5"))
+
+
+def test_local_fs_walk_symlinks(tmp_path):
+    from onetl.connection import LocalFS
+    from onetl.file import FileDownloader
+
+    source = tmp_path / "source"
+    (source / "nested").mkdir(parents=True)
+    (source / "nested" / "file.txt").write_text("content")
+
+    (source / "link_to_file.txt").symlink_to(source / "nested" / "file.txt")
+    (source / "broken_link.txt").symlink_to(source / "missing.txt")
+    # symlink to parent directory could cause infinite loop
+    (source / "nested" / "link_to_dir").symlink_to(source, target_is_directory=True)
+
+    local_fs = LocalFS()
+    assert {entry.name for entry in local_fs.list_dir(source)} == {"nested", "link_to_file.txt"}
+
+    walked = []
+    for root, _dirs, files in local_fs.walk(source):
+        walked.extend(os.fspath(root / file) for file in files)
+
+    assert sorted(walked) == sorted(
+        [
+            os.fspath(source / "link_to_file.txt"),
+            os.fspath(source / "nested" / "file.txt"),
+        ],
+    )
+
+    downloader = FileDownloader(connection=local_fs, source_path=source, local_path=tmp_path / "local")
+    download_result = downloader.run()
+
+    assert not download_result.failed
+    assert len(download_result.successful) == 2
+    assert (tmp_path / "local" / "link_to_file.txt").read_text() == "content"
+
+
+def test_local_fs_cache_info(tmp_path):
+    from onetl.connection import LocalFS
+
+    file = tmp_path / "file.txt"
+    file.write_text("content")
+
+    local_fs = LocalFS(cache_ttl=60)
+
+    # each lookup is counted once, even if several cache checks are performed inside
+    assert local_fs.is_file(file)
+    assert local_fs.cache_info() == (0, 1, 1)
+
+    assert local_fs.is_file(file)
+    assert not local_fs.is_dir(file)
+    assert local_fs.path_exists(file)
+    assert local_fs.cache_info() == (3, 1, 1)
+
+    assert local_fs.is_dir(tmp_path)
+    assert local_fs.cache_info() == (3, 2, 2)
+
+
+def test_local_fs_to_async_walk_cancelled(tmp_path, monkeypatch):
+    import asyncio
+    import threading
+    import time
+
+    from onetl.connection import LocalFS
+
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "file.txt").write_text("content")
+
+    scan_entries = LocalFS._scan_entries  # noqa: WPS437
+    close = LocalFS.close
+    closed_in = []
+
+    def slow_scan_entries(self, path):
+        time.sleep(0.2)
+        return scan_entries(self, path)
+
+    def tracked_close(self):
+        closed_in.append(threading.current_thread())
+        return close(self)
+
+    monkeypatch.setattr(LocalFS, "_scan_entries", slow_scan_entries)
+    monkeypatch.setattr(LocalFS, "close", tracked_close)
+
+    async def run():
+        async with LocalFS().to_async() as connection:
+
+            async def walk():
+                async for _ in connection.walk(tmp_path):
+                    pass  # noqa: WPS420
+
+            task = asyncio.create_task(walk())
+            await asyncio.sleep(0.05)
+
+            # walking is still in progress in executor
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+
+    # connection used by walk is closed in executor, not in event loop thread
+    assert closed_in
+    assert closed_in[0] is not threading.main_thread()
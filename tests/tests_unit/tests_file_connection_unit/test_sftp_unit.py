@@ -85,3 +85,57 @@ def test_sftp_connection_without_mandatory_args():
 
     with pytest.raises(ValueError):
         SFTP()
+
+
+def test_sftp_connection_cache_ttl():
+    from onetl.connection import SFTP
+
+    sftp = SFTP(host="some_host")
+    assert sftp.cache_ttl is None
+    assert sftp.cache_info() == (0, 0, 0)
+
+    sftp = SFTP(host="some_host", cache_ttl=60)
+    assert sftp.cache_ttl == 60
+    assert sftp.cache_info() == (0, 0, 0)
+
+    with pytest.raises(ValueError):
+        SFTP(host="some_host", cache_ttl=0)
+
+
+def test_sftp_connection_walk_workers():
+    from onetl.connection import SFTP
+
+    sftp = SFTP(host="some_host")
+    assert sftp.walk_workers == 1
+
+    sftp = SFTP(host="some_host", walk_workers=4)
+    assert sftp.walk_workers == 4
+
+    with pytest.raises(ValueError):
+        SFTP(host="some_host", walk_workers=0)
+
+
+def test_sftp_open_read_prefetch():
+    from unittest.mock import MagicMock
+
+    from onetl.connection import SFTP
+    from onetl.impl import RemotePath
+
+    sftp = SFTP(host="some_host")
+    client = MagicMock()
+    client.sock.closed = False
+    sftp._client = client  # noqa: WPS437
+    file = client.open.return_value.__enter__.return_value
+
+    # stream could be read slowly, so file content is not buffered in memory
+    with sftp._open_read(RemotePath("/file"), offset=10):  # noqa: WPS437
+        pass
+
+    file.seek.assert_called_once_with(10)
+    file.prefetch.assert_not_called()
+
+    # file is read completely, e.g. while downloading it
+    with sftp._open_read_all(RemotePath("/file")):  # noqa: WPS437
+        pass
+
+    file.prefetch.assert_called_once_with()
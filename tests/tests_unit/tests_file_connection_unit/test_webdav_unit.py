@@ -1,3 +1,6 @@
+import stat
+from datetime import datetime
+
 import pytest
 
 from onetl.connection import FileConnection
@@ -43,3 +46,92 @@ def test_webdav_connection_without_mandatory_args():
 
     with pytest.raises(ValueError):
         WebDAV()
+
+
+def test_webdav_connection_recursive_listing():
+    from onetl.connection import WebDAV
+
+    webdav = WebDAV(host="some_host", user="some_user", password="pwd")
+    assert not webdav.recursive_listing
+
+    webdav = WebDAV(host="some_host", user="some_user", password="pwd", recursive_listing=True)
+    assert webdav.recursive_listing
+
+
+PROPFIND_RESPONSE = """<?xml version="1.0" encoding="utf-8"?>
+<d:multistatus xmlns:d="DAV:">
+    <d:response>
+        <d:href>{href}</d:href>
+        <d:propstat>
+            <d:prop>
+                <d:resourcetype>{resource_type}</d:resourcetype>
+                <d:getcontentlength>{size}</d:getcontentlength>
+                <d:getlastmodified>Mon, 15 May 2023 10:20:30 GMT</d:getlastmodified>
+            </d:prop>
+            <d:status>HTTP/1.1 200 OK</d:status>
+        </d:propstat>
+    </d:response>
+</d:multistatus>
+"""
+
+
+@pytest.fixture()
+def webdav_with_response():
+    from unittest.mock import Mock
+
+    from onetl.connection import WebDAV
+
+    webdav = WebDAV(host="some_host", user="some_user", password="pwd")
+    request = Mock()
+    webdav.client.session.request = request
+    return webdav, request
+
+
+def test_webdav_get_info_directory(webdav_with_response):
+    from onetl.impl import RemotePath
+
+    webdav, request = webdav_with_response
+    content = PROPFIND_RESPONSE.format(href="/remote/dir/", resource_type="<d:collection/>", size="")
+    request.return_value.status_code = 207
+    request.return_value.content = content.encode("utf-8")
+
+    assert webdav._is_dir(RemotePath("/remote/dir"))  # noqa: WPS437
+    assert not webdav._is_file(RemotePath("/remote/dir"))  # noqa: WPS437
+    assert webdav._get_stat(RemotePath("/remote/dir")).st_mode == stat.S_IFDIR  # noqa: WPS437
+
+    # each call is a single PROPFIND request, without checking if path exists
+    assert request.call_count == 3
+    for call in request.call_args_list:
+        assert call.kwargs["method"] == "PROPFIND"
+        assert call.kwargs["headers"]["Depth"].strip() == "0"
+
+
+def test_webdav_get_info_file(webdav_with_response):
+    from onetl.impl import RemotePath
+
+    webdav, request = webdav_with_response
+    content = PROPFIND_RESPONSE.format(href="/remote/file.txt", resource_type="", size="123")
+    request.return_value.status_code = 207
+    request.return_value.content = content.encode("utf-8")
+
+    assert webdav._is_file(RemotePath("/remote/file.txt"))  # noqa: WPS437
+    assert not webdav._is_dir(RemotePath("/remote/file.txt"))  # noqa: WPS437
+
+    stats = webdav._get_stat(RemotePath("/remote/file.txt"))  # noqa: WPS437
+    assert stats.st_size == 123
+    assert stats.st_mtime == datetime(2023, 5, 15, 10, 20, 30).timestamp()  # noqa: DTZ001
+
+
+def test_webdav_get_info_missing_path(webdav_with_response):
+    from webdav3.exceptions import RemoteResourceNotFound
+
+    from onetl.impl import RemotePath
+
+    webdav, request = webdav_with_response
+    request.return_value.status_code = 404
+
+    with pytest.raises(RemoteResourceNotFound):
+        webdav._get_stat(RemotePath("/remote/missing.txt"))  # noqa: WPS437
+
+    with pytest.raises(RemoteResourceNotFound):
+        webdav._is_dir(RemotePath("/remote/missing.txt"))  # noqa: WPS437
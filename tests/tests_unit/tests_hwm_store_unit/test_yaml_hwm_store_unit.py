@@ -175,3 +175,47 @@ def test_hwm_store_yaml_context_manager_with_encoding(caplog, request, tmp_path_
 )
 def test_hwm_store_yaml_cleanup_file_name(qualified_name, file_name):
     assert YAMLHWMStore.cleanup_file_name(qualified_name) == file_name
+
+
+def test_hwm_store_yaml_compress_file_list(tmp_path_factory):
+    from etl_entities import FileListHWM, RemoteFolder
+
+    hwm = FileListHWM(
+        source=RemoteFolder(name=f"/absolute/{secrets.token_hex(5)}", instance="ftp://ftp.server:21"),
+        value=[f"some/nested/path/file{i}.csv" for i in range(100)] + ["another.file"],
+    )
+
+    plain_store = YAMLHWMStore(path=tmp_path_factory.mktemp("plain"))
+    plain_store.save(hwm)
+
+    store = YAMLHWMStore(path=tmp_path_factory.mktemp("compressed"), compress_file_list=True)
+    store.save(hwm)
+    assert store.get(hwm.qualified_name) == hwm
+
+    content = store.get_file_path(hwm.qualified_name).read_text()
+    assert "prefix_compressed" in content
+    assert "0:another.file" in content
+    assert "21:1.csv" in content
+    assert len(content) < len(plain_store.get_file_path(hwm.qualified_name).read_text())
+
+    # compressed HWM can be read by store without this option, and vice versa
+    assert YAMLHWMStore(path=store.path).get(hwm.qualified_name) == hwm
+    new_hwm = hwm + "new.file"
+    YAMLHWMStore(path=store.path).save(new_hwm)
+    assert store.get(hwm.qualified_name) == new_hwm
+
+
+def test_hwm_store_yaml_compress_file_list_special_symbols(tmp_path_factory):
+    from etl_entities import FileListHWM, RemoteFolder
+
+    # symbols treated as line breaks by str.splitlines()
+    special_symbols = ["\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029"]
+    hwm = FileListHWM(
+        source=RemoteFolder(name=f"/absolute/{secrets.token_hex(5)}", instance="ftp://ftp.server:21"),
+        value=[f"some/path/file{symbol}name.csv" for symbol in special_symbols] + ["some/path/file.csv"],
+    )
+
+    store = YAMLHWMStore(path=tmp_path_factory.mktemp("compressed"), compress_file_list=True)
+    store.save(hwm)
+    assert store.get(hwm.qualified_name) == hwm
+    assert YAMLHWMStore(path=store.path).get(hwm.qualified_name) == hwm